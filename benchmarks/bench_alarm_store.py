@@ -0,0 +1,92 @@
+"""
+Alarm Query Benchmark
+
+Builds an AlarmStore over a synthetic alarm set (1M alarms by default) and
+times representative filter_paginate_alarm queries.
+
+Usage:
+    uv run python benchmarks/bench_alarm_store.py [count]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from versa_mcp.mocks.alarm_store import AlarmStore
+
+SEVERITIES = ["CRITICAL", "MAJOR", "MINOR", "WARNING"]
+TYPES = ["LINK_DOWN", "DEVICE_UNREACHABLE", "HIGH_CPU", "BGP_DOWN", "CERT_EXPIRY"]
+REPEAT = 50
+
+
+def synthetic_alarms(count: int, seed: int = 7) -> list[dict]:
+    """Compact alarms carrying only the fields the store indexes."""
+    rng = random.Random(seed)
+    orgs = [f"Org-{i:02d}" for i in range(20)]
+    devices = [f"Branch-{i:05d}" for i in range(5000)]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    alarms = []
+    for i in range(count):
+        when = start + timedelta(seconds=rng.randrange(90 * 86400))
+        alarms.append(
+            {
+                "alarmId": f"alm-{i}",
+                "org": rng.choice(orgs),
+                "deviceName": rng.choice(devices),
+                "severity": rng.choice(SEVERITIES),
+                "type": rng.choice(TYPES),
+                "isCleared": rng.random() < 0.3,
+                "raisedTime": when.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+        )
+    return alarms
+
+
+QUERIES = {
+    "newest page": {"limit": "50"},
+    "deep page": {"limit": "50", "offset": "400000"},
+    "by device": {"device_name": "Branch-00042", "limit": "50"},
+    "org + severity": {
+        "org": "Org-03",
+        "last_perceived_severity": "CRITICAL",
+        "limit": "50",
+    },
+    "time window": {
+        "last_change_after": "2026-02-01T00:00:00Z",
+        "last_change_before": "2026-02-02T00:00:00Z",
+        "limit": "50",
+    },
+    "device by severity": {
+        "device_name": "Branch-00042",
+        "sort_column": "severity",
+        "limit": "20",
+    },
+}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    alarms = synthetic_alarms(count)
+
+    start = time.perf_counter()
+    store = AlarmStore(alarms)
+    print(f"indexed {count} alarms in {time.perf_counter() - start:.2f}s")
+
+    print(f"  {'query':20s} {'first':>10s} {'repeat':>10s}")
+    for name, params in QUERIES.items():
+        start = time.perf_counter()
+        total, page = store.query(params)
+        first = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            store.query(params)
+        repeat = (time.perf_counter() - start) / REPEAT * 1000
+        print(
+            f"  {name:20s} {first:8.3f}ms {repeat:8.3f}ms"
+            f"  total={total} page={len(page)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
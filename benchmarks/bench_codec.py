@@ -0,0 +1,74 @@
+"""
+Fast Codec Benchmark
+
+Times the round trip of each endpoint's mock body from bytes to validated
+objects and back to JSON, through the pydantic path (json.loads, validate,
+dump) and through the msgspec structs of codec.py (decode, encode), and
+the parse and check alone as RESPONSE_CODEC=msgspec validation does it
+(codec.parse). See bench_response_path.py for the whole response path.
+
+Usage:
+    uv run --extra fast python benchmarks/bench_codec.py [pattern-substring]
+"""
+
+import json
+import sys
+import timeit
+
+from versa_mcp import codec
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK
+from versa_mcp.validation import ENDPOINT_MODELS, response_adapter
+
+MIN_SECONDS = 0.02
+
+
+def per_call_us(fn) -> float:
+    """Mean time per call over enough calls to take MIN_SECONDS."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while (total := timer.timeit(number)) < MIN_SECONDS:
+        number *= 2
+    return total / number * 1e6
+
+
+def main() -> None:
+    if not codec.available():
+        sys.exit("msgspec is not installed: install the fast extra")
+    only = sys.argv[1] if len(sys.argv) > 1 else ""
+    print(
+        f"{'model':34} {'bytes':>8} {'pydantic us':>12} {'msgspec us':>11}"
+        f" {'check us':>9} {'fast check us':>14}"
+    )
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for pattern, model in ENDPOINT_MODELS.items():
+        if only not in pattern:
+            continue
+        raw = (MOCKS_DIR / ENDPOINT_TO_MOCK[pattern]).read_bytes()
+        adapter = response_adapter(model)
+
+        def pydantic_path():
+            validated = adapter.validate_python(json.loads(raw))
+            return validated.model_dump_json(by_alias=True, exclude_unset=True)
+
+        costs = [
+            per_call_us(pydantic_path),
+            per_call_us(lambda: codec.encode(codec.decode(raw, model))),
+            per_call_us(lambda: adapter.validate_python(json.loads(raw))),
+            per_call_us(lambda: codec.parse(raw, model)),
+        ]
+        totals = [total + cost for total, cost in zip(totals, costs)]
+        print(
+            f"{model.__name__:34} {len(raw):8d} {costs[0]:12.1f} {costs[1]:11.1f}"
+            f" {costs[2]:9.1f} {costs[3]:14.1f}"
+        )
+
+    print(
+        f"total: round trip {totals[0]:.0f} us pydantic, {totals[1]:.0f} us msgspec"
+        f" ({totals[0] / totals[1]:.1f}x); check {totals[2]:.0f} us pydantic,"
+        f" {totals[3]:.0f} us msgspec ({totals[2] / totals[3]:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Director Client Benchmark
+
+Calls every tool against a local TLS stand-in Director (serving the mock
+corpus) and counts the TLS connections the stand-in accepts, comparing a
+fresh client per tool call (the naive port of the old per-call pattern)
+against one pooled DirectorClient, sequentially and with all tools in
+flight at once. The stand-in speaks HTTP/1.1, so HTTP/2 is not exercised.
+
+Needs httpx and the openssl command (for a throwaway self-signed cert).
+
+Usage:
+    uv run python benchmarks/bench_director_client.py [rounds]
+"""
+
+import inspect
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import cast
+from urllib.parse import parse_qsl, urlparse
+
+import anyio
+
+from versa_mcp import server
+from versa_mcp.backend import open_backend
+from versa_mcp.director_client import DirectorClient
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+
+# Placeholder for required path params; unknown IDs answer 404, which costs
+# the same round trip as a hit
+PLACEHOLDER = "bench"
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: "TLSStandIn"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        data, status, raw = self.server.mock._load_mock(
+            url.path, dict(parse_qsl(url.query))
+        )
+        body = MockResponse(data, status_code=status, raw=raw).content
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TLSStandIn(ThreadingHTTPServer):
+    """Threaded HTTPS server that counts accepted connections."""
+
+    daemon_threads = True
+
+    def __init__(self, context: ssl.SSLContext):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.context = context
+        self.mock = MockAsyncClient()
+        self.connections = 0
+
+    def finish_request(self, request, client_address):
+        # Handshake in the worker thread so slow handshakes do not block accept
+        self.connections += 1
+        try:
+            request = self.context.wrap_socket(
+                cast(socket.socket, request), server_side=True
+            )
+        except (ssl.SSLError, OSError):
+            return
+        super().finish_request(request, client_address)
+
+
+def self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def tool_calls() -> list:
+    """Every tool with placeholder values for its required arguments."""
+    calls = []
+    for name, tool in vars(server).items():
+        if name == "lifespan" or not inspect.iscoroutinefunction(tool):
+            continue
+        if tool.__module__ != server.__name__:
+            continue
+        required = {
+            p.name: PLACEHOLDER
+            for p in inspect.signature(tool).parameters.values()
+            if p.default is inspect.Parameter.empty
+        }
+        calls.append((tool, required))
+    return calls
+
+
+async def per_call(url: str, verify: ssl.SSLContext, calls, rounds: int) -> None:
+    for _ in range(rounds):
+        for tool, kwargs in calls:
+            async with open_backend(DirectorClient(url, verify=verify)):
+                await tool(**kwargs)
+
+
+async def pooled(url: str, verify: ssl.SSLContext, calls, rounds: int) -> None:
+    async with open_backend(DirectorClient(url, verify=verify)):
+        for _ in range(rounds):
+            for tool, kwargs in calls:
+                await tool(**kwargs)
+
+
+async def pooled_concurrent(
+    url: str, verify: ssl.SSLContext, calls, rounds: int
+) -> None:
+    async with open_backend(DirectorClient(url, verify=verify)):
+        for _ in range(rounds):
+            async with anyio.create_task_group() as tg:
+                for tool, kwargs in calls:
+                    tg.start_soon(lambda t=tool, k=kwargs: t(**k))
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    calls = tool_calls()
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = self_signed_cert(Path(tmp))
+        server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_context.load_cert_chain(cert, key)
+        client_context = ssl.create_default_context(cafile=str(cert))
+
+        print(f"{len(calls)} tools x {rounds} rounds over TLS")
+        for label, run in (
+            ("per-call client", per_call),
+            ("pooled", pooled),
+            ("pooled, concurrent", pooled_concurrent),
+        ):
+            stand_in = TLSStandIn(server_context)
+            threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+            url = f"https://127.0.0.1:{stand_in.server_address[1]}"
+            start = time.perf_counter()
+            anyio.run(run, url, client_context, calls, rounds)
+            elapsed = time.perf_counter() - start
+            stand_in.shutdown()
+            stand_in.server_close()
+            print(
+                f"  {label:20s} {stand_in.connections:5d} connections "
+                f"{elapsed:7.2f}s {elapsed / (len(calls) * rounds) * 1000:7.2f} ms/call"
+            )
+
+
+if __name__ == "__main__":
+    main()
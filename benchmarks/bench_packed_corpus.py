@@ -0,0 +1,89 @@
+"""
+Packed Corpus Benchmark
+
+Compares loading a corpus directory with MockCorpus against mapping the
+same corpus as a pack file: startup time, time to serve one page of
+get_all_appliance_status, and peak RSS. Each mode runs in a fresh process.
+
+Usage:
+    uv run python -m versa_mcp.mocks.generator /tmp/fleet-100k --appliances 100000
+    uv run python benchmarks/bench_packed_corpus.py /tmp/fleet-100k
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from versa_mcp.mocks.packed import pack_corpus
+
+STATUS_FILE = "appliance/get_all_appliance_status.json"
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process (ru_maxrss survives exec, VmHWM does not)."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def run(mode: str, target: str) -> dict:
+    """Measure one corpus mode in this process."""
+    from versa_mcp.mocks.corpus import MockCorpus
+    from versa_mcp.mocks.packed import PackedCorpus
+    from versa_mcp.mocks.pagination import paginate_entry
+
+    start = time.perf_counter()
+    corpus = PackedCorpus(target) if mode == "packed" else MockCorpus(Path(target))
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    entry = corpus.entry(STATUS_FILE)
+    assert entry is not None
+    page = paginate_entry(entry, {"limit": "50", "offset": "1000"})
+    first_page = time.perf_counter() - start
+    assert page is not None
+
+    return {
+        "mode": mode,
+        "startup_s": round(startup, 4),
+        "first_page_ms": round(first_page * 1000, 3),
+        "page_size": len(page["appliances"]),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        print(json.dumps(run(sys.argv[2], sys.argv[3])))
+        return
+
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    if source is None:
+        from versa_mcp.mocks.corpus import MOCKS_DIR
+
+        source = str(MOCKS_DIR)
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = Path(tmp) / "corpus.pack"
+        start = time.perf_counter()
+        stats = pack_corpus(Path(source), pack_path)
+        print(f"packed {stats} in {time.perf_counter() - start:.2f}s")
+        for mode, target in (("json", source), ("packed", str(pack_path))):
+            result = subprocess.run(
+                [sys.executable, __file__, "--run", mode, target],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            print(result.stdout.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Response Path Benchmark
+
+Times what a tool call spends on each endpoint's response between the
+client and the tool: ValidatingBackend.get and the tool's response.json(),
+over a client that, like httpx, hands back the body as bytes and parses it
+on json(). Compares no validation, RESPONSE_CODEC=pydantic and
+RESPONSE_CODEC=msgspec, at each mock body's own size and with its record
+lists grown 100x.
+
+Usage:
+    uv run --extra fast python benchmarks/bench_response_path.py [pattern-substring]
+"""
+
+import json
+import sys
+import time
+
+import anyio
+
+from versa_mcp import codec
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK
+from versa_mcp.validation import ENDPOINT_MODELS, ValidatingBackend
+
+BASE_URL = "https://director.bench"
+SCALES = (1, 100)
+MIN_SECONDS = 0.02
+# Placeholder for path params; every pattern still matches its own body
+PLACEHOLDER = "bench"
+
+
+class BytesResponse:
+    """A 200 response holding raw JSON bytes, parsed on json() like httpx."""
+
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class BytesBackend:
+    """Client answering every GET with the same bytes."""
+
+    def __init__(self, content: bytes):
+        self.response = BytesResponse(content)
+
+    async def get(self, url, headers=None, params=None):
+        return self.response
+
+
+def grown(raw: bytes, factor: int) -> bytes:
+    """raw with every top-level list repeated factor times."""
+    body = json.loads(raw)
+    if factor == 1 or not isinstance(body, dict):
+        return raw
+    return json.dumps(
+        {k: v * factor if isinstance(v, list) else v for k, v in body.items()}
+    ).encode()
+
+
+async def per_call_us(backend, url: str) -> float:
+    """Mean time per get and json() over enough calls to take MIN_SECONDS."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            (await backend.get(url)).json()
+        total = time.perf_counter() - start
+        if total >= MIN_SECONDS:
+            return total / number * 1e6
+        number *= 2
+
+
+async def main() -> None:
+    if not codec.available():
+        sys.exit("msgspec is not installed: install the fast extra")
+    only = sys.argv[1] if len(sys.argv) > 1 else ""
+    print(
+        f"{'model':34} {'scale':>5} {'bytes':>9} {'off us':>9} {'pydantic us':>12}"
+        f" {'msgspec us':>11}"
+    )
+    totals = {factor: [0.0, 0.0, 0.0] for factor in SCALES}
+    for pattern, model in ENDPOINT_MODELS.items():
+        if only not in pattern:
+            continue
+        url = BASE_URL + "/".join(
+            PLACEHOLDER if part.startswith("{") else part for part in pattern.split("/")
+        )
+        raw = (MOCKS_DIR / ENDPOINT_TO_MOCK[pattern]).read_bytes()
+        for factor in SCALES:
+            content = grown(raw, factor)
+            client = BytesBackend(content)
+            costs = [
+                await per_call_us(client, url),
+                await per_call_us(ValidatingBackend(client), url),
+                await per_call_us(ValidatingBackend(client, fast=True), url),
+            ]
+            totals[factor] = [t + c for t, c in zip(totals[factor], costs)]
+            print(
+                f"{model.__name__:34} {factor:5d} {len(content):9d} {costs[0]:9.1f}"
+                f" {costs[1]:12.1f} {costs[2]:11.1f}"
+            )
+
+    for factor, (off, pydantic, msgspec) in totals.items():
+        print(
+            f"total at {factor}x: off {off:.0f} us, pydantic {pydantic:.0f} us,"
+            f" msgspec {msgspec:.0f} us ({pydantic / msgspec:.1f}x faster than"
+            f" pydantic, {msgspec / off:.2f}x the cost of no validation)"
+        )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
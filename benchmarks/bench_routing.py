@@ -0,0 +1,75 @@
+"""
+Routing Microbenchmark
+
+Times endpoint resolution for every pattern in ENDPOINT_TO_MOCK plus an
+unmatched path, comparing the compiled Router against the previous
+sort-and-regex-per-call implementation. Also rebuilds the router with a
+synthetic endpoint map 10x and 50x larger to show per-call cost stays flat.
+
+Usage:
+    uv run python benchmarks/bench_routing.py
+"""
+
+import re
+import timeit
+
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK, Router
+
+UNMATCHED = "/vnms/does/not/exist"
+NUMBER = 2000
+
+
+def legacy_resolve(endpoint: str, patterns_map: dict[str, str]):
+    """Previous per-call behaviour: sort, compile and match on every lookup."""
+    if endpoint in patterns_map:
+        return endpoint, {}
+    patterns = sorted(patterns_map.keys(), key=lambda x: -x.count("/"))
+    for pattern in patterns:
+        regex_pattern = re.sub(r"\{[^}]+\}", r"[^/]+", pattern)
+        if re.match(f"^{regex_pattern}$", endpoint):
+            names = re.findall(r"\{([^}]+)\}", pattern)
+            named = pattern
+            for name in names:
+                named = named.replace(f"{{{name}}}", f"(?P<{name}>[^/]+)")
+            match = re.match(f"^{named}$", endpoint)
+            return pattern, match.groupdict() if match else {}
+    return None
+
+
+def sample_paths(patterns) -> list[str]:
+    """One concrete path per pattern, plus the unmatched path."""
+    paths = [re.sub(r"\{[^}]+\}", "dc-east-001", p) for p in patterns]
+    paths.append(UNMATCHED)
+    return paths
+
+
+def synthetic_map(factor: int) -> dict[str, str]:
+    """Endpoint map grown by copying every pattern under extra prefixes."""
+    grown = dict(ENDPOINT_TO_MOCK)
+    for i in range(1, factor):
+        for pattern, mock_file in ENDPOINT_TO_MOCK.items():
+            grown[f"/ext{i}{pattern}"] = mock_file
+    return grown
+
+
+def per_call_ns(fn, paths: list[str]) -> float:
+    total = timeit.timeit(lambda: [fn(p) for p in paths], number=NUMBER)
+    return total / (NUMBER * len(paths)) * 1e9
+
+
+def main() -> None:
+    paths = sample_paths(ENDPOINT_TO_MOCK)
+    router = Router(ENDPOINT_TO_MOCK)
+    print(f"{len(ENDPOINT_TO_MOCK)} routes + 1 unmatched path")
+    print(f"  legacy   {per_call_ns(lambda p: legacy_resolve(p, ENDPOINT_TO_MOCK), paths):10.0f} ns/call")
+    print(f"  router   {per_call_ns(router.match, paths):10.0f} ns/call")
+    print(f"  unmatched {per_call_ns(router.match, [UNMATCHED]):9.0f} ns/call")
+
+    for factor in (10, 50):
+        grown = synthetic_map(factor)
+        grown_router = Router(grown)
+        print(f"{len(grown)} routes: router {per_call_ns(grown_router.match, paths):10.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
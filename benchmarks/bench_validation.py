@@ -0,0 +1,95 @@
+"""
+Response Validation Benchmark
+
+Times validating each endpoint's mock body against its response model in
+ENDPOINT_MODELS, at the body's own size and with its record lists grown
+100x and 1000x. Also shows the cost of building a TypeAdapter per call
+instead of reusing response_adapter's, and of FastMCP serializing the body
+through the model, which it does on every tool call.
+
+Usage:
+    uv run python benchmarks/bench_validation.py [pattern-substring]
+"""
+
+import json
+import sys
+import timeit
+import warnings
+
+from pydantic import TypeAdapter
+
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK
+from versa_mcp.validation import ENDPOINT_MODELS, response_adapter
+
+SCALES = (1, 100, 1000)
+MIN_SECONDS = 0.02
+
+
+def grown(body, factor: int):
+    """body with every top-level list repeated factor times."""
+    if not isinstance(body, dict):
+        return body
+    return {
+        key: value * factor if isinstance(value, list) else value
+        for key, value in body.items()
+    }
+
+
+def per_call_us(fn) -> float:
+    """Mean time per call over enough calls to take MIN_SECONDS."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while (total := timer.timeit(number)) < MIN_SECONDS:
+        number *= 2
+    return total / number * 1e6
+
+
+def main() -> None:
+    only = sys.argv[1] if len(sys.argv) > 1 else ""
+    print(
+        f"{'model':34} {'bytes':>8} {'1x us':>9} {'100x us':>10} {'1000x us':>11}"
+        f" {'build us':>9} {'dump us':>9}"
+    )
+    totals = {"validate": 0.0, "build": 0.0, "dump": 0.0}
+    for pattern, model in ENDPOINT_MODELS.items():
+        if only not in pattern:
+            continue
+        with open(MOCKS_DIR / ENDPOINT_TO_MOCK[pattern]) as f:
+            body = json.load(f)
+        adapter = response_adapter(model)
+        scalable = isinstance(body, dict) and any(
+            isinstance(v, list) and v for v in body.values()
+        )
+        costs = []
+        for factor in SCALES:
+            if factor > 1 and not scalable:
+                costs.append(None)
+                continue
+            payload = grown(body, factor)
+            costs.append(per_call_us(lambda: adapter.validate_python(payload)))
+        build = per_call_us(lambda: TypeAdapter(model))
+        with warnings.catch_warnings():
+            # FastMCP's dump of a dict through a model warns on every call
+            warnings.simplefilter("ignore")
+            dump = per_call_us(lambda: adapter.dump_python(body, mode="json"))
+
+        totals["validate"] += costs[0]
+        totals["build"] += build
+        totals["dump"] += dump
+        cells = "".join(
+            f" {'-' if cost is None else f'{cost:.1f}':>{width}}"
+            for cost, width in zip(costs, (9, 10, 11))
+        )
+        size = len(json.dumps(body, separators=(",", ":")))
+        print(f"{model.__name__:34} {size:8d}{cells} {build:9.1f} {dump:9.1f}")
+
+    print(
+        f"total at 1x: validate {totals['validate']:.0f} us,"
+        f" build per call {totals['build']:.0f} us,"
+        f" FastMCP dump {totals['dump']:.0f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
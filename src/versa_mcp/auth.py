@@ -0,0 +1,161 @@
+"""
+Director OAuth Token Cache
+
+TokenManager keeps one Director access token per process for DirectorClient
+instead of a static bearer token. The token is cached until refresh_margin
+seconds before it expires, then refreshed ahead of expiry. Refreshes are
+single-flight: callers arriving while one is in flight wait for it (or keep
+using the current token while it is still valid) rather than each
+requesting their own, so 200 concurrent tool calls that all see a 401 cause
+one token request, not 200.
+
+Tokens come from the Director's OAuth endpoint (POST /auth/token) with the
+password grant, or the refresh_token grant when the last response had one.
+DirectorClient builds a TokenManager when these are set:
+    DIRECTOR_USERNAME, DIRECTOR_PASSWORD          (required for OAuth)
+    DIRECTOR_CLIENT_ID, DIRECTOR_CLIENT_SECRET
+    DIRECTOR_TOKEN_URL                            (default /auth/token)
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+import anyio
+
+TOKEN_URL = "/auth/token"
+
+
+class DirectorAuthError(PermissionError):
+    """Raised when the Director refuses to issue an access token."""
+
+
+class TokenManager:
+    """
+    Caches a Director access token and refreshes it single-flight.
+
+    client is any httpx.AsyncClient-style client with an async post(); the
+    token request is sent with it directly, without a bearer token.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        username: str,
+        password: str,
+        client_id: str = "",
+        client_secret: str = "",
+        token_url: str = TOKEN_URL,
+        refresh_margin: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_url = token_url
+        self.refresh_margin = refresh_margin
+        self.clock = clock
+        self._lock = anyio.Lock()
+        self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._refresh_at = 0.0
+        self._expires_at = 0.0
+        # Attempt counter and last failure, so waiters on a failed refresh
+        # share its error instead of retrying one after another
+        self._attempts = 0
+        self._failure: Optional[DirectorAuthError] = None
+        self.refreshes = 0
+
+    async def token(self) -> str:
+        """A valid access token, refreshing it first if it is due."""
+        now = self.clock()
+        if self._token is not None and now < self._refresh_at:
+            return self._token
+        # Due for refresh but still valid: let the refresh in flight finish
+        # in the background rather than wait on it
+        if self._token is not None and now < self._expires_at and self._lock.locked():
+            return self._token
+
+        attempt = self._attempts
+        async with self._lock:
+            if self._token is not None and self.clock() < self._refresh_at:
+                return self._token
+            if self._attempts != attempt and self._failure is not None:
+                raise self._failure
+            self._attempts += 1
+            try:
+                token = await self._refresh()
+            except DirectorAuthError as e:
+                self._failure = e
+                raise
+            self._failure = None
+            return token
+
+    def invalidate(self, token: str) -> None:
+        """
+        Drop token after the Director rejected it (a 401). Only the current
+        token is dropped, so late 401s for an already replaced token do not
+        trigger another refresh.
+        """
+        if token == self._token:
+            self._token = None
+            self._refresh_at = self._expires_at = 0.0
+
+    async def _refresh(self) -> str:
+        body = None
+        if self._refresh_token:
+            body = await self._request(
+                {"grant_type": "refresh_token", "refresh_token": self._refresh_token},
+                raise_on_reject=False,
+            )
+        if body is None:
+            body = await self._request(
+                {
+                    "grant_type": "password",
+                    "username": self.username,
+                    "password": self.password,
+                }
+            )
+        if body is None:
+            raise DirectorAuthError("Malformed token response: empty body")
+
+        try:
+            token = body["access_token"]
+            lifetime = float(body.get("expires_in", 3600))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise DirectorAuthError(f"Malformed token response: {e}") from e
+        if not isinstance(token, str) or not token:
+            raise DirectorAuthError("Malformed token response: no access_token")
+        now = self.clock()
+        self._token = token
+        self._refresh_token = body.get("refresh_token")
+        self._expires_at = now + lifetime
+        # Short-lived tokens refresh at 90% of their life instead
+        self._refresh_at = now + lifetime - min(self.refresh_margin, lifetime * 0.1)
+        self.refreshes += 1
+        return token
+
+    async def _request(
+        self, grant: dict[str, str], raise_on_reject: bool = True
+    ) -> Optional[dict[str, Any]]:
+        payload = {
+            **grant,
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        response = await self.client.post(self.token_url, json=payload)
+        if response.status_code >= 400:
+            if not raise_on_reject and response.status_code < 500:
+                return None
+            raise DirectorAuthError(
+                f"Token request rejected with status {response.status_code}"
+            )
+        return response.json()
+
+    def stats(self) -> dict[str, Any]:
+        """Token requests made and seconds until the current token expires."""
+        return {
+            "refreshes": self.refreshes,
+            "expires_in_s": max(0.0, round(self._expires_at - self.clock(), 1)),
+        }
@@ -0,0 +1,169 @@
+"""
+Director Backend Selection
+
+Every tool sends its request through one shared backend instead of
+constructing a client per call. The backend is opened in the FastMCP
+lifespan and closed on shutdown; tools fetch it with get_backend().
+
+Select the implementation with MOCK_MODE environment variable:
+    MOCK_MODE=true    (default) MockAsyncClient over the mock corpus
+    MOCK_MODE=replay  CassetteClient replaying MOCK_CASSETTE=/path/to/cassette
+    MOCK_MODE=false   DirectorClient to DIRECTOR_URL=https://director.example.com
+                      (see director_client.py)
+
+MOCK_RECORD=/path/to/cassette records every request the backend sends, and
+its response, to a cassette (see mocks/cassette.py) that MOCK_MODE=replay
+can serve later; use it with MOCK_MODE=false to capture a real Director.
+
+RESPONSE_CACHE=true puts a per-endpoint TTL cache in front of the backend
+(see response_cache.py), and COALESCE_REQUESTS=true shares one call between
+identical concurrent GETs (see singleflight.py). Both are on by default
+with MOCK_MODE=false. RESPONSE_VALIDATION=full or trusted checks responses
+against their models in schemas.py (see validation.py), with
+RESPONSE_CODEC=msgspec using the fast codec to do so (see codec.py).
+
+Tools build URLs against the mock host; every backend only uses the path
+and params, and the HTTP backend sends them to DIRECTOR_URL.
+"""
+
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Protocol
+
+from .mocks.mock_client import MockAsyncClient
+
+MOCK_MODES = ("true", "mock")
+REPLAY_MODES = ("replay",)
+HTTP_MODES = ("false", "http")
+VALIDATION_MODES = ("off", "full", "trusted")
+CODECS = ("pydantic", "msgspec")
+
+
+class BackendConfigError(ValueError):
+    """Raised when MOCK_MODE or the settings it needs are invalid."""
+
+
+class DirectorBackend(Protocol):
+    """
+    What tools need from a backend: httpx.AsyncClient-style verbs, and
+    async context management to open and close it.
+    """
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any: ...
+
+    async def __aenter__(self) -> Any: ...
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Any: ...
+
+
+def create_backend(mode: Optional[str] = None) -> DirectorBackend:
+    """
+    Create the backend selected by mode, or by MOCK_MODE if not given,
+    recorded to MOCK_RECORD if set, and wrapped in request coalescing, a
+    ResponseCache and response validation if they are on.
+    """
+    mode = (mode or os.environ.get("MOCK_MODE") or "true").lower()
+    validation = (os.environ.get("RESPONSE_VALIDATION") or "off").lower()
+    if validation not in VALIDATION_MODES:
+        raise BackendConfigError(
+            f"RESPONSE_VALIDATION must be off, full or trusted: {validation!r}"
+        )
+    codec = (os.environ.get("RESPONSE_CODEC") or "pydantic").lower()
+    if codec not in CODECS:
+        raise BackendConfigError(
+            f"RESPONSE_CODEC must be pydantic or msgspec: {codec!r}"
+        )
+    record = os.environ.get("MOCK_RECORD")
+    if record and mode in REPLAY_MODES:
+        raise BackendConfigError("MOCK_RECORD cannot be used with MOCK_MODE=replay")
+    backend = _create_client(mode)
+    # The recorder wraps the client itself, so it records only real traffic
+    if record:
+        from .mocks.cassette import CassetteRecorder
+
+        backend = CassetteRecorder(backend, record)
+    # Trusted validation sits under coalescing and the cache, so only
+    # responses from the client are validated
+    if validation == "trusted":
+        from .validation import ValidatingBackend
+
+        backend = ValidatingBackend(backend, fast=codec == "msgspec")
+    # Coalescing sits under the cache so concurrent misses share one call
+    if _enabled("COALESCE_REQUESTS", mode in HTTP_MODES):
+        from .singleflight import CoalescingBackend
+
+        backend = CoalescingBackend(backend)
+    if _enabled("RESPONSE_CACHE", mode in HTTP_MODES):
+        from .response_cache import ResponseCache
+
+        backend = ResponseCache.from_env(backend)
+    if validation == "full":
+        from .validation import ValidatingBackend
+
+        backend = ValidatingBackend(backend, fast=codec == "msgspec")
+    return backend
+
+
+def _enabled(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    if value.lower() not in ("true", "false"):
+        raise BackendConfigError(f"{name} must be true or false: {value!r}")
+    return value.lower() == "true"
+
+
+def _create_client(mode: str) -> DirectorBackend:
+    if mode in MOCK_MODES:
+        return MockAsyncClient(verify=False)
+    if mode in REPLAY_MODES:
+        from .mocks.cassette import CassetteClient
+
+        cassette = os.environ.get("MOCK_CASSETTE")
+        if not cassette:
+            raise BackendConfigError("MOCK_MODE=replay needs MOCK_CASSETTE")
+        return CassetteClient(cassette)
+    if mode in HTTP_MODES:
+        from .director_client import DirectorClient
+
+        return DirectorClient.from_env()
+    raise BackendConfigError(f"Unknown MOCK_MODE '{mode}': use true, replay or false")
+
+
+_backend: Optional[DirectorBackend] = None
+
+
+@asynccontextmanager
+async def open_backend(
+    backend: Optional[DirectorBackend] = None,
+) -> AsyncIterator[DirectorBackend]:
+    """
+    Open a backend (the MOCK_MODE one if not given) as the shared backend,
+    and close it on exit.
+    """
+    global _backend
+    async with AsyncExitStack() as stack:
+        backend = backend if backend is not None else create_backend()
+        if hasattr(backend, "__aenter__"):
+            await stack.enter_async_context(backend)
+        previous, _backend = _backend, backend
+        try:
+            yield backend
+        finally:
+            _backend = previous
+
+
+def get_backend() -> DirectorBackend:
+    """
+    Get the shared backend. Outside a lifespan (e.g. calling a tool
+    directly) a MOCK_MODE backend is created on first use and kept.
+    """
+    global _backend
+    if _backend is None:
+        _backend = create_backend()
+    return _backend
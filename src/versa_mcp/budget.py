@@ -0,0 +1,388 @@
+"""
+Response Budgets
+
+Every tool takes an optional response budget, budget_bytes or budget_tokens
+(estimated at TOKEN_BYTES bytes of JSON per token), so one large result
+cannot overflow the agent's context. Within the budget the tool returns the
+most relevant rows of its record list; the rows left out are summarized in
+a budget object: how many, their counts per categorical field, and a
+cursor. Calling the tool again with the same arguments and that cursor
+returns the next rows, in the same order; the cursor carries a hash of the
+arguments, and is rejected if they differ.
+
+The record list is the first list of records declared by the tool's
+response model in schemas.py; a model without one may instead hold its
+records in a map keyed by id (such as bulk status results), which is cut
+the same way, row by row, keeping the keys. Rows are ranked by alarm severity, then by
+how many of their status fields are away from healthy; ties keep the
+Director's order. Responses without a record list are returned whole, with
+budget reporting whether they fit.
+
+Tools opt in with the budgeted decorator, under @mcp.tool(). Without a
+budget or cursor the tool's response is returned untouched.
+"""
+
+import base64
+import binascii
+import functools
+import hashlib
+import inspect
+import json
+import typing
+from typing import Annotated, Any, Awaitable, Callable, Mapping, Optional
+
+from fastmcp import Context
+from pydantic import BaseModel, Field, create_model
+
+from .schemas import SEVERITIES, BudgetInfo
+
+TOKEN_BYTES = 4
+
+# Healthy value of each status field; rows with more fields away from
+# healthy rank higher
+HEALTHY: dict[str, str] = {
+    "pingStatus": "REACHABLE",
+    "syncStatus": "IN_SYNC",
+    "servicesStatus": "GOOD",
+    "pathStatus": "GOOD",
+    "hardwareHealth": "GOOD",
+    "health": "GOOD",
+    "operStatus": "UP",
+}
+SEVERITY_FIELDS = ("severity", "highestSeverity", "defaultSeverity")
+
+# A field is counted when its rows take at most this many values, and at
+# most one per four rows
+MAX_COUNT_VALUES = 10
+
+BUDGET_PARAMETERS = [
+    inspect.Parameter(
+        name,
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=annotation,
+    )
+    for name, annotation in [
+        (
+            "budget_bytes",
+            Annotated[
+                Optional[int],
+                Field(description="Fit the response into this many bytes of JSON"),
+            ],
+        ),
+        (
+            "budget_tokens",
+            Annotated[
+                Optional[int],
+                Field(description="Fit the response into about this many tokens"),
+            ],
+        ),
+        (
+            "cursor",
+            Annotated[
+                Optional[str],
+                Field(
+                    description="budget.cursor of a previous call, for the next rows"
+                ),
+            ],
+        ),
+    ]
+]
+
+
+class BudgetError(ValueError):
+    """Raised when a response budget or cursor is invalid."""
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def record_list(model: Any) -> tuple[Optional[str], Optional[type[BaseModel]]]:
+    """
+    The key and row model of the record list in a response model: its first
+    list of models or objects, else its first list, else its first map of
+    models or objects. (None, None) if none.
+    """
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return None, None
+    lists = []
+    for name, field in model.model_fields.items():
+        if typing.get_origin(field.annotation) is not list:
+            continue
+        args = typing.get_args(field.annotation)
+        item: Any = args[0] if args else Any
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return field.alias or name, item
+        if item is Any or typing.get_origin(item) is dict:
+            return field.alias or name, None
+        lists.append(field.alias or name)
+    if lists:
+        return lists[0], None
+    for name, field in model.model_fields.items():
+        if typing.get_origin(field.annotation) is not dict:
+            continue
+        args = typing.get_args(field.annotation)
+        item = args[1] if len(args) == 2 else Any
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return field.alias or name, item
+        if item is Any or typing.get_origin(item) is dict:
+            return field.alias or name, None
+    return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def with_budget(model: type[BaseModel]) -> type[BaseModel]:
+    """model, extended with the optional budget object."""
+    return create_model(
+        model.__name__,
+        __base__=model,
+        __doc__=model.__doc__,
+        __module__=model.__module__,
+        budget=(Optional[BudgetInfo], None),
+    )
+
+
+def _relevance(row: Any) -> tuple[int, int]:
+    if not isinstance(row, dict):
+        return (len(SEVERITIES), 0)
+    severity = min(
+        (
+            SEVERITIES.index(row[field])
+            for field in SEVERITY_FIELDS
+            if row.get(field) in SEVERITIES
+        ),
+        default=len(SEVERITIES),
+    )
+    unhealthy = sum(
+        1
+        for field, healthy in HEALTHY.items()
+        if field in row and row[field] != healthy
+    )
+    return (severity, -unhealthy)
+
+
+def _categorical(rows: list[Any], model: Optional[type[BaseModel]]) -> list[str]:
+    """
+    Text and flag fields of rows (those declared by model, if given) taking
+    few enough distinct values to be counted.
+    """
+    declared = None
+    if model is not None:
+        declared = {
+            field.alias or name
+            for name, field in model.model_fields.items()
+            if field.annotation in (str, bool, Optional[str], Optional[bool])
+        }
+    values: dict[str, set] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            return []
+        for field, value in row.items():
+            if declared is not None and field not in declared:
+                continue
+            if isinstance(value, (str, bool)):
+                values.setdefault(field, set()).add(value)
+    limit = min(MAX_COUNT_VALUES, len(rows) // 4)
+    return [field for field, seen in values.items() if len(seen) <= limit]
+
+
+def _counts(rows: list[Any], fields: list[str]) -> dict[str, dict[str, int]]:
+    counts: dict[str, dict[str, int]] = {field: {} for field in fields}
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if isinstance(value, bool):
+                value = json.dumps(value)
+            if isinstance(value, str):
+                counts[field][value] = counts[field].get(value, 0) + 1
+    return counts
+
+
+def arguments_hash(arguments: Mapping[str, Any]) -> str:
+    """Short hash of a tool call's arguments, leaving out its Context."""
+    call = {
+        name: value
+        for name, value in arguments.items()
+        if not isinstance(value, Context)
+    }
+    data = json.dumps(call, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def encode_cursor(tool: str, args_hash: str, offset: int) -> str:
+    data = json.dumps(
+        {"tool": tool, "args": args_hash, "offset": offset}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(tool: str, args_hash: str, cursor: str) -> int:
+    """
+    The row offset in cursor, which must have been issued by tool for a
+    call with the same arguments.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        offset = data["offset"]
+        issued_by = data["tool"]
+        issued_for = data["args"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise BudgetError(f"Invalid cursor '{cursor}'") from None
+    if issued_by != tool or not isinstance(offset, int) or offset < 0:
+        raise BudgetError(f"Cursor '{cursor}' was not issued by {tool}")
+    if issued_for != args_hash:
+        raise BudgetError(
+            f"Cursor '{cursor}' was issued for other arguments: repeat the call"
+            " that returned it"
+        )
+    return offset
+
+
+def budget_limit(
+    budget_bytes: Optional[int], budget_tokens: Optional[int]
+) -> Optional[int]:
+    """The response budget in bytes: the tighter of the two, if any."""
+    limits = []
+    for name, value, scale in [
+        ("budget_bytes", budget_bytes, 1),
+        ("budget_tokens", budget_tokens, TOKEN_BYTES),
+    ]:
+        if value is None:
+            continue
+        if value < 1:
+            raise BudgetError(f"{name} must be positive: {value}")
+        limits.append(value * scale)
+    return min(limits) if limits else None
+
+
+def fit_to_budget(
+    body: Any,
+    tool: str,
+    args_hash: str,
+    list_key: Optional[str],
+    limit: Optional[int],
+    offset: int = 0,
+    row_model: Optional[type[BaseModel]] = None,
+) -> Any:
+    """
+    Return body with the rows of list_key from offset on, most relevant
+    first, cut to fit limit bytes, and a budget object describing the cut.
+    A map of rows keeps each kept row under its key. Cursors are issued for
+    tool called with arguments hashing to args_hash.
+    """
+    if not isinstance(body, dict):
+        return body
+    records = body.get(list_key) if list_key is not None else None
+    if not isinstance(records, (list, dict)):
+        size = _size(body)
+        info = BudgetInfo(
+            returned=0,
+            omitted=0,
+            bytes=size,
+            overBudget=limit is not None and size > limit,
+            omittedCounts={},
+        )
+        return {**body, "budget": info.model_dump(by_alias=True)}
+
+    keyed = isinstance(records, dict)
+    items = list(records.items()) if keyed else [(None, row) for row in records]
+    items = sorted(items, key=lambda item: _relevance(item[1]))[offset:]
+    rows = [row for _, row in items]
+    kept = items
+    if limit is not None:
+        fields = _categorical(rows, row_model)
+        # Reserve room for the summary of every row being omitted; the
+        # summary of fewer rows is never larger
+        worst = BudgetInfo(
+            listKey=list_key,
+            returned=0,
+            omitted=len(rows),
+            bytes=limit,
+            overBudget=False,
+            omittedCounts=_counts(rows, fields),
+            cursor=encode_cursor(tool, args_hash, offset + len(rows)),
+        )
+        envelope = {
+            **body,
+            list_key: {} if keyed else [],
+            "budget": worst.model_dump(by_alias=True),
+        }
+        room = limit - _size(envelope)
+        used = 0
+        for index, (key, row) in enumerate(items):
+            used += _size(row) + (1 if index else 0)
+            if keyed:
+                used += _size(key) + 1
+            if used > room:
+                kept = items[:index]
+                break
+    else:
+        fields = []
+
+    omitted = rows[len(kept) :]
+    cut = dict(kept) if keyed else [row for _, row in kept]
+    result = {key: cut if key == list_key else value for key, value in body.items()}
+    info = BudgetInfo(
+        listKey=list_key,
+        returned=len(kept),
+        omitted=len(omitted),
+        bytes=0,
+        overBudget=False,
+        omittedCounts=_counts(omitted, fields) if omitted else {},
+        cursor=encode_cursor(tool, args_hash, offset + len(kept)) if omitted else None,
+    )
+    budget = result["budget"] = info.model_dump(by_alias=True)
+    # Report the size including the reported size itself
+    for _ in range(3):
+        size = _size(result)
+        if budget["bytes"] == size:
+            break
+        budget["bytes"] = size
+        budget["overBudget"] = limit is not None and size > limit
+    return result
+
+
+def budgeted(tool: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Add budget_bytes, budget_tokens and cursor to an async tool, and the
+    budget object to its response model.
+    """
+    signature = inspect.signature(tool)
+    model = signature.return_annotation
+    list_key, row_model = record_list(model)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        response_model = with_budget(model)
+    else:
+        response_model = model
+
+    @functools.wraps(tool)
+    async def wrapper(
+        *args: Any,
+        budget_bytes: Optional[int] = None,
+        budget_tokens: Optional[int] = None,
+        cursor: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        limit = budget_limit(budget_bytes, budget_tokens)
+        if limit is None and not cursor:
+            return await tool(*args, **kwargs)
+        call = signature.bind(*args, **kwargs)
+        call.apply_defaults()
+        args_hash = arguments_hash(call.arguments)
+        offset = decode_cursor(tool.__name__, args_hash, cursor) if cursor else 0
+        body = await tool(*args, **kwargs)
+        return fit_to_budget(
+            body, tool.__name__, args_hash, list_key, limit, offset, row_model
+        )
+
+    wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=[*signature.parameters.values(), *BUDGET_PARAMETERS],
+        return_annotation=response_model,
+    )
+    wrapper.__annotations__ = {
+        **tool.__annotations__,
+        **{p.name: p.annotation for p in BUDGET_PARAMETERS},
+        "return": response_model,
+    }
+    return wrapper
@@ -0,0 +1,164 @@
+"""
+Bulk Appliance Status
+
+Fetches status for many appliances in one tool call instead of one MCP
+round trip per device. Appliances are given by UUID or name; names are
+resolved to UUIDs with one lite listing. The per-device requests fan out
+to the backend with at most `concurrency` in flight, and every device gets
+either a result or an entry in the error map, so one failing device does
+not fail the call.
+
+Views (the single-device tool each one replaces):
+    status   get_appliance_status
+    brief    get_appliance_status_brief
+    single   get_single_appliance_status
+
+Set the default concurrency with BULK_CONCURRENCY (default 16).
+"""
+
+import os
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import anyio
+
+BULK_VIEWS: dict[str, str] = {
+    "status": "/vnms/dashboard/applianceStatus/{uuid}",
+    "brief": "/vnms/dashboard/applianceStatus/{uuid}/brief",
+    "single": "/nextgen/appliance/status/{uuid}",
+}
+LITE_PATH = "/vnms/appliance/appliance/lite"
+
+DEFAULT_CONCURRENCY = 16
+MAX_CONCURRENCY = 64
+MAX_APPLIANCES = 1000
+
+
+class BulkRequestError(ValueError):
+    """Raised when a bulk request's view, size or concurrency is invalid."""
+
+
+def default_concurrency() -> int:
+    """Concurrency from BULK_CONCURRENCY, else DEFAULT_CONCURRENCY."""
+    value = os.environ.get("BULK_CONCURRENCY")
+    if not value:
+        return DEFAULT_CONCURRENCY
+    try:
+        return int(value)
+    except ValueError:
+        raise BulkRequestError(
+            f"BULK_CONCURRENCY must be an integer: {value!r}"
+        ) from None
+
+
+def _error_message(response: Any) -> str:
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict) and body.get("error"):
+        return f"{response.status_code}: {body['error']}"
+    return f"{response.status_code}: request failed"
+
+
+async def resolve_appliances(
+    backend: Any,
+    base_url: str,
+    identifiers: Sequence[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> dict[str, str]:
+    """
+    Map each identifier to an appliance UUID. UUIDs map to themselves and
+    names to their appliance's UUID; anything else is passed through as
+    given, for the Director to reject.
+    """
+    response = await backend.get(f"{base_url}{LITE_PATH}", headers=headers)
+    by_name: dict[str, str] = {}
+    uuids: set[str] = set()
+    if response.status_code == 200:
+        for appliance in response.json().get("appliances", []):
+            uuids.add(appliance.get("uuid"))
+            by_name[appliance.get("name")] = appliance.get("uuid")
+    return {
+        identifier: (
+            identifier if identifier in uuids else by_name.get(identifier, identifier)
+        )
+        for identifier in identifiers
+    }
+
+
+async def fetch_appliance_statuses(
+    backend: Any,
+    base_url: str,
+    appliances: Sequence[str],
+    view: str = "brief",
+    concurrency: Optional[int] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> dict[str, Any]:
+    """
+    Fetch one view of status for every appliance, at most concurrency at a
+    time. Results and errors are keyed by the identifiers as given.
+    """
+    if view not in BULK_VIEWS:
+        raise BulkRequestError(
+            f"Unknown view '{view}': use one of {', '.join(BULK_VIEWS)}"
+        )
+    if concurrency is None:
+        concurrency = default_concurrency()
+    if not 1 <= concurrency <= MAX_CONCURRENCY:
+        raise BulkRequestError(
+            f"concurrency must be between 1 and {MAX_CONCURRENCY}: {concurrency}"
+        )
+    identifiers = list(dict.fromkeys(appliances))
+    if len(identifiers) > MAX_APPLIANCES:
+        raise BulkRequestError(
+            f"At most {MAX_APPLIANCES} appliances per call: got {len(identifiers)}"
+        )
+
+    uuids = await resolve_appliances(backend, base_url, identifiers, headers)
+    path = BULK_VIEWS[view]
+    urls = {i: f"{base_url}{path.format(uuid=uuids[i])}" for i in identifiers}
+    results, errors = await fan_out(backend, urls, concurrency, headers)
+    return {
+        "view": view,
+        "requested": len(identifiers),
+        "succeeded": len(results),
+        "failed": len(errors),
+        "results": results,
+        "errors": errors,
+    }
+
+
+async def fan_out(
+    backend: Any,
+    urls: Mapping[str, str],
+    concurrency: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    GET every url, at most concurrency at a time. Returns the decoded 2xx
+    bodies and the error messages of the rest, both keyed and ordered as urls.
+    """
+    limiter = anyio.CapacityLimiter(concurrency)
+    results: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+
+    async def fetch(key: str, url: str) -> None:
+        async with limiter:
+            try:
+                response = await backend.get(url, headers=headers)
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+                return
+        if 200 <= response.status_code < 300:
+            results[key] = response.json()
+        else:
+            errors[key] = _error_message(response)
+
+    async with anyio.create_task_group() as tg:
+        for key, url in urls.items():
+            tg.start_soon(fetch, key, url)
+
+    return (
+        {k: results[k] for k in urls if k in results},
+        {k: errors[k] for k in urls if k in errors},
+    )
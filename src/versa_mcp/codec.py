@@ -0,0 +1,163 @@
+"""
+Fast Response Codec
+
+The pydantic path turns Director bytes into dicts (json.loads), validates
+the dicts against the models in schemas.py and dumps the models back to
+JSON. With msgspec installed, decode turns the bytes straight into compact
+typed structs mirroring those models, and encode writes the structs back
+to JSON, with no intermediate dicts.
+
+The structs are derived from the models (struct_type), so they follow
+schemas.py as it changes: attributes take the models' field names, JSON
+keys their aliases, and keys a model does not declare are dropped as the
+model drops them. A field with a default that is missing from the body
+reads as msgspec.UNSET and is left out by encode, as model_dump leaves out
+unset fields. tests/test_codec.py checks both paths agree field for field.
+
+Both paths apply the same lax coercions of numbers and numeric strings,
+but msgspec is stricter at the edges: it rejects JSON booleans for number
+fields and strings such as "yes" or "on" for booleans, which pydantic
+accepts.
+
+parse is what RESPONSE_CODEC=msgspec validation uses (see validation.py):
+it parses the bytes once into plain dicts and lists, the body tools work
+on, and checks that body against the struct without parsing it again.
+
+msgspec is optional: install the fast extra. Without it, decode, parse and
+encode fall back to the pydantic models.
+"""
+
+import json
+import sys
+import typing
+from types import ModuleType, UnionType
+from typing import Any, Union
+
+from pydantic import BaseModel, ValidationError
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# The structs, by model name, so self-referencing models resolve
+structs = ModuleType(f"{__name__}.structs", "Structs mirroring schemas.py")
+sys.modules[structs.__name__] = structs
+
+_struct_types: dict[type[BaseModel], type] = {}
+_building: set[type[BaseModel]] = set()
+
+
+class CodecError(ValueError):
+    """Raised when a body does not decode into its model."""
+
+
+def available() -> bool:
+    """Whether msgspec is installed, so the structs can be used."""
+    return msgspec is not None
+
+
+def _struct_annotation(annotation: Any) -> Any:
+    """annotation with every model in it replaced by its struct."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return struct_type(annotation)
+    origin = typing.get_origin(annotation)
+    args = tuple(_struct_annotation(arg) for arg in typing.get_args(annotation))
+    if origin in (Union, UnionType):
+        return Union[args]
+    if origin is list:
+        return list[args[0]] if args else list
+    if origin is dict:
+        return dict[args[0], args[1]] if args else dict
+    return annotation
+
+
+def struct_type(model: type[BaseModel]) -> Any:
+    """
+    The msgspec struct mirroring model, built on first use. Within its own
+    fields a model is referred to by name.
+    """
+    if msgspec is None:
+        raise CodecError("msgspec is not installed: install the fast extra")
+    if model in _struct_types:
+        return _struct_types[model]
+    if model in _building:
+        return model.__name__
+    _building.add(model)
+    try:
+        fields: list[tuple] = []
+        rename = {}
+        for name, field in model.model_fields.items():
+            annotation = _struct_annotation(field.annotation)
+            if field.is_required():
+                fields.append((name, annotation))
+            else:
+                fields.append(
+                    (name, Union[annotation, msgspec.UnsetType], msgspec.UNSET)
+                )
+            if field.alias and field.alias != name:
+                rename[name] = field.alias
+    finally:
+        _building.discard(model)
+    struct = msgspec.defstruct(
+        model.__name__, fields, kw_only=True, rename=rename, module=structs.__name__
+    )
+    setattr(structs, model.__name__, struct)
+    _struct_types[model] = struct
+    return struct
+
+
+def decode(raw: bytes, model: type[BaseModel]) -> Any:
+    """
+    Decode JSON bytes into model's struct (or, without msgspec, into model),
+    raising CodecError if they do not match it.
+    """
+    if msgspec is None:
+        try:
+            return model.model_validate_json(raw)
+        except ValidationError as e:
+            raise CodecError(str(e)) from None
+    try:
+        return msgspec.json.decode(raw, type=struct_type(model), strict=False)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise CodecError(str(e)) from None
+
+
+def check(body: Any, model: type[BaseModel]) -> None:
+    """
+    Check an already parsed body (plain dicts and lists) against model's
+    struct (or, without msgspec, model), raising CodecError on a mismatch.
+    """
+    if msgspec is None:
+        try:
+            model.model_validate(body)
+        except ValidationError as e:
+            raise CodecError(str(e)) from None
+        return
+    try:
+        msgspec.convert(body, struct_type(model), strict=False)
+    except msgspec.ValidationError as e:
+        raise CodecError(str(e)) from None
+
+
+def parse(raw: bytes, model: type[BaseModel]) -> Any:
+    """
+    Parse JSON bytes into plain dicts and lists, as json.loads does, raising
+    CodecError if they do not match model's struct (or, without msgspec,
+    model). The bytes are parsed once; check converts the parsed body.
+    """
+    try:
+        body = json.loads(raw) if msgspec is None else msgspec.json.decode(raw)
+    except ValueError as e:
+        raise CodecError(str(e)) from None
+    check(body, model)
+    return body
+
+
+def encode(value: Any) -> bytes:
+    """JSON bytes of a decoded struct or model, keyed by alias."""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json(by_alias=True, exclude_unset=True).encode()
+    if msgspec is None:
+        raise CodecError("msgspec is not installed: install the fast extra")
+    return msgspec.json.encode(value)
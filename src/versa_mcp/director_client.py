@@ -0,0 +1,268 @@
+"""
+Director HTTP Client
+
+DirectorClient sends tool requests to a real Director over one pooled
+httpx.AsyncClient per process, so TLS connections are opened once and
+kept alive across tool calls instead of per call. It is the backend used
+with MOCK_MODE=false.
+
+Configure it with environment variables:
+    DIRECTOR_URL                 https://director.example.com (required)
+    DIRECTOR_VERIFY_TLS          true (default), false, or a CA bundle path
+    DIRECTOR_HTTP2               true to multiplex over HTTP/2 (needs h2)
+    DIRECTOR_MAX_CONNECTIONS     pool size (default 20)
+    DIRECTOR_MAX_KEEPALIVE       idle connections kept open (default 20)
+    DIRECTOR_KEEPALIVE_EXPIRY    seconds an idle connection is kept (default 30)
+    DIRECTOR_CONNECT_TIMEOUT     seconds to connect (default 5)
+    DIRECTOR_TIMEOUT             seconds for other phases (default 10)
+    DIRECTOR_TIMEOUTS            JSON object of endpoint pattern -> seconds,
+                                 merged over ENDPOINT_TIMEOUTS
+
+With DIRECTOR_USERNAME and DIRECTOR_PASSWORD set, requests carry an OAuth
+token from a TokenManager (see auth.py) in place of the tools' static
+bearer token; a 401 drops the token and retries the request once.
+
+httpx is imported on construction, so mock-only installs do not need it;
+install the director extra (httpx[http2]) to use this client.
+"""
+
+import json
+import os
+import ssl
+from typing import Any, Mapping, Optional, Union
+from urllib.parse import urlparse
+
+from .auth import TOKEN_URL, TokenManager
+from .backend import BackendConfigError
+from .mocks.endpoint_map import match_endpoint
+
+# Endpoints known to take longer than the default on a loaded Director
+ENDPOINT_TIMEOUTS: dict[str, float] = {
+    "/vnms/appliance/export": 60.0,
+    "/vnms/fault/alarms/page": 30.0,
+    "/vnms/fault/alarms": 30.0,
+    "/vnms/fault/analytics/alarms": 30.0,
+    "/vnms/audit/logs": 30.0,
+}
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1
+    if number <= 0:
+        raise BackendConfigError(f"{name} must be a positive number: {value!r}")
+    return number
+
+
+def _env_verify() -> Union[bool, ssl.SSLContext]:
+    value = os.environ.get("DIRECTOR_VERIFY_TLS", "true")
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    try:
+        return ssl.create_default_context(cafile=value)
+    except (OSError, ssl.SSLError) as e:
+        raise BackendConfigError(f"Cannot load CA bundle {value}: {e}") from e
+
+
+def _env_timeouts() -> dict[str, float]:
+    value = os.environ.get("DIRECTOR_TIMEOUTS")
+    if not value:
+        return {}
+    try:
+        timeouts = json.loads(value)
+        return {str(k): float(v) for k, v in timeouts.items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        raise BackendConfigError(
+            f"DIRECTOR_TIMEOUTS must be a JSON object of pattern -> seconds: {e}"
+        ) from e
+
+
+def _env_credentials() -> Optional[dict[str, str]]:
+    username = os.environ.get("DIRECTOR_USERNAME")
+    password = os.environ.get("DIRECTOR_PASSWORD")
+    if not username and not password:
+        return None
+    if not username or not password:
+        raise BackendConfigError(
+            "DIRECTOR_USERNAME and DIRECTOR_PASSWORD must be set together"
+        )
+    return {
+        "username": username,
+        "password": password,
+        "client_id": os.environ.get("DIRECTOR_CLIENT_ID", ""),
+        "client_secret": os.environ.get("DIRECTOR_CLIENT_SECRET", ""),
+        "token_url": os.environ.get("DIRECTOR_TOKEN_URL", TOKEN_URL),
+    }
+
+
+class DirectorClient:
+    """
+    Pooled httpx client for one Director.
+
+    Only the path of each tool URL is used; it is resolved against base_url.
+    Each request gets the timeout of its endpoint pattern (endpoint_timeouts
+    over ENDPOINT_TIMEOUTS), else the default read/write/pool timeout.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        verify: Union[bool, ssl.SSLContext] = True,
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        timeout: float = 10.0,
+        endpoint_timeouts: Optional[Mapping[str, float]] = None,
+        credentials: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        import httpx
+
+        self.base_url = base_url.rstrip("/")
+        self.http2 = http2
+        self.default_timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.timeouts = {
+            pattern: httpx.Timeout(seconds, connect=connect_timeout)
+            for pattern, seconds in {
+                **ENDPOINT_TIMEOUTS,
+                **(endpoint_timeouts or {}),
+            }.items()
+        }
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        try:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                verify=verify,
+                http2=http2,
+                limits=limits,
+                timeout=self.default_timeout,
+                **kwargs,
+            )
+        except ImportError as e:
+            raise BackendConfigError(
+                "HTTP/2 needs the h2 package: pip install 'httpx[http2]'"
+            ) from e
+        self.auth = TokenManager(self.client, **credentials) if credentials else None
+        self.requests = 0
+        self.connections = 0
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "DirectorClient":
+        """Create a client configured by the DIRECTOR_* environment variables."""
+        director_url = os.environ.get("DIRECTOR_URL")
+        if not director_url:
+            raise BackendConfigError("MOCK_MODE=false needs DIRECTOR_URL")
+        settings: dict[str, Any] = {
+            "verify": _env_verify(),
+            "http2": os.environ.get("DIRECTOR_HTTP2", "false").lower() == "true",
+            "max_connections": int(_env_number("DIRECTOR_MAX_CONNECTIONS", 20)),
+            "max_keepalive_connections": int(_env_number("DIRECTOR_MAX_KEEPALIVE", 20)),
+            "keepalive_expiry": _env_number("DIRECTOR_KEEPALIVE_EXPIRY", 30.0),
+            "connect_timeout": _env_number("DIRECTOR_CONNECT_TIMEOUT", 5.0),
+            "timeout": _env_number("DIRECTOR_TIMEOUT", 10.0),
+            "endpoint_timeouts": _env_timeouts(),
+            "credentials": _env_credentials(),
+        }
+        settings.update(kwargs)
+        return cls(director_url, **settings)
+
+    async def __aenter__(self):
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        # httpcore reports each new connection; reused ones skip connect_tcp
+        if event_name == "connection.connect_tcp.complete":
+            self.connections += 1
+
+    def timeout_for(self, path: str) -> Any:
+        """The httpx.Timeout used for requests to path."""
+        route = match_endpoint(path)
+        if route is not None and route.pattern in self.timeouts:
+            return self.timeouts[route.pattern]
+        return self.default_timeout
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request for a tool URL to the Director."""
+        path = urlparse(url).path
+        kwargs.setdefault("timeout", self.timeout_for(path))
+        if self.auth is None:
+            return await self._send(method, path, **kwargs)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        token = await self.auth.token()
+        headers["Authorization"] = f"Bearer {token}"
+        response = await self._send(method, path, headers=headers, **kwargs)
+        if response.status_code == 401:
+            self.auth.invalidate(token)
+            headers["Authorization"] = f"Bearer {await self.auth.token()}"
+            response = await self._send(method, path, headers=headers, **kwargs)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        extensions: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self.requests += 1
+        # Keep the caller's extensions; a trace of theirs still sees every event
+        extensions = dict(extensions or {})
+        caller_trace = extensions.get("trace")
+        extensions["trace"] = self._trace
+        if caller_trace is not None:
+
+            async def trace(event_name: str, info: dict[str, Any]) -> None:
+                await self._trace(event_name, info)
+                await caller_trace(event_name, info)
+
+            extensions["trace"] = trace
+        return await self.client.request(method, path, extensions=extensions, **kwargs)
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a GET."""
+        return await self.request("GET", url, headers=headers, params=params, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Send a POST."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Any:
+        """Send a PUT."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """Send a DELETE."""
+        return await self.request("DELETE", url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Requests sent, connections opened and token refreshes so far."""
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "http2": self.http2,
+            "token_refreshes": self.auth.refreshes if self.auth else 0,
+        }
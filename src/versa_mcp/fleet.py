@@ -0,0 +1,197 @@
+"""
+Fleet Snapshot
+
+Answers fleet-wide questions such as "which branches in org X are down and
+have critical alarms" in one tool call, instead of several list tools, a
+sync status call per device and a join done in the LLM context.
+
+The appliance status list and active alarms (every page of each, see
+pager.py) and locations are fetched concurrently and joined by appliance
+UUID (alarms fall back to the device name; alarms without a severity are
+counted as UNKNOWN). Rows are filtered by org, reachability and alarm
+severity first; only then is sync status fetched for the remaining devices,
+with bounded concurrency (see bulk.fan_out). Each device becomes one
+compact row.
+
+Only the status list is required: if another source fails its fields are
+left null and the failure is reported in errors.
+"""
+
+from functools import partial
+from typing import Any, Dict, Optional
+
+import anyio
+
+from .bulk import MAX_CONCURRENCY, default_concurrency, fan_out
+from .pager import MAX_BYTES, MAX_RECORDS, fetch_all
+from .schemas import SEVERITIES
+
+STATUS_PATH = "/nextgen/appliance/status"
+LOCATIONS_PATH = "/vnms/dashboard/appliance/location"
+SYNC_PATH = "/vnms/dashboard/appliance/{uuid}/syncStatus"
+
+# Active alarms collected across pages; more sets alarmsTruncated
+ALARM_LIMIT = 10000
+# Appliances collected across pages; more sets statusTruncated
+STATUS_LIMIT = MAX_RECORDS
+REACHABLE = "REACHABLE"
+UNKNOWN_SEVERITY = "UNKNOWN"
+
+
+class FleetSnapshotError(ValueError):
+    """Raised when a snapshot filter is invalid or the status list fails."""
+
+
+def _severity_rank(severity: Optional[str]) -> int:
+    try:
+        return SEVERITIES.index(severity)
+    except ValueError:
+        return len(SEVERITIES)
+
+
+def _row(appliance: dict[str, Any], location: Optional[dict[str, Any]]) -> dict:
+    return {
+        "uuid": appliance.get("uuid"),
+        "name": appliance.get("name"),
+        "org": appliance.get("org"),
+        "site": location.get("site") if location else None,
+        "ping": appliance.get("pingStatus"),
+        "sync": appliance.get("syncStatus"),
+        "services": appliance.get("servicesStatus"),
+        "alarms": {},
+        "highestSeverity": None,
+        "pendingChanges": None,
+        "lastSync": None,
+    }
+
+
+async def _get_json(
+    backend: Any, url: str, headers: Optional[Dict[str, str]] = None
+) -> Any:
+    response = await backend.get(url, headers=headers)
+    if not 200 <= response.status_code < 300:
+        raise FleetSnapshotError(f"{url} returned {response.status_code}")
+    return response.json()
+
+
+async def fleet_snapshot(
+    backend: Any,
+    base_url: str,
+    org: Optional[str] = None,
+    down_only: bool = False,
+    min_severity: Optional[str] = None,
+    include_sync: bool = True,
+    concurrency: Optional[int] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> dict[str, Any]:
+    """
+    One joined row per appliance matching the filters. min_severity keeps
+    devices with an active alarm at least that severe.
+    """
+    if min_severity is not None:
+        min_severity = min_severity.upper()
+        if min_severity not in SEVERITIES:
+            raise FleetSnapshotError(
+                f"Unknown severity '{min_severity}': use one of {', '.join(SEVERITIES)}"
+            )
+    if concurrency is None:
+        concurrency = default_concurrency()
+    if not 1 <= concurrency <= MAX_CONCURRENCY:
+        raise FleetSnapshotError(
+            f"concurrency must be between 1 and {MAX_CONCURRENCY}: {concurrency}"
+        )
+
+    alarm_params = {"is_cleared": "false"}
+    if org:
+        alarm_params["org"] = org
+    sources = {
+        "status": partial(
+            fetch_all,
+            backend,
+            base_url,
+            "appliance_status",
+            max_records=STATUS_LIMIT,
+            max_bytes=MAX_BYTES,
+        ),
+        "locations": partial(_get_json, backend, f"{base_url}{LOCATIONS_PATH}"),
+        "alarms": partial(
+            fetch_all,
+            backend,
+            base_url,
+            "alarms",
+            alarm_params,
+            max_records=ALARM_LIMIT,
+            max_bytes=MAX_BYTES,
+        ),
+    }
+    bodies: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+
+    async def fetch(name: str) -> None:
+        try:
+            bodies[name] = await sources[name](headers=headers)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    async with anyio.create_task_group() as tg:
+        for name in sources:
+            tg.start_soon(fetch, name)
+    if "status" not in bodies:
+        raise FleetSnapshotError(f"Appliance status unavailable: {errors['status']}")
+
+    status = bodies["status"]
+    appliances = status.get("records", [])
+    locations = {
+        location.get("uuid"): location
+        for location in bodies.get("locations", {}).get("locations", [])
+    }
+    rows = {
+        appliance.get("uuid"): _row(appliance, locations.get(appliance.get("uuid")))
+        for appliance in appliances
+        if not org or appliance.get("org") == org
+    }
+
+    alarms = bodies.get("alarms", {})
+    uuid_by_name = {row["name"]: uuid for uuid, row in rows.items()}
+    for alarm in alarms.get("records", []):
+        uuid = alarm.get("deviceUuid")
+        row = rows.get(uuid) or rows.get(uuid_by_name.get(alarm.get("deviceName")))
+        if row is None:
+            continue
+        severity = alarm.get("severity") or UNKNOWN_SEVERITY
+        row["alarms"][severity] = row["alarms"].get(severity, 0) + 1
+        if _severity_rank(severity) < _severity_rank(row["highestSeverity"]):
+            row["highestSeverity"] = severity
+
+    selected = [
+        row
+        for row in rows.values()
+        if (not down_only or row["ping"] != REACHABLE)
+        and (
+            min_severity is None
+            or _severity_rank(row["highestSeverity"]) <= _severity_rank(min_severity)
+        )
+    ]
+
+    if include_sync and selected:
+        urls = {
+            row["uuid"]: f"{base_url}{SYNC_PATH.format(uuid=row['uuid'])}"
+            for row in selected
+        }
+        syncs, sync_errors = await fan_out(backend, urls, concurrency, headers)
+        for row in selected:
+            sync = syncs.get(row["uuid"])
+            if sync is not None:
+                row["sync"] = sync.get("syncStatus", row["sync"])
+                row["pendingChanges"] = sync.get("pendingChanges")
+                row["lastSync"] = sync.get("lastSync")
+        errors.update({f"sync:{uuid}": error for uuid, error in sync_errors.items()})
+
+    return {
+        "totalCount": len(selected),
+        "fleetSize": len(rows),
+        "alarmsTruncated": bool(alarms.get("truncated")),
+        "statusTruncated": bool(status.get("truncated")),
+        "devices": selected,
+        "errors": errors,
+    }
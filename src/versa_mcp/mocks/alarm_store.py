@@ -0,0 +1,343 @@
+"""
+Alarm Query Engine
+
+Evaluates the filter, sort and pagination params of the alarm list
+endpoints (/vnms/fault/alarms/page and /vnms/fault/alarms) against an
+in-process AlarmStore instead of returning the mock file unchanged.
+
+The store keeps alarms sorted by last change time and, for each of org,
+device name, severity, type and cleared flag, a posting list of positions
+in that order. A query picks the posting list for its filters, bisects it
+to the requested time window and touches only the rows it returns, so
+single-filter queries, time-ordered sorting and paging stay sublinear in
+the number of alarms. Multi-filter intersections are walked once from the
+most selective list and cached for the following pages.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+from .pagination import _parse_int
+
+# Query param -> alarm field for the indexed equality filters
+INDEXED_FILTERS = {
+    "org": "org",
+    "device_name": "deviceName",
+    "last_perceived_severity": "severity",
+    "type": "type",
+    "is_cleared": "isCleared",
+}
+
+_MAX_INTERSECTIONS = 64
+
+# Severity ranks, most severe highest, so the default desc order puts
+# CRITICAL first; unknown severities rank below WARNING
+SEVERITY_ORDER = {"CRITICAL": 3, "MAJOR": 2, "MINOR": 1, "WARNING": 0}
+
+# Accepted sort_column values -> alarm field ("" sorts by last change time)
+SORT_COLUMNS = {
+    "last_change": "",
+    "last_status_change": "",
+    "lastStatusChange": "",
+    "raised_time": "",
+    "raisedTime": "",
+    "severity": "severity",
+    "last_perceived_severity": "severity",
+    "device_name": "deviceName",
+    "deviceName": "deviceName",
+    "org": "org",
+    "type": "type",
+    "alarm_id": "alarmId",
+    "alarmId": "alarmId",
+}
+
+
+class AlarmQueryError(ValueError):
+    """Raised when alarm filter or sort params are invalid."""
+
+
+def change_time(alarm: Mapping[str, Any]) -> str:
+    """Get the last change timestamp of an alarm (ISO 8601, UTC)."""
+    return alarm.get("lastStatusChange") or alarm.get("raisedTime") or ""
+
+
+def _normalize(field: str, value: Any) -> Any:
+    """Normalize a stored or requested value for index lookups."""
+    if field == "isCleared":
+        if isinstance(value, bool):
+            return value
+        text = str(value).lower()
+        if text not in ("true", "false"):
+            raise AlarmQueryError(
+                f"Invalid is_cleared '{value}': must be true or false"
+            )
+        return text == "true"
+    if field == "severity":
+        return str(value).upper()
+    return value
+
+
+def _parse_time(name: str, value: Optional[str]) -> Optional[str]:
+    """Parse an ISO 8601 or epoch-milliseconds bound into an ISO string."""
+    if not value:
+        return None
+    if value.isdigit():
+        moment = datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise AlarmQueryError(
+            f"Invalid {name} '{value}': expected ISO 8601 or epoch ms"
+        )
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sort_key(field: str) -> Callable[[Mapping[str, Any]], Any]:
+    if field == "severity":
+        return lambda alarm: SEVERITY_ORDER.get(alarm.get("severity") or "", -1)
+    return lambda alarm: alarm.get(field) or ""
+
+
+class AlarmStore:
+    """
+    Indexed, read-only view over a list of alarms.
+
+    Usage:
+        store = AlarmStore(alarms)
+        total, page = store.query({"org": "GlobalRetail", "limit": "10"})
+    """
+
+    def __init__(self, alarms: Sequence[Mapping[str, Any]]):
+        self.source = alarms
+        self._alarms = sorted(alarms, key=change_time)
+        self._times = [change_time(alarm) for alarm in self._alarms]
+        self._index: dict[str, dict[Any, list[int]]] = {}
+        self._columns: dict[str, list[Any]] = {}
+        for field in INDEXED_FILTERS.values():
+            postings: dict[Any, list[int]] = {}
+            column: list[Any] = []
+            for position, alarm in enumerate(self._alarms):
+                key = _normalize(field, alarm[field]) if field in alarm else None
+                column.append(key)
+                if key is not None:
+                    postings.setdefault(key, []).append(position)
+            self._index[field] = postings
+            self._columns[field] = column
+        # Posting lists for multi-filter queries, so paging through one
+        # result set only pays for the intersection once
+        self._intersections: OrderedDict[tuple, list[int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._alarms)
+
+    def values(self, param: str) -> list[Any]:
+        """Get the distinct indexed values for a filter param."""
+        return list(self._index[INDEXED_FILTERS[param]])
+
+    def _postings(self, field: str, keys: frozenset) -> list[int]:
+        """Positions matching any of the given values of one field."""
+        lists = [self._index[field].get(key, []) for key in keys]
+        if len(lists) == 1:
+            return lists[0]
+        return list(heapq.merge(*lists))
+
+    def _matching(self, wanted: dict[str, frozenset]) -> Sequence[int]:
+        """Time-ordered positions matching every equality filter."""
+        if not wanted:
+            return range(len(self._alarms))
+        cache_key = tuple(sorted(wanted.items()))
+        cached = self._intersections.get(cache_key)
+        if cached is not None:
+            self._intersections.move_to_end(cache_key)
+            return cached
+
+        # Walk the most selective posting list, check the rest by column
+        lists = sorted(
+            ((self._postings(f, keys), f) for f, keys in wanted.items()),
+            key=lambda item: len(item[0]),
+        )
+        result = lists[0][0]
+        if len(lists) > 1:
+            columns = [(self._columns[f], wanted[f]) for _, f in lists[1:]]
+            result = [
+                position
+                for position in result
+                if all(column[position] in keys for column, keys in columns)
+            ]
+            self._intersections[cache_key] = result
+            if len(self._intersections) > _MAX_INTERSECTIONS:
+                self._intersections.popitem(last=False)
+        return result
+
+    def query(
+        self, params: Mapping[str, Any], default_limit: Optional[int] = None
+    ) -> tuple[int, list[Mapping[str, Any]]]:
+        """
+        Filter, sort and page alarms.
+        Returns (total_matching, page).
+        """
+        limit = _parse_int(params, "limit")
+        if limit is None:
+            limit = default_limit
+        offset = _parse_int(params, "offset") or 0
+
+        sort_column = params.get("sort_column") or "last_change"
+        if sort_column not in SORT_COLUMNS:
+            raise AlarmQueryError(
+                f"Invalid sort_column '{sort_column}': expected one of "
+                f"{', '.join(sorted(SORT_COLUMNS))}"
+            )
+        sort_order = (params.get("sort_order") or "desc").lower()
+        if sort_order not in ("asc", "desc"):
+            raise AlarmQueryError(
+                f"Invalid sort_order '{sort_order}': must be asc or desc"
+            )
+        descending = sort_order == "desc"
+        field = SORT_COLUMNS[sort_column]
+
+        # Equality filters; comma-separated values match any of them
+        wanted = {
+            f: frozenset(
+                _normalize(f, v.strip()) for v in str(params[p]).split(",") if v.strip()
+            )
+            for p, f in INDEXED_FILTERS.items()
+            if params.get(p)
+        }
+        values = self._matching(wanted)
+
+        # Time window as a range over the time-ordered positions
+        after = _parse_time("last_change_after", params.get("last_change_after"))
+        before = _parse_time("last_change_before", params.get("last_change_before"))
+        lo = bisect_right(self._times, after) if after else 0
+        hi = bisect_left(self._times, before) if before else len(self._times)
+        start, end = bisect_left(values, lo), bisect_left(values, hi)
+        end = max(start, end)
+
+        text = params.get("last_alarm_text")
+        if not text and field == "":
+            # Fast path: the window is already in time order
+            positions = _page_of(values, start, end, offset, limit, descending)
+            return end - start, [self._alarms[p] for p in positions]
+
+        candidates: Sequence[int] = values[start:end]
+        if text:
+            needle = text.lower()
+            candidates = [
+                position
+                for position in candidates
+                if needle in str(self._alarms[position].get("alarmText", "")).lower()
+            ]
+        if field == "":
+            positions = _page_of(
+                candidates, 0, len(candidates), offset, limit, descending
+            )
+            return len(candidates), [self._alarms[p] for p in positions]
+        return len(candidates), self._sorted_page(
+            candidates, field, descending, offset, limit
+        )
+
+    def _sorted_page(
+        self,
+        candidates: Sequence[int],
+        field: str,
+        descending: bool,
+        offset: int,
+        limit: Optional[int],
+    ) -> list[Mapping[str, Any]]:
+        """Order candidates by a non-time column, newest first within ties."""
+        key = _sort_key(field)
+        alarms = self._alarms
+
+        # Position is time order; flip it so ties always come newest first
+        tiebreak = 1 if descending else -1
+
+        def rank(position: int) -> tuple[Any, int]:
+            return key(alarms[position]), tiebreak * position
+
+        if limit is None:
+            ordered = sorted(candidates, key=rank, reverse=descending)
+            return [alarms[p] for p in ordered[offset:]]
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        ordered = pick(offset + limit, candidates, key=rank)
+        return [alarms[p] for p in ordered[offset:]]
+
+
+def _page_of(
+    values: Sequence[int],
+    start: int,
+    end: int,
+    offset: int,
+    limit: Optional[int],
+    descending: bool,
+) -> list[int]:
+    """Positions for one page of values[start:end], optionally reversed."""
+    count = max(0, end - start)
+    offset = min(offset, count)
+    size = count - offset if limit is None else min(limit, count - offset)
+    if descending:
+        first = end - 1 - offset
+        return [values[i] for i in range(first, first - size, -1)]
+    first = start + offset
+    return [values[i] for i in range(first, first + size)]
+
+
+# =============================================================================
+# Endpoint handlers
+# =============================================================================
+
+# Params that select, order or page alarms; anything else is ignored
+QUERY_PARAMS = frozenset(
+    [*INDEXED_FILTERS, "last_change_after", "last_change_before"]
+    + ["last_alarm_text", "sort_column", "sort_order", "limit", "offset"]
+)
+
+# Stores by id() of the indexed list; bounded so replaced corpora are released
+_stores: dict[int, AlarmStore] = {}
+_MAX_STORES = 8
+
+
+def get_store(alarms: Sequence[Mapping[str, Any]]) -> AlarmStore:
+    """Get the store indexing an alarm list, building it on first use."""
+    store = _stores.get(id(alarms))
+    if store is None or store.source is not alarms:
+        store = AlarmStore(alarms)
+        if len(_stores) >= _MAX_STORES:
+            _stores.pop(next(iter(_stores)))
+        _stores[id(alarms)] = store
+    return store
+
+
+def query_alarm_page(data: Any, params: Mapping[str, Any]) -> Any:
+    """Handler for /vnms/fault/alarms/page: filter, sort and page."""
+    if not QUERY_PARAMS.intersection(k for k, v in params.items() if v):
+        return data
+    default_limit = data.get("limit")
+    total, alarms = get_store(data["alarms"]).query(params, default_limit)
+    offset = _parse_int(params, "offset") or 0
+    limit = _parse_int(params, "limit")
+    if limit is None:
+        limit = default_limit if default_limit is not None else len(alarms)
+    page = dict(data)
+    page["alarms"] = alarms
+    page["totalCount"] = total
+    page["offset"] = offset
+    page["limit"] = limit
+    page["hasMore"] = offset + len(alarms) < total
+    return page
+
+
+def query_filtered_alarms(data: Any, params: Mapping[str, Any]) -> Any:
+    """Handler for /vnms/fault/alarms: filter and sort, no paging."""
+    if not QUERY_PARAMS.intersection(k for k, v in params.items() if v):
+        return data
+    total, alarms = get_store(data["alarms"]).query(params)
+    result = dict(data)
+    result["alarms"] = alarms
+    result["totalCount"] = total
+    return result
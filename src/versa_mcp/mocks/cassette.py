@@ -0,0 +1,296 @@
+"""
+Record and Replay Cassettes
+
+Captures real Director traffic and replays it, so performance tests run on
+production-shaped payloads and latencies without a Director.
+
+CassetteRecorder wraps any httpx.AsyncClient-compatible client (e.g. one
+pointed at a real Director) and records each request's method, path,
+params, status, body and observed latency. CassetteClient replays them as a
+drop-in for MockAsyncClient, keyed on the full normalized request (method,
+path and sorted non-empty params), so param-specific variants such as
+different pages are served as recorded, with their original timing.
+
+A cassette is a directory:
+    cassette.jsonl   one recorded interaction per line
+    <mock files>     one successful GET body per endpoint (an unparameterized
+                     one if recorded), written to its ENDPOINT_TO_MOCK path,
+                     so the directory also works as MOCK_CORPUS_DIR
+
+Usage:
+    async with CassetteRecorder(httpx.AsyncClient(...), "cassettes/prod") as c:
+        await c.get(f"{director_url}/vnms/fault/alarms/page", params=params)
+
+    async with CassetteClient("cassettes/prod") as client:
+        response = await client.get(url, params=params)
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import anyio
+
+from .endpoint_map import ENDPOINT_TO_MOCK, match_endpoint
+from .mock_client import MockResponse
+
+CASSETTE_FILE = "cassette.jsonl"
+
+
+class CassetteError(ValueError):
+    """Raised when a cassette directory is missing or malformed."""
+
+
+def _param_items(params: Optional[Mapping[str, Any]]) -> list[tuple[str, str]]:
+    items = []
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for v in values:
+            if v is None or v == "":
+                continue
+            if isinstance(v, bool):
+                v = "true" if v else "false"
+            items.append((str(name), str(v)))
+    return items
+
+
+def request_key(
+    method: str, url: str, params: Optional[Mapping[str, Any]] = None
+) -> str:
+    """
+    Normalize a request to the key recordings are matched on.
+    Host, header and param order, and empty params do not affect the key.
+    """
+    parsed = urlparse(url)
+    path = parsed.path.rstrip("/") or "/"
+    query = urlencode(sorted(_param_items(params) + parse_qsl(parsed.query)))
+    return f"{method.upper()} {path}?{query}" if query else f"{method.upper()} {path}"
+
+
+def _body_of(response: Any) -> Any:
+    """Decoded JSON body of a response, or its text if it is not JSON."""
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+class CassetteRecorder:
+    """
+    Wraps an async HTTP client and records every call it makes.
+
+    Interactions are appended to cassette.jsonl as they complete; the mock
+    files are written on close.
+    """
+
+    def __init__(self, client: Any, path: Union[str, Path]):
+        self.client = client
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.path / CASSETTE_FILE, "a", encoding="utf-8")
+        self._defaults: dict[str, tuple[bool, Any]] = {}
+        self.recorded = 0
+
+    async def __aenter__(self):
+        if hasattr(self.client, "__aenter__"):
+            await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if hasattr(self.client, "__aexit__"):
+                await self.client.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
+
+    async def _record(self, method: str, url: str, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        response = await getattr(self.client, method.lower())(url, **kwargs)
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        params = kwargs.get("params")
+        body = _body_of(response)
+        interaction = {
+            "key": request_key(method, url, params),
+            "method": method.upper(),
+            "path": urlparse(url).path,
+            "params": dict(sorted(_param_items(params))),
+            "status": response.status_code,
+            "latency_ms": round(latency_ms, 3),
+            "body": body,
+        }
+        self._log.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+        self._log.flush()
+        self.recorded += 1
+        if method.upper() == "GET" and response.status_code == 200:
+            self._remember_default(interaction)
+        return response
+
+    def _remember_default(self, interaction: dict[str, Any]) -> None:
+        """Keep the body to serve as the endpoint's plain mock file."""
+        route = match_endpoint(interaction["path"])
+        if route is None or route.pattern not in ENDPOINT_TO_MOCK:
+            return
+        mock_file = ENDPOINT_TO_MOCK[route.pattern]
+        unparameterized = not interaction["params"]
+        # Prefer a recording without params: it is the endpoint's full answer
+        current = self._defaults.get(mock_file)
+        if current is None or (unparameterized and not current[0]):
+            self._defaults[mock_file] = (unparameterized, interaction["body"])
+
+    def close(self) -> None:
+        """Flush the log and write the mock files."""
+        if self._log.closed:
+            return
+        self._log.close()
+        for mock_file, (_, body) in self._defaults.items():
+            target = self.path / mock_file
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(body, indent=2), encoding="utf-8")
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Forward a GET and record it."""
+        return await self._record("GET", url, headers=headers, params=params, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Forward a POST and record it."""
+        return await self._record("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Any:
+        """Forward a PUT and record it."""
+        return await self._record("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """Forward a DELETE and record it."""
+        return await self._record("DELETE", url, **kwargs)
+
+
+class Cassette:
+    """Recorded interactions of a cassette directory, grouped by request key."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        log = self.path / CASSETTE_FILE
+        self.interactions: dict[str, list[dict[str, Any]]] = {}
+        try:
+            with open(log, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        interaction = json.loads(line)
+                        key = interaction["key"]
+                    except (ValueError, KeyError, TypeError) as e:
+                        raise CassetteError(
+                            f"{log}:{line_number}: not a recorded interaction: {e}"
+                        ) from e
+                    self.interactions.setdefault(key, []).append(interaction)
+        except OSError as e:
+            raise CassetteError(f"Cannot read cassette {log}: {e}") from e
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.interactions.values())
+
+
+class CassetteClient:
+    """
+    Drop-in replacement for MockAsyncClient that replays a cassette.
+
+    A request replays the recordings of its exact key in recorded order,
+    cycling when it is made more often than it was recorded. speed scales
+    the recorded latency (1.0 original timing, 0 no delay). Requests that
+    were never recorded go to fallback if given, else get a 500 response.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Path, Cassette],
+        speed: float = 1.0,
+        fallback: Optional[Any] = None,
+        **kwargs: Any,
+    ):
+        self.cassette = (
+            cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        )
+        self.speed = speed
+        self.fallback = fallback
+        self._plays: dict[str, int] = {}
+        self.misses = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def _replay(
+        self, method: str, url: str, params: Optional[Dict[str, Any]], **kwargs: Any
+    ) -> Any:
+        key = request_key(method, url, params)
+        recordings = self.cassette.interactions.get(key)
+        if not recordings:
+            self.misses += 1
+            if self.fallback is not None:
+                call = getattr(self.fallback, method.lower())
+                return await call(url, params=params, **kwargs)
+            error = {
+                "error": "No recording for request",
+                "request": key,
+                "status": "NOT_RECORDED",
+            }
+            return MockResponse(error, status_code=500)
+
+        play = self._plays.get(key, 0)
+        self._plays[key] = play + 1
+        interaction = recordings[play % len(recordings)]
+        delay = interaction.get("latency_ms", 0) / 1000 * self.speed
+        if delay > 0:
+            await anyio.sleep(delay)
+        return MockResponse(interaction["body"], status_code=interaction["status"])
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Replay a recorded GET."""
+        return await self._replay("GET", url, params)
+
+    async def post(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+    ) -> Any:
+        """Replay a recorded POST."""
+        return await self._replay("POST", url, params, json=json)
+
+    async def put(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Replay a recorded PUT."""
+        return await self._replay("PUT", url, params, json=json)
+
+    async def delete(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Replay a recorded DELETE."""
+        return await self._replay("DELETE", url, params)
@@ -0,0 +1,302 @@
+"""
+Mock Corpus
+
+Holds the JSON mock files under mocks/ in memory so a GET does not pay disk
+I/O and a full JSON parse on every call. By default every file is read once
+when the corpus is created; lazy mode defers each file to its first access.
+Toggle lazy mode with MOCK_CORPUS_LAZY=true environment variable, and
+serve a different corpus (e.g. one written by generator.py) with
+MOCK_CORPUS_DIR=/path/to/corpus, or a memory-mapped pack file (see
+packed.py) with MOCK_CORPUS_PACK=/path/to/corpus.pack. Set
+MOCK_CORPUS_WATCH=true to pick up edited files without a restart (see
+watcher.py).
+
+Parsed data is shared between all callers and must be treated as read-only.
+Reloaded files replace their entries rather than mutating them, so a request
+holding an entry keeps a consistent view while a reload happens.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+MOCKS_DIR = Path(__file__).parent
+
+
+def find_list_key(data: Any) -> Optional[str]:
+    """Get the name of the list field of a pageable payload, or None."""
+    if not isinstance(data, dict) or "totalCount" not in data:
+        return None
+    list_keys = [key for key, value in data.items() if isinstance(value, list)]
+    return list_keys[0] if len(list_keys) == 1 else None
+
+
+class CorpusEntry:
+    """
+    A single mock file: its raw bytes and the decoded JSON document.
+
+    List payloads (see find_list_key) can also be read a page at
+    a time through count, envelope() and records(), which corpus formats
+    that store records separately serve without decoding the whole file.
+    """
+
+    def __init__(self, path: str, raw: bytes, data: Any):
+        self.path = path
+        self.raw = raw
+        self.data = data
+
+    @cached_property
+    def list_key(self) -> Optional[str]:
+        """Name of the list field if the payload is pageable, else None."""
+        return find_list_key(self.data)
+
+    @property
+    def count(self) -> int:
+        """Number of records in the list field."""
+        return len(self.data[self.list_key]) if self.list_key else 0
+
+    def envelope(self) -> dict[str, Any]:
+        """Shallow copy of the document, in key order, for building a page."""
+        return dict(self.data)
+
+    def records(self, start: int, stop: int) -> list[Any]:
+        """Records start:stop of the list field."""
+        return self.data[self.list_key][start:stop]
+
+
+class MockCorpus:
+    """
+    Read-only, in-memory view of the mock JSON files.
+
+    Usage:
+        corpus = MockCorpus()
+        data = corpus.get("alarm/get_alarm_types.json")
+    """
+
+    def __init__(self, root: Path = MOCKS_DIR, lazy: bool = False):
+        self.root = Path(root)
+        self.lazy = lazy
+        self._entries: dict[str, CorpusEntry] = {}
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self._listeners: list[Callable[[frozenset[str]], None]] = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._load_seconds = 0.0
+        self._disk = self._scan()
+        self._known = frozenset(self._disk)
+        if not lazy:
+            self.preload()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Get (mtime_ns, size) of every JSON file under root."""
+        stamps = {}
+        for path in self.root.rglob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            relative_path = path.relative_to(self.root).as_posix()
+            stamps[relative_path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def _read(self, relative_path: str) -> tuple[CorpusEntry, tuple[int, int], float]:
+        """
+        Read and decode one file from disk. Returns the entry, the file's
+        stamp and the seconds taken, for the caller to record under the lock.
+        """
+        start = time.perf_counter()
+        path = self.root / relative_path
+        # Stamp before reading so a write racing the read is seen next refresh
+        stat = path.stat()
+        raw = path.read_bytes()
+        entry = CorpusEntry(relative_path, raw, json.loads(raw))
+        return entry, (stat.st_mtime_ns, stat.st_size), time.perf_counter() - start
+
+    def _load(self, relative_path: str) -> CorpusEntry:
+        """Read one file and record it; the caller holds the lock."""
+        entry, stamp, seconds = self._read(relative_path)
+        self._entries[relative_path] = entry
+        self._stamps[relative_path] = stamp
+        self._load_seconds += seconds
+        return entry
+
+    def preload(self) -> None:
+        """Load every file not already in memory."""
+        with self._lock:
+            for relative_path in sorted(self._known - self._entries.keys()):
+                self._load(relative_path)
+
+    def entry(self, relative_path: str) -> Optional[CorpusEntry]:
+        """Get the entry for a mock file, or None if it does not exist."""
+        entry = self._entries.get(relative_path)
+        if entry is not None:
+            self._hits += 1
+            return entry
+        if relative_path not in self._known:
+            self._misses += 1
+            return None
+        with self._lock:
+            entry = self._entries.get(relative_path)
+            if entry is None:
+                entry = self._load(relative_path)
+        self._misses += 1
+        return entry
+
+    def get(self, relative_path: str) -> Any:
+        """Get decoded data for a mock file, or None if it does not exist."""
+        entry = self.entry(relative_path)
+        return entry.data if entry is not None else None
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self._known
+
+    def source_path(self, relative_path: str) -> Path:
+        """Get the file on disk that a mock file is read from."""
+        return self.root / relative_path
+
+    def subscribe(self, listener: Callable[[frozenset[str]], None]) -> None:
+        """Call listener with the changed paths after every refresh that changes any."""
+        self._listeners.append(listener)
+
+    def refresh(self) -> frozenset[str]:
+        """
+        Pick up files added, removed or changed on disk since they were read.
+
+        Only changed files that are already loaded (and, unless lazy, added
+        files) are read, outside the lock; the new entries and their stamps
+        are then recorded under the lock, swapping in a new mapping. A file
+        that fails to parse (e.g. mid-write) keeps its old entry and is
+        retried on the next refresh. Returns the changed paths, including
+        unloaded files that changed on disk.
+        """
+        on_disk = self._scan()
+        added = on_disk.keys() - self._known
+        removed = self._known - on_disk.keys()
+        unloaded = {
+            relative_path
+            for relative_path in on_disk.keys() & self._disk.keys()
+            if relative_path not in self._entries
+            and on_disk[relative_path] != self._disk[relative_path]
+        }
+        stale = [
+            relative_path
+            for relative_path in self._entries.keys() & on_disk.keys()
+            if on_disk[relative_path] != self._stamps.get(relative_path)
+        ]
+        if not self.lazy:
+            stale.extend(added)
+
+        reloaded: dict[str, tuple[CorpusEntry, tuple[int, int], float]] = {}
+        for relative_path in stale:
+            try:
+                reloaded[relative_path] = self._read(relative_path)
+            except (OSError, ValueError):
+                continue
+
+        changed = frozenset(added | removed | unloaded | reloaded.keys())
+        with self._lock:
+            self._disk = on_disk
+            if not changed:
+                return changed
+            entries = {k: v for k, v in self._entries.items() if k not in removed}
+            for relative_path, (entry, stamp, seconds) in reloaded.items():
+                entries[relative_path] = entry
+                self._stamps[relative_path] = stamp
+                self._load_seconds += seconds
+            self._entries = entries
+            self._known = frozenset(on_disk)
+            for relative_path in removed:
+                self._stamps.pop(relative_path, None)
+            self._reloads += len(reloaded)
+        for listener in list(self._listeners):
+            listener(changed)
+        return changed
+
+    @property
+    def entries(self) -> Mapping[str, CorpusEntry]:
+        """Read-only mapping of the files loaded so far."""
+        return MappingProxyType(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Get corpus counters for debugging and load tests."""
+        return {
+            "lazy": self.lazy,
+            "files_known": len(self._known),
+            "files_loaded": len(self._entries),
+            "bytes_loaded": sum(len(e.raw) for e in self._entries.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "reloads": self._reloads,
+            "load_seconds": round(self._load_seconds, 6),
+        }
+
+
+_corpus: Optional[MockCorpus] = None
+_corpus_lock = threading.Lock()
+_corpus_listeners: list[Callable[[frozenset[str]], None]] = []
+
+
+def corpus_root() -> Path:
+    """Get the directory or pack file the process-wide corpus is read from."""
+    if _corpus is not None:
+        return _corpus.root
+    if os.environ.get("MOCK_CORPUS_PACK"):
+        return Path(os.environ["MOCK_CORPUS_PACK"])
+    return Path(os.environ.get("MOCK_CORPUS_DIR") or MOCKS_DIR)
+
+
+def corpus_source_path(relative_path: str) -> Path:
+    """
+    Get the file on disk a mock file of the process-wide corpus is read
+    from, without creating the corpus (and so without preloading it).
+    """
+    if _corpus is not None:
+        return _corpus.source_path(relative_path)
+    if os.environ.get("MOCK_CORPUS_PACK"):
+        return corpus_root()
+    return corpus_root() / relative_path
+
+
+def subscribe_corpus(listener: Callable[[frozenset[str]], None]) -> None:
+    """Subscribe listener to the process-wide corpus, now or once it is created."""
+    with _corpus_lock:
+        if _corpus is None:
+            _corpus_listeners.append(listener)
+            return
+    _corpus.subscribe(listener)
+
+
+def get_corpus() -> MockCorpus:
+    """Get the process-wide corpus, creating it on first call."""
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None and os.environ.get("MOCK_CORPUS_PACK"):
+                from .packed import PackedCorpus
+
+                _corpus = PackedCorpus(os.environ["MOCK_CORPUS_PACK"])
+            elif _corpus is None:
+                lazy = os.environ.get("MOCK_CORPUS_LAZY", "").lower() == "true"
+                root = os.environ.get("MOCK_CORPUS_DIR") or MOCKS_DIR
+                _corpus = MockCorpus(Path(root), lazy=lazy)
+                if os.environ.get("MOCK_CORPUS_WATCH", "").lower() == "true":
+                    from .watcher import CorpusWatcher
+
+                    CorpusWatcher(_corpus).start()
+            if _corpus is not None and _corpus_listeners:
+                for listener in _corpus_listeners:
+                    _corpus.subscribe(listener)
+                _corpus_listeners.clear()
+    return _corpus
+
+
+def get_corpus_stats() -> dict[str, Any]:
+    """Get counters for the process-wide corpus."""
+    return get_corpus().stats()
@@ -3,8 +3,13 @@ Endpoint to Mock File Mapping
 
 Maps API URL patterns to their corresponding mock JSON files.
 Supports path parameters like {id}, {deviceName}, etc.
+
+Patterns are compiled once at import into a segment trie, so resolving a
+path to its pattern and path parameters is a single walk over its segments.
 """
 
+from typing import NamedTuple, Optional
+
 ENDPOINT_TO_MOCK = {
     # ============================================
     # APPLIANCE APIs (23 endpoints)
@@ -97,37 +102,106 @@ ENDPOINT_TO_MOCK = {
 }
 
 
-def normalize_endpoint(url: str, base_url: str) -> str:
+class RouteMatch(NamedTuple):
+    """A resolved endpoint: the matched pattern and its path parameter values."""
+
+    pattern: str
+    params: dict[str, str]
+
+
+class _Node:
+    """One path segment in the route trie."""
+
+    __slots__ = ("static", "param", "pattern", "param_names")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        self.param: Optional[_Node] = None
+        self.pattern: Optional[str] = None
+        self.param_names: tuple[str, ...] = ()
+
+
+class Router:
     """
-    Normalize a full URL to an endpoint pattern.
-    Strips the base URL and converts path parameters to placeholders.
+    Segment trie over endpoint patterns.
+
+    Literal segments take precedence over {param} segments at each level,
+    falling back to the parameter branch when the literal branch dead-ends.
     """
-    import re
 
-    # Remove base URL
-    endpoint = url.replace(base_url, "")
+    def __init__(self, patterns=()):
+        self._root = _Node()
+        self._exact: dict[str, str] = {}
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        """Compile a pattern into the trie."""
+        node = self._root
+        names: list[str] = []
+        for segment in pattern.split("/"):
+            if segment.startswith("{") and segment.endswith("}"):
+                names.append(segment[1:-1])
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        node.pattern = pattern
+        node.param_names = tuple(names)
+        if not names:
+            self._exact[pattern] = pattern
+
+    def match(self, path: str) -> Optional[RouteMatch]:
+        """Resolve a path to its pattern and path params, or None."""
+        if path in self._exact:
+            return RouteMatch(path, {})
+        values: list[str] = []
+        node = self._walk(self._root, path.split("/"), 0, values)
+        if node is None or node.pattern is None:
+            return None
+        return RouteMatch(node.pattern, dict(zip(node.param_names, values)))
+
+    def _walk(
+        self, node: _Node, segments: list[str], index: int, values: list[str]
+    ) -> Optional[_Node]:
+        if index == len(segments):
+            return node if node.pattern is not None else None
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, values)
+            if found is not None:
+                return found
+        if node.param is not None and segment:
+            values.append(segment)
+            found = self._walk(node.param, segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
 
-    # Try exact match first
-    if endpoint in ENDPOINT_TO_MOCK:
-        return endpoint
 
-    # Try to match with path parameters
-    # Sort by specificity (more slashes = more specific)
-    patterns = sorted(ENDPOINT_TO_MOCK.keys(), key=lambda x: -x.count("/"))
+ROUTER = Router(ENDPOINT_TO_MOCK)
 
-    for pattern in patterns:
-        # Convert pattern to regex
-        regex_pattern = pattern
-        # Replace {param} with a capture group
-        regex_pattern = re.sub(r"\{[^}]+\}", r"[^/]+", regex_pattern)
-        regex_pattern = f"^{regex_pattern}$"
 
-        if re.match(regex_pattern, endpoint):
-            return pattern
+def match_endpoint(endpoint: str) -> Optional[RouteMatch]:
+    """Resolve an endpoint path to its pattern and path params, or None."""
+    return ROUTER.match(endpoint)
+
+
+def normalize_endpoint(url: str, base_url: str) -> str:
+    """
+    Normalize a full URL to an endpoint pattern.
+    Strips the base URL and converts path parameters to placeholders.
+    """
+    # Remove base URL
+    endpoint = url.replace(base_url, "")
 
-    return endpoint
+    route = ROUTER.match(endpoint)
+    return route.pattern if route is not None else endpoint
 
 
-def get_mock_file(endpoint: str) -> str:
-    """Get the mock file path for an endpoint pattern."""
+def get_mock_file(endpoint: str) -> Optional[str]:
+    """Get the mock file path for an endpoint pattern, or None if unmapped."""
     return ENDPOINT_TO_MOCK.get(endpoint)
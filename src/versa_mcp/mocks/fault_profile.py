@@ -0,0 +1,249 @@
+"""
+Mock Latency and Fault Profiles
+
+Makes MockAsyncClient behave like a real Director under load: per-endpoint
+latency distributions, random 5xx errors, timeouts and periodic 5xx bursts,
+all read from a profile so capacity and timeout behaviour can be measured
+without a lab Director. Latency is awaited, never slept in a thread, so the
+event loop keeps serving other requests.
+
+Select a profile with MOCK_PROFILE=/path/to/profile.json, or a built-in name
+from PROFILES (e.g. MOCK_PROFILE=director). Without it the mock answers
+instantly, as before.
+
+Profile format (endpoint keys are patterns from endpoint_map.py):
+    {
+      "seed": 1,
+      "default": {"latency": {"distribution": "lognormal",
+                              "median_ms": 40, "p99_ms": 250}},
+      "endpoints": {
+        "/vnms/fault/alarms/page": {
+          "latency": {"distribution": "lognormal",
+                      "median_ms": 600, "p99_ms": 4000},
+          "error_rate": 0.01, "error_status": 503,
+          "timeout_rate": 0.005, "timeout_s": 30,
+          "burst": {"every_s": 300, "duration_s": 10, "status": 502}
+        }
+      }
+    }
+
+Latency distributions: fixed (ms), uniform (min_ms, max_ms) and lognormal
+(median_ms, p99_ms).
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Optional, Union
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z_99 = 2.3263
+
+PROFILES: dict[str, dict[str, Any]] = {
+    "none": {},
+    # Typical production Director: most calls well under a second, alarm
+    # pages slow and occasionally failing
+    "director": {
+        "seed": 0,
+        "default": {
+            "latency": {"distribution": "lognormal", "median_ms": 40, "p99_ms": 250}
+        },
+        "endpoints": {
+            "/vnms/fault/alarms/page": {
+                "latency": {
+                    "distribution": "lognormal",
+                    "median_ms": 600,
+                    "p99_ms": 4000,
+                },
+                "error_rate": 0.01,
+                "error_status": 503,
+            },
+            "/vnms/fault/alarms": {
+                "latency": {
+                    "distribution": "lognormal",
+                    "median_ms": 300,
+                    "p99_ms": 2000,
+                },
+            },
+        },
+    },
+}
+
+
+class FaultProfileError(ValueError):
+    """Raised when a profile file is missing or malformed."""
+
+
+class MockTimeoutError(TimeoutError):
+    """Raised by MockAsyncClient when an injected or slow call times out."""
+
+
+class Injection(NamedTuple):
+    """What to do to one request: wait latency_s, then fail or serve it."""
+
+    latency_s: float
+    status: Optional[int] = None
+    timeout: bool = False
+
+
+def _number(config: Mapping[str, Any], key: str, default: Any = None) -> float:
+    value = config.get(key, default)
+    if not isinstance(value, (int, float)) or value < 0:
+        raise FaultProfileError(f"'{key}' must be a non-negative number: {value!r}")
+    return float(value)
+
+
+def _status(config: Mapping[str, Any], key: str, default: int) -> int:
+    value = config.get(key, default)
+    try:
+        if HTTPStatus(value) >= 400:
+            return value
+    except ValueError:
+        pass
+    raise FaultProfileError(f"'{key}' must be a 4xx or 5xx status: {value!r}")
+
+
+class Latency:
+    """A latency distribution, sampled in seconds."""
+
+    def __init__(self, config: Optional[Mapping[str, Any]]):
+        config = config or {"distribution": "fixed", "ms": 0}
+        self.distribution = config.get("distribution", "fixed")
+        if self.distribution == "fixed":
+            self._fixed = _number(config, "ms", 0) / 1000
+        elif self.distribution == "uniform":
+            self._low = _number(config, "min_ms") / 1000
+            self._high = _number(config, "max_ms") / 1000
+            if self._high < self._low:
+                raise FaultProfileError("uniform latency needs min_ms <= max_ms")
+        elif self.distribution == "lognormal":
+            median = _number(config, "median_ms") / 1000
+            p99 = _number(config, "p99_ms") / 1000
+            if not 0 < median <= p99:
+                raise FaultProfileError(
+                    "lognormal latency needs 0 < median_ms <= p99_ms"
+                )
+            self._mu = math.log(median)
+            self._sigma = math.log(p99 / median) / _Z_99
+        else:
+            raise FaultProfileError(
+                f"Unknown latency distribution '{self.distribution}'"
+            )
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "fixed":
+            return self._fixed
+        if self.distribution == "uniform":
+            return rng.uniform(self._low, self._high)
+        return rng.lognormvariate(self._mu, self._sigma)
+
+
+class EndpointFaults:
+    """Latency, error, timeout and burst settings for one endpoint."""
+
+    def __init__(self, config: Mapping[str, Any]):
+        self.latency = Latency(config.get("latency"))
+        self.error_rate = _number(config, "error_rate", 0)
+        self.error_status = _status(config, "error_status", 503)
+        self.timeout_rate = _number(config, "timeout_rate", 0)
+        self.timeout_s = _number(config, "timeout_s", 30)
+        if self.error_rate + self.timeout_rate > 1:
+            raise FaultProfileError("error_rate + timeout_rate must not exceed 1")
+        burst = config.get("burst")
+        self.burst_every = _number(burst, "every_s") if burst else 0.0
+        self.burst_duration = _number(burst, "duration_s") if burst else 0.0
+        self.burst_offset = _number(burst, "offset_s", 0) if burst else 0.0
+        self.burst_status = _status(burst, "status", 502) if burst else 0
+
+    def in_burst(self, elapsed: float) -> bool:
+        """Whether elapsed seconds since the profile started fall in a burst."""
+        if not self.burst_every:
+            return False
+        phase = (elapsed - self.burst_offset) % self.burst_every
+        return elapsed >= self.burst_offset and phase < self.burst_duration
+
+
+class FaultProfile:
+    """
+    Per-endpoint fault settings with a seeded random source.
+
+    Usage:
+        profile = FaultProfile.load("profile.json")
+        injection = profile.sample("/vnms/fault/alarms/page")
+    """
+
+    def __init__(self, config: Mapping[str, Any], clock=time.monotonic):
+        if not isinstance(config, Mapping):
+            raise FaultProfileError("A profile must be a JSON object")
+        self.default = EndpointFaults(config.get("default") or {})
+        self.endpoints = {
+            pattern: EndpointFaults(endpoint_config)
+            for pattern, endpoint_config in (config.get("endpoints") or {}).items()
+        }
+        self._rng = random.Random(config.get("seed"))
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._started = clock()
+        self._counts = {"requests": 0, "errors": 0, "timeouts": 0, "bursts": 0}
+        self._latency_s = 0.0
+
+    @classmethod
+    def load(cls, name_or_path: Union[str, Path]) -> "FaultProfile":
+        """Load a built-in profile by name, or a profile JSON file."""
+        if str(name_or_path) in PROFILES:
+            return cls(PROFILES[str(name_or_path)])
+        try:
+            with open(name_or_path, encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise FaultProfileError(f"Cannot load profile {name_or_path}: {e}") from e
+        return cls(config)
+
+    def sample(self, pattern: Optional[str]) -> Injection:
+        """Draw the injection for one request to an endpoint pattern."""
+        faults = self.endpoints.get(pattern or "", self.default)
+        with self._lock:
+            self._counts["requests"] += 1
+            latency = faults.latency.sample(self._rng)
+            if faults.in_burst(self._clock() - self._started):
+                self._counts["bursts"] += 1
+                injection = Injection(latency, faults.burst_status)
+            else:
+                roll = self._rng.random()
+                if roll < faults.timeout_rate:
+                    self._counts["timeouts"] += 1
+                    injection = Injection(faults.timeout_s, timeout=True)
+                elif roll < faults.timeout_rate + faults.error_rate:
+                    self._counts["errors"] += 1
+                    injection = Injection(latency, faults.error_status)
+                else:
+                    injection = Injection(latency)
+            self._latency_s += injection.latency_s
+        return injection
+
+    def stats(self) -> dict[str, Any]:
+        """Get injection counters for debugging and load tests."""
+        return {**self._counts, "latency_s": round(self._latency_s, 6)}
+
+
+_profile: Optional[FaultProfile] = None
+_profile_loaded = False
+_profile_lock = threading.Lock()
+
+
+def get_profile() -> Optional[FaultProfile]:
+    """Get the process-wide profile from MOCK_PROFILE, or None if unset."""
+    global _profile, _profile_loaded
+    if not _profile_loaded:
+        with _profile_lock:
+            if not _profile_loaded:
+                name_or_path = os.environ.get("MOCK_PROFILE")
+                if name_or_path and name_or_path != "none":
+                    _profile = FaultProfile.load(name_or_path)
+                _profile_loaded = True
+    return _profile
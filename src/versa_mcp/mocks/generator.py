@@ -0,0 +1,474 @@
+"""
+Synthetic Fleet Generator
+
+Writes a complete mock corpus for a fleet of N appliances so scaling
+benchmarks can run against thousands of branches instead of the shipped
+few dozen. Output is deterministic for a given seed.
+
+The shipped corpus is copied first, then the fleet-sized list files are
+regenerated. Shipped records are kept as the head of every list so the
+single-object mocks (dc-east-001, DC-Controllers, Enterprise-Branch-Gold...)
+stay valid, and every generated group, alarm, audit entry and asset refers
+to an appliance in the generated fleet. The result indexes cleanly with
+id_registry and validates against the response models in schemas.py.
+
+Usage:
+    python -m versa_mcp.mocks.generator OUTPUT_DIR --appliances 10000
+    MOCK_CORPUS_DIR=OUTPUT_DIR uv run versa-mcp
+"""
+
+import argparse
+import json
+import random
+import shutil
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from .corpus import MOCKS_DIR
+
+# Fleet-sized list files: path -> list field
+APPLIANCE_LISTS = {
+    "appliance/get_all_appliance_status.json": "appliances",
+    "appliance/get_all_appliances_lite.json": "appliances",
+    "appliance/get_all_appliances_liteview.json": "appliances",
+    "appliance/get_all_appliances_basic_details.json": "appliances",
+    "appliance/get_all_appliances_by_type_and_tags.json": "appliances",
+    "appliance/get_appliance_locations.json": "locations",
+    "appliance/get_all_appliance_names.json": "names",
+    "appliance/search_appliance_by_name.json": "appliances",
+}
+SEARCH_FIELDS = ("uuid", "name", "org", "type", "model", "status", "site")
+
+ORGS = ["GlobalRetail", "AcmeBank", "NorthwindHealth", "ContosoLogistics"]
+MODELS = ["FlexVNF-100", "FlexVNF-200", "FlexVNF-500", "CSG-1000"]
+VERSIONS = ["22.1.2", "22.1.3", "23.1.0"]
+REGIONS = ["Northeast", "Southeast", "Midwest", "Southwest", "West"]
+STATUS_WEIGHTS = {"UP": 90, "DEGRADED": 7, "DOWN": 3}
+SYNC_WEIGHTS = {"IN_SYNC": 94, "OUT_OF_SYNC": 5, "PENDING": 1}
+SEVERITY_WEIGHTS = {"CRITICAL": 10, "MAJOR": 25, "MINOR": 35, "WARNING": 30}
+ALARM_TYPES = {
+    "LINK_DOWN": ("wan-link/Primary", "WAN circuit failure"),
+    "DEVICE_UNREACHABLE": ("system", "Complete connectivity loss"),
+    "HIGH_CPU": ("system", "CPU utilization above threshold"),
+    "HIGH_LATENCY": ("sla-policy/Critical-Apps", "SLA latency exceeded"),
+    "TUNNEL_FLAP": ("ipsec-tunnel/to-Hub", "IPsec tunnel instability"),
+    "CERT_EXPIRY_WARNING": ("certificate/ipsec-identity", "Certificate expiring"),
+    "CONFIG_DRIFT": ("software", "Running config differs from template"),
+}
+AUDIT_ACTIONS = {
+    "CONFIG_CHANGE": "Updated QoS policy",
+    "DEPLOY_TEMPLATE": "Deployed template",
+    "DEVICE_REBOOT": "Rebooted device",
+    "POLICY_UPDATE": "Updated firewall policy",
+}
+EPOCH = datetime(2026, 1, 8, 12, 0, tzinfo=timezone.utc)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _pick(rng: random.Random, weights: dict[str, int]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _load(root: Path, relative_path: str) -> Any:
+    with open(root / relative_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(root: Path, relative_path: str, data: Any) -> None:
+    with open(root / relative_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+
+
+class FleetGenerator:
+    """
+    Builds fleet-sized list payloads from a seed.
+
+    Usage:
+        FleetGenerator(appliances=10_000, seed=1).write("/tmp/fleet-10k")
+    """
+
+    def __init__(
+        self,
+        appliances: int = 1000,
+        seed: int = 0,
+        alarms: Optional[int] = None,
+        audit_entries: Optional[int] = None,
+        group_size: int = 50,
+        devices_per_template: int = 200,
+        source: Path = MOCKS_DIR,
+    ):
+        self.source = Path(source)
+        self.shipped = {
+            path: _load(self.source, path)[key] for path, key in APPLIANCE_LISTS.items()
+        }
+        self._complete_shipped_search()
+        shipped_count = len(self.shipped["appliance/get_all_appliances_lite.json"])
+        if appliances < shipped_count:
+            raise ValueError(
+                f"appliances must be at least {shipped_count} "
+                "(the shipped fleet is always included)"
+            )
+        self.appliances = appliances
+        self.seed = seed
+        self.alarms = appliances // 2 if alarms is None else alarms
+        self.audit_entries = appliances if audit_entries is None else audit_entries
+        self.group_size = group_size
+        self.devices_per_template = devices_per_template
+
+    def _complete_shipped_search(self) -> None:
+        """The shipped search results cover a few appliances; add the rest."""
+        search = self.shipped["appliance/search_appliance_by_name.json"]
+        found = {row["uuid"] for row in search}
+        for row in self.shipped["appliance/get_all_appliances_liteview.json"]:
+            if row["uuid"] not in found:
+                search.append({field: row[field] for field in SEARCH_FIELDS})
+
+    # -------------------------------------------------------------------------
+    # Appliances
+    # -------------------------------------------------------------------------
+
+    def _synthetic_appliance(self, rng: random.Random, i: int) -> dict[str, Any]:
+        """Base attributes for generated appliance i."""
+        status = _pick(rng, STATUS_WEIGHTS)
+        region = rng.choice(REGIONS)
+        return {
+            "uuid": f"br-gen-{i:06d}",
+            "name": f"Branch-{i:06d}",
+            "org": ORGS[i % len(ORGS)],
+            "type": "BRANCH",
+            "model": rng.choice(MODELS),
+            "status": status,
+            "pingStatus": "UNREACHABLE" if status == "DOWN" else "REACHABLE",
+            "syncStatus": _pick(rng, SYNC_WEIGHTS),
+            "servicesStatus": "GOOD" if status == "UP" else "DEGRADED",
+            "softwareVersion": rng.choice(VERSIONS),
+            "ip": f"10.{100 + i // 65536 % 100}.{i // 256 % 256}.{i % 256}",
+            "site": f"{region} Site {i:06d}",
+            "region": region,
+            "latitude": round(rng.uniform(25.0, 48.0), 4),
+            "longitude": round(rng.uniform(-123.0, -70.0), 4),
+        }
+
+    def _rows(self, base: dict[str, Any]) -> dict[str, Any]:
+        """Per-file records for one generated appliance."""
+        ident = {"uuid": base["uuid"], "name": base["name"], "org": base["org"]}
+        return {
+            "appliance/get_all_appliance_status.json": {
+                **ident,
+                "pingStatus": base["pingStatus"],
+                "syncStatus": base["syncStatus"],
+                "servicesStatus": base["servicesStatus"],
+                "pathStatus": base["servicesStatus"],
+                "hardwareHealth": "GOOD",
+                "softwareVersion": base["softwareVersion"],
+                "lastUpdated": _iso(EPOCH),
+            },
+            "appliance/get_all_appliances_lite.json": {
+                **ident,
+                "type": base["type"],
+                "status": base["status"],
+            },
+            "appliance/get_all_appliances_liteview.json": {
+                "uuid": base["uuid"],
+                "name": base["name"],
+                "ip": base["ip"],
+                "site": base["site"],
+                "model": base["model"],
+                "org": base["org"],
+                "status": base["status"],
+                "type": base["type"],
+            },
+            "appliance/get_all_appliances_basic_details.json": {
+                **ident,
+                "type": base["type"],
+                "model": base["model"],
+                "ip": base["ip"],
+                "site": base["site"],
+                "softwareVersion": base["softwareVersion"],
+                "status": base["status"],
+            },
+            "appliance/get_all_appliances_by_type_and_tags.json": {
+                "uuid": base["uuid"],
+                "name": base["name"],
+                "type": base["type"],
+                "tags": [base["region"], base["type"]],
+                "status": base["status"],
+                "org": base["org"],
+                "model": base["model"],
+            },
+            "appliance/get_appliance_locations.json": {
+                **ident,
+                "site": base["site"],
+                "latitude": base["latitude"],
+                "longitude": base["longitude"],
+                "address": f"{base['site']}, {base['region']}",
+                "status": base["status"],
+            },
+            "appliance/get_all_appliance_names.json": base["name"],
+            "appliance/search_appliance_by_name.json": {
+                field: base[field] for field in SEARCH_FIELDS
+            },
+        }
+
+    def _fleet(self, rng: random.Random) -> tuple[dict[str, list], list[dict]]:
+        """Appliance list payloads, plus the generated base records."""
+        lists = {path: list(rows) for path, rows in self.shipped.items()}
+        generated = []
+        for i in range(
+            len(lists["appliance/get_all_appliances_lite.json"]), self.appliances
+        ):
+            base = self._synthetic_appliance(rng, i)
+            generated.append(base)
+            for path, row in self._rows(base).items():
+                lists[path].append(row)
+        return lists, generated
+
+    def _summary(self, lists: dict[str, list]) -> dict[str, Any]:
+        lite = lists["appliance/get_all_appliances_lite.json"]
+        status = lists["appliance/get_all_appliance_status.json"]
+        by_status = Counter(a["status"] for a in lite)
+        by_sync = Counter(a["syncStatus"] for a in status)
+        return {
+            "totalAppliances": len(lite),
+            "byStatus": {
+                key: by_status.get(key, 0)
+                for key in ("UP", "DOWN", "DEGRADED", "UNREACHABLE")
+            },
+            "byType": dict(Counter(a["type"] for a in lite)),
+            "bySyncStatus": {
+                key: by_sync.get(key, 0)
+                for key in ("IN_SYNC", "OUT_OF_SYNC", "PENDING")
+            },
+            "byOrg": dict(Counter(a["org"] for a in lite)),
+        }
+
+    def _assets(self, generated: list[dict]) -> list[dict]:
+        assets = list(_load(self.source, "assets/get_all_assets.json")["assets"])
+        for base in generated:
+            assets.append(
+                {
+                    "uuid": base["uuid"],
+                    "name": base["name"],
+                    "org": base["org"],
+                    "type": base["type"],
+                    "model": base["model"],
+                    "serialNumber": f"VN-GEN-{base['uuid'][-6:]}",
+                    "status": "ACTIVE",
+                    "site": base["site"],
+                    "purchaseDate": "2025-01-15",
+                    "warrantyExpiry": "2028-01-15",
+                    "licenseStatus": "VALID",
+                }
+            )
+        return assets
+
+    # -------------------------------------------------------------------------
+    # Groups and templates
+    # -------------------------------------------------------------------------
+
+    def _device_groups(self, generated: list[dict]) -> list[dict]:
+        groups = list(
+            _load(self.source, "device_group/device_group_fetch_all.json")[
+                "deviceGroups"
+            ]
+        )
+        for n, start in enumerate(range(0, len(generated), self.group_size)):
+            members = generated[start : start + self.group_size]
+            groups.append(
+                {
+                    "name": f"Gen-Group-{n:05d}",
+                    "org": members[0]["org"],
+                    "description": f"Generated group of {len(members)} branches",
+                    "deviceCount": len(members),
+                    "devices": [
+                        {"uuid": m["uuid"], "name": m["name"]} for m in members
+                    ],
+                    "created": "2025-06-01T00:00:00Z",
+                    "createdBy": "generator@versa.local",
+                }
+            )
+        return groups
+
+    def _templates(self, rng: random.Random, generated: list[dict]) -> list[dict]:
+        templates = list(
+            _load(self.source, "workflow/template_fetch_all.json")["templates"]
+        )
+        count = len(generated) // self.devices_per_template
+        for n in range(count):
+            templates.append(
+                {
+                    "templateId": f"tmpl-gen-{n:05d}",
+                    "templateName": f"Gen-Template-{n:05d}",
+                    "org": ORGS[n % len(ORGS)],
+                    "type": "DEVICE",
+                    "description": "Generated branch template",
+                    "version": f"1.{n % 10}.0",
+                    "status": "ACTIVE",
+                    "devicesBound": self.devices_per_template,
+                    "lastModified": _iso(EPOCH - timedelta(days=rng.randrange(365))),
+                    "modifiedBy": "generator@versa.local",
+                    "features": ["full-mesh-vpn", "security-utm"],
+                }
+            )
+        return templates
+
+    # -------------------------------------------------------------------------
+    # Alarms and audit
+    # -------------------------------------------------------------------------
+
+    def _alarms(self, rng: random.Random, lite: list[dict]) -> list[dict]:
+        """Generated alarms carrying every field both alarm list models need."""
+        alarms = []
+        for n in range(self.alarms):
+            device = rng.choice(lite)
+            alarm_type = rng.choice(list(ALARM_TYPES))
+            managed_object, problem = ALARM_TYPES[alarm_type]
+            raised = EPOCH - timedelta(seconds=rng.randrange(30 * 86400))
+            changed = raised + timedelta(seconds=rng.randrange(3600))
+            cleared = rng.random() < 0.3
+            alarms.append(
+                {
+                    "alarmId": f"alm-gen-{n:07d}",
+                    "deviceName": device["name"],
+                    "deviceUuid": device["uuid"],
+                    "org": device["org"],
+                    "severity": _pick(rng, SEVERITY_WEIGHTS),
+                    "type": alarm_type,
+                    "managedObject": managed_object,
+                    "alarmText": f"{problem} on {device['name']}",
+                    "specificProblem": problem,
+                    "probableCause": "Generated",
+                    "raisedTime": _iso(raised),
+                    "lastStatusChange": _iso(changed),
+                    "isCleared": cleared,
+                    "ackState": "ACKNOWLEDGED" if cleared else "UNACKNOWLEDGED",
+                    "handlingState": "CLOSED" if cleared else "OPEN",
+                }
+            )
+        return alarms
+
+    def _audit_logs(self, rng: random.Random, lite: list[dict]) -> list[dict]:
+        logs = list(_load(self.source, "audit/get_audit_logs.json")["logs"])
+        for n in range(self.audit_entries):
+            device = rng.choice(lite)
+            action = rng.choice(list(AUDIT_ACTIONS))
+            logs.append(
+                {
+                    "logId": f"log-gen-{n:07d}",
+                    "timestamp": _iso(
+                        EPOCH - timedelta(seconds=rng.randrange(30 * 86400))
+                    ),
+                    "user": "netops@globalretail.com",
+                    "action": action,
+                    "targetType": "DEVICE",
+                    "targetId": device["uuid"],
+                    "targetName": device["name"],
+                    "details": AUDIT_ACTIONS[action],
+                    "sourceIp": "10.0.0.101",
+                    "result": "SUCCESS",
+                }
+            )
+        return logs
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    def build(self) -> dict[str, Any]:
+        """Build the regenerated files as {relative_path: payload}."""
+        rng = random.Random(self.seed)
+        lists, generated = self._fleet(rng)
+        lite = lists["appliance/get_all_appliances_lite.json"]
+
+        files: dict[str, Any] = {}
+        for path, key in APPLIANCE_LISTS.items():
+            files[path] = {"totalCount": len(lists[path]), key: lists[path]}
+        files["appliance/get_appliances_summary.json"] = self._summary(lists)
+
+        assets = self._assets(generated)
+        files["assets/get_all_assets.json"] = {
+            "totalCount": len(assets),
+            "assets": assets,
+        }
+
+        groups = self._device_groups(generated)
+        files["device_group/device_group_fetch_all.json"] = {
+            "totalCount": len(groups),
+            "deviceGroups": groups,
+        }
+        templates = self._templates(rng, generated)
+        files["workflow/template_fetch_all.json"] = {
+            "totalCount": len(templates),
+            "templates": templates,
+        }
+
+        generated_alarms = self._alarms(rng, lite)
+        page = _load(self.source, "alarm/filter_paginate_alarm.json")
+        page_alarms = page["alarms"] + generated_alarms
+        files["alarm/filter_paginate_alarm.json"] = {
+            **page,
+            "totalCount": len(page_alarms),
+            "hasMore": len(page_alarms) > page["limit"],
+            "alarms": page_alarms,
+        }
+        filtered = _load(self.source, "alarm/get_all_filtered_alarms.json")["alarms"]
+        filtered = filtered + generated_alarms
+        files["alarm/get_all_filtered_alarms.json"] = {
+            "totalCount": len(filtered),
+            "alarms": filtered,
+        }
+
+        logs = self._audit_logs(rng, lite)
+        files["audit/get_audit_logs.json"] = {"totalCount": len(logs), "logs": logs}
+        return files
+
+    def write(self, output_dir: Path) -> dict[str, int]:
+        """Write a full corpus to output_dir. Returns counts per entity."""
+        output_dir = Path(output_dir)
+        for path in self.source.rglob("*.json"):
+            target = output_dir / path.relative_to(self.source)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, target)
+
+        files = self.build()
+        for relative_path, data in files.items():
+            _write(output_dir, relative_path, data)
+
+        return {
+            "appliances": files["appliance/get_appliances_summary.json"][
+                "totalAppliances"
+            ],
+            "device_groups": files["device_group/device_group_fetch_all.json"][
+                "totalCount"
+            ],
+            "templates": files["workflow/template_fetch_all.json"]["totalCount"],
+            "alarms": files["alarm/filter_paginate_alarm.json"]["totalCount"],
+            "audit_entries": files["audit/get_audit_logs.json"]["totalCount"],
+        }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic mock corpus.")
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--appliances", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--alarms", type=int, default=None)
+    parser.add_argument("--audit-entries", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    counts = FleetGenerator(
+        appliances=args.appliances,
+        seed=args.seed,
+        alarms=args.alarms,
+        audit_entries=args.audit_entries,
+    ).write(args.output_dir)
+    print(json.dumps(counts))
+
+
+if __name__ == "__main__":
+    main()
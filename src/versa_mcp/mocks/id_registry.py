@@ -2,92 +2,322 @@
 ID Registry for Mock Data Validation
 
 Loads valid IDs from master mock files to enable realistic 404 responses.
-IDs are loaded once at module import time for fast O(1) lookups.
+The registry is built on first use, not at import. It can be persisted to
+a snapshot file keyed by the source files' mtimes, sizes and SHA-256 hashes,
+so a warm start reloads it without creating the corpus, let alone parsing
+it. Snapshots are off by default: set
+MOCK_REGISTRY_SNAPSHOT=/path/to/snapshot.json to choose the snapshot file,
+or MOCK_REGISTRY_SNAPSHOT=true for one under the temp directory.
 """
 
+import hashlib
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Optional
 
-MOCKS_DIR = Path(__file__).parent
+from .corpus import (
+    MockCorpus,
+    corpus_root,
+    corpus_source_path,
+    get_corpus,
+    subscribe_corpus,
+)
+from .search_index import get_term_index
 
+SNAPSHOT_VERSION = 1
 
-def _load_json(relative_path: str) -> Any:
-    """Load JSON file from mocks directory."""
-    file_path = MOCKS_DIR / relative_path
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
 
+def _load_json(relative_path: str, corpus: Optional[MockCorpus] = None) -> Any:
+    """Load JSON file from the given or shared mock corpus."""
+    return (corpus or get_corpus()).get(relative_path)
 
-def _build_registry() -> dict[str, set[str]]:
-    """Build registry of valid IDs from mock data files."""
-    registry: dict[str, set[str]] = {
+
+def _appliance_ids(data: Any) -> dict[str, set[str]]:
+    """Appliance UUIDs, names and orgs from the lite appliance list."""
+    ids: dict[str, set[str]] = {
         "appliance_uuids": set(),
         "appliance_names": set(),
-        "device_group_names": set(),
-        "template_names": set(),
         "org_names": set(),
     }
-
-    # Load appliance UUIDs and names
-    appliances_data = _load_json("appliance/get_all_appliances_lite.json")
-    for appliance in appliances_data.get("appliances", []):
+    for appliance in (data or {}).get("appliances", []):
         uuid = appliance.get("uuid")
         name = appliance.get("name")
         org = appliance.get("org")
         if uuid:
-            registry["appliance_uuids"].add(uuid)
+            ids["appliance_uuids"].add(uuid)
         if name:
-            registry["appliance_names"].add(name)
+            ids["appliance_names"].add(name)
         if org:
-            registry["org_names"].add(org)
+            ids["org_names"].add(org)
+    return ids
 
-    # Load device group names
-    device_groups_data = _load_json("device_group/device_group_fetch_all.json")
-    for group in device_groups_data.get("deviceGroups", []):
+
+def _device_group_ids(data: Any) -> dict[str, set[str]]:
+    """Device group names."""
+    names = set()
+    for group in (data or {}).get("deviceGroups", []):
         name = group.get("name")
         if name:
-            registry["device_group_names"].add(name)
+            names.add(name)
+    return {"device_group_names": names}
+
 
-    # Load template names
-    templates_data = _load_json("workflow/template_fetch_all.json")
-    for template in templates_data.get("templates", []):
+def _template_ids(data: Any) -> dict[str, set[str]]:
+    """Template names."""
+    names = set()
+    for template in (data or {}).get("templates", []):
         template_name = template.get("templateName")
         if template_name:
-            registry["template_names"].add(template_name)
+            names.add(template_name)
+    return {"template_names": names}
+
+
+# Mock files the registry is built from, and the sets built from each
+_SOURCE_BUILDERS = {
+    "appliance/get_all_appliances_lite.json": _appliance_ids,
+    "device_group/device_group_fetch_all.json": _device_group_ids,
+    "workflow/template_fetch_all.json": _template_ids,
+}
+REGISTRY_SOURCES = tuple(_SOURCE_BUILDERS)
+
+
+def _build_registry(corpus: Optional[MockCorpus] = None) -> dict[str, set[str]]:
+    """Build registry of valid IDs from mock data files."""
+    registry: dict[str, set[str]] = {}
+    for relative_path in REGISTRY_SOURCES:
+        registry.update(
+            _SOURCE_BUILDERS[relative_path](_load_json(relative_path, corpus))
+        )
+    return registry
+
+
+def update_registry(
+    registry: dict[str, set[str]],
+    changed: Iterable[str],
+    corpus: Optional[MockCorpus] = None,
+) -> dict[str, set[str]]:
+    """
+    Rebuild only the sets whose source files changed.
+    Returns a new registry; unaffected sets are shared with the old one.
+    """
+    updated = dict(registry)
+    for relative_path in REGISTRY_SOURCES:
+        if relative_path in changed:
+            data = _load_json(relative_path, corpus)
+            updated.update(_SOURCE_BUILDERS[relative_path](data))
+    return updated
+
+
+def _sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _source_files(source_path: Callable[[str], Path]) -> list[Path]:
+    """Distinct files on disk the registry sources are read from."""
+    return sorted({source_path(p) for p in REGISTRY_SOURCES})
+
+
+def _source_path(corpus: Optional[MockCorpus]) -> Callable[[str], Path]:
+    """Source path lookup of a corpus, else of the process-wide one."""
+    return corpus.source_path if corpus is not None else corpus_source_path
+
+
+def _fingerprint(source_path: Callable[[str], Path]) -> dict[str, dict[str, Any]]:
+    """Get mtime, size and hash of every registry source file."""
+    fingerprint = {}
+    for path in _source_files(source_path):
+        stat = path.stat()
+        fingerprint[str(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _sha256(path),
+        }
+    return fingerprint
 
+
+def _snapshot_is_current(
+    source_path: Callable[[str], Path], sources: dict[str, Any]
+) -> bool:
+    """
+    Check a snapshot's fingerprint against the source files.
+    Files whose mtime and size are unchanged are not re-hashed.
+    """
+    paths = _source_files(source_path)
+    if sorted(sources) != [str(p) for p in paths]:
+        return False
+    for path in paths:
+        recorded = sources[str(path)]
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != recorded.get("size"):
+            return False
+        if stat.st_mtime_ns == recorded.get("mtime_ns"):
+            continue
+        if _sha256(path) != recorded.get("sha256"):
+            return False
+    return True
+
+
+def default_snapshot_path(root: Optional[Path] = None) -> Optional[Path]:
+    """
+    Get the snapshot file for the corpus at root (by default the process-wide
+    corpus's), or None if snapshots are disabled.
+    """
+    configured = os.environ.get("MOCK_REGISTRY_SNAPSHOT", "")
+    if configured.lower() in ("", "false"):
+        return None
+    if configured.lower() != "true":
+        return Path(configured)
+    root = corpus_root() if root is None else root
+    key = hashlib.sha256(str(Path(root).resolve()).encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / "versa-mcp" / f"id_registry-{key[:16]}.json"
+
+
+def load_snapshot(
+    path: Path, corpus: Optional[MockCorpus] = None
+) -> Optional[dict[str, set[str]]]:
+    """
+    Load a registry snapshot, or None if it is missing or out of date.
+    Without a corpus, the process-wide corpus's source files are checked
+    without creating it.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        if not _snapshot_is_current(_source_path(corpus), snapshot["sources"]):
+            return None
+        return {key: set(values) for key, values in snapshot["registry"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_snapshot(
+    path: Path,
+    registry: dict[str, set[str]],
+    corpus: Optional[MockCorpus] = None,
+    fingerprint: Optional[dict[str, dict[str, Any]]] = None,
+) -> None:
+    """Write a registry snapshot atomically."""
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "sources": fingerprint or _fingerprint(_source_path(corpus)),
+        "registry": {key: sorted(values) for key, values in registry.items()},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def load_registry(
+    corpus: Optional[MockCorpus] = None, snapshot_path: Optional[Path] = None
+) -> dict[str, set[str]]:
+    """
+    Load the registry from a current snapshot, else build and snapshot it.
+    A snapshot that cannot be written is skipped, not an error. Without a
+    corpus, the process-wide one is only created if the snapshot is stale.
+    """
+    if snapshot_path is None:
+        return _build_registry(corpus)
+
+    registry = load_snapshot(snapshot_path, corpus)
+    if registry is not None:
+        return registry
+
+    # Fingerprint before building so a source edited mid-build invalidates it
+    try:
+        fingerprint = _fingerprint(_source_path(corpus))
+    except OSError:
+        return _build_registry(corpus)
+    registry = _build_registry(corpus)
+    try:
+        save_snapshot(snapshot_path, registry, corpus, fingerprint)
+    except OSError:
+        pass
+    return registry
+
+
+_registry: Optional[dict[str, set[str]]] = None
+_registry_lock = threading.Lock()
+
+
+def _on_corpus_change(changed: frozenset[str]) -> None:
+    """Swap in a registry with the sets of changed source files rebuilt."""
+    global _registry
+    if _registry is None or not changed.intersection(REGISTRY_SOURCES):
+        return
+    corpus = get_corpus()
+    with _registry_lock:
+        _registry = update_registry(_registry, changed, corpus)
+        registry = _registry
+    snapshot_path = default_snapshot_path(corpus.root)
+    if snapshot_path is not None:
+        try:
+            save_snapshot(snapshot_path, registry, corpus)
+        except OSError:
+            pass
+
+
+def get_registry() -> dict[str, set[str]]:
+    """Get the process-wide registry, loading it on first call."""
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = load_registry(snapshot_path=default_snapshot_path())
+                subscribe_corpus(_on_corpus_change)
+            registry = _registry
     return registry
 
 
-# Build registry once at module load time
-ID_REGISTRY = _build_registry()
+def __getattr__(name: str) -> Any:
+    # ID_REGISTRY used to be built at import; keep it importable, lazily
+    if name == "ID_REGISTRY":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_valid_appliance_uuid(uuid: str) -> bool:
     """Check if appliance UUID exists in mock data."""
-    return uuid in ID_REGISTRY["appliance_uuids"]
+    return uuid in get_registry()["appliance_uuids"]
 
 
 def is_valid_appliance_name(name: str) -> bool:
     """Check if appliance/device name exists in mock data."""
-    return name in ID_REGISTRY["appliance_names"]
+    return name in get_registry()["appliance_names"]
 
 
 def is_valid_device_group_name(name: str) -> bool:
     """Check if device group name exists in mock data."""
-    return name in ID_REGISTRY["device_group_names"]
+    return name in get_registry()["device_group_names"]
 
 
 def is_valid_template_name(name: str) -> bool:
     """Check if template name exists in mock data."""
-    return name in ID_REGISTRY["template_names"]
+    return name in get_registry()["template_names"]
 
 
 def is_valid_org_name(name: str) -> bool:
     """Check if org name exists in mock data."""
-    return name in ID_REGISTRY["org_names"]
+    return name in get_registry()["org_names"]
+
+
+def suggest(key: str, value: str, n: int = 3) -> list[str]:
+    """Get up to n registered IDs of a kind (e.g. "appliance_names") close to value."""
+    return get_term_index(get_registry()[key]).similar(value, n)
 
 
 def get_registry_stats() -> dict[str, int]:
     """Get counts of registered IDs for debugging."""
-    return {key: len(values) for key, values in ID_REGISTRY.items()}
+    return {key: len(values) for key, values in get_registry().items()}
@@ -2,34 +2,83 @@
 Mock HTTP Client
 
 A drop-in replacement for httpx.AsyncClient that returns mock data.
-Toggle with MOCK_MODE=true environment variable.
+Toggle with MOCK_MODE=true environment variable (the default; see
+versa_mcp/backend.py).
 """
 
 import json
-import re
-from pathlib import Path
+from functools import cached_property
+from http import HTTPStatus
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
-from .endpoint_map import ENDPOINT_TO_MOCK, normalize_endpoint
+import anyio
+
+from .alarm_store import (
+    QUERY_PARAMS as ALARM_QUERY_PARAMS,
+    AlarmQueryError,
+    query_alarm_page,
+    query_filtered_alarms,
+)
+from .corpus import CorpusEntry, MockCorpus, get_corpus
+from .endpoint_map import ENDPOINT_TO_MOCK, match_endpoint
+from .fault_profile import FaultProfile, MockTimeoutError, get_profile
 from .id_registry import (
     is_valid_appliance_uuid,
     is_valid_appliance_name,
     is_valid_device_group_name,
     is_valid_template_name,
     is_valid_org_name,
+    suggest,
+)
+from .pagination import PaginationError, paginate_entry
+from .search_index import (
+    FILTER_PARAMS,
+    SEARCH_PARAMS,
+    filter_appliances,
+    search_appliances,
 )
 
-MOCK_DIR = Path(__file__).parent
+# Endpoint patterns whose query params are evaluated by a dedicated engine,
+# with the params that engine handles; requests without any of them, and
+# every other endpoint, only honor limit/offset
+QUERY_HANDLERS = {
+    "/vnms/fault/alarms/page": (ALARM_QUERY_PARAMS, query_alarm_page),
+    "/vnms/fault/alarms": (ALARM_QUERY_PARAMS, query_filtered_alarms),
+    "/vnms/appliance/applianceByName": (SEARCH_PARAMS, search_appliances),
+    "/vnms/appliance/appliance": (FILTER_PARAMS, filter_appliances),
+    "/vnms/appliance/appliance/lite": (FILTER_PARAMS, filter_appliances),
+    "/vnms/appliance/appliance/liteView": (FILTER_PARAMS, filter_appliances),
+}
 
 
 class MockResponse:
-    """Mock HTTP response that mimics httpx.Response"""
+    """
+    Mock HTTP response that mimics httpx.Response.
+
+    The body is only serialized when .text or .content is first read. Pass
+    raw to reuse bytes that already encode data, e.g. a corpus file.
+    """
 
-    def __init__(self, data: Dict[str, Any], status_code: int = 200):
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        status_code: int = 200,
+        raw: Optional[bytes] = None,
+    ):
         self._data = data
         self.status_code = status_code
-        self.text = json.dumps(data)
+        self._raw = raw
+
+    @cached_property
+    def content(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+        return json.dumps(self._data).encode("utf-8")
+
+    @cached_property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
 
     def json(self) -> Dict[str, Any]:
         return self._data
@@ -39,14 +88,27 @@ class MockAsyncClient:
     """
     Mock async HTTP client that returns data from JSON files.
 
+    Responses are delayed or failed per the active FaultProfile (see
+    fault_profile.py), if any; timeout is the client-side timeout in seconds.
+
     Usage:
         async with MockAsyncClient() as client:
             response = await client.get(url, headers=headers, params=params)
             data = response.json()
     """
 
-    def __init__(self, verify: bool = True, **kwargs):
+    def __init__(
+        self,
+        verify: bool = True,
+        corpus: Optional[MockCorpus] = None,
+        profile: Optional[FaultProfile] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
         self.verify = verify
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.profile = profile if profile is not None else get_profile()
+        self.timeout = timeout if isinstance(timeout, (int, float)) else None
 
     async def __aenter__(self):
         return self
@@ -59,97 +121,154 @@ class MockAsyncClient:
         parsed = urlparse(url)
         return parsed.path
 
-    def _extract_path_params(self, endpoint: str, pattern: str) -> Dict[str, str]:
-        """Extract path parameter values from endpoint using pattern."""
-        # Convert pattern placeholders to regex capture groups
-        regex_pattern = pattern
-        param_names = re.findall(r"\{([^}]+)\}", pattern)
-
-        # Replace {param} with named capture groups
-        for param_name in param_names:
-            regex_pattern = regex_pattern.replace(
-                f"{{{param_name}}}", f"(?P<{param_name}>[^/]+)"
+    async def _inject(self, endpoint: str) -> Optional[MockResponse]:
+        """
+        Apply the fault profile to a request: wait its latency, then raise
+        MockTimeoutError or return an error response to serve instead.
+        Returns None when the request should be served normally.
+        """
+        if self.profile is None:
+            return None
+        route = match_endpoint(endpoint)
+        injection = self.profile.sample(route.pattern if route else None)
+
+        # A call slower than the client timeout times out like httpx would
+        if self.timeout is not None and injection.latency_s >= self.timeout:
+            await anyio.sleep(self.timeout)
+            raise MockTimeoutError(f"Timed out after {self.timeout}s: {endpoint}")
+        if injection.latency_s > 0:
+            await anyio.sleep(injection.latency_s)
+        if injection.timeout:
+            raise MockTimeoutError(
+                f"Timed out after {injection.latency_s}s: {endpoint}"
             )
-
-        regex_pattern = f"^{regex_pattern}$"
-
-        # Match and extract parameters
-        match = re.match(regex_pattern, endpoint)
-        if match:
-            return match.groupdict()
-        return {}
+        if injection.status is not None:
+            error = {
+                "error": "Injected fault",
+                "endpoint": endpoint,
+                "status": HTTPStatus(injection.status).name,
+            }
+            return MockResponse(error, status_code=injection.status)
+        return None
 
     def _validate_path_params(
         self, pattern: str, path_params: Dict[str, str]
-    ) -> tuple[bool, Optional[str]]:
+    ) -> tuple[bool, Optional[str], list[str]]:
         """
         Validate path parameter values against ID registry.
-        Returns (is_valid, error_message).
+        Returns (is_valid, error_message, suggestions), where suggestions
+        are the closest known IDs to an unknown one.
         """
         for param_name, param_value in path_params.items():
             # Check different parameter types
             if param_name in ("Uuid", "applianceUUID", "id"):
                 if not is_valid_appliance_uuid(param_value):
-                    return False, f"Appliance with UUID '{param_value}' not found"
+                    return (
+                        False,
+                        f"Appliance with UUID '{param_value}' not found",
+                        suggest("appliance_uuids", param_value),
+                    )
 
             elif param_name in ("applianceName", "deviceName"):
                 if not is_valid_appliance_name(param_value):
                     return (
                         False,
                         f"Appliance/device with name '{param_value}' not found",
+                        suggest("appliance_names", param_value),
                     )
 
             elif param_name == "deviceGroupName":
                 if not is_valid_device_group_name(param_value):
-                    return False, f"Device group '{param_value}' not found"
+                    return (
+                        False,
+                        f"Device group '{param_value}' not found",
+                        suggest("device_group_names", param_value),
+                    )
 
             elif param_name in ("templateworkflowName", "templateName"):
                 if not is_valid_template_name(param_value):
-                    return False, f"Template '{param_value}' not found"
+                    return (
+                        False,
+                        f"Template '{param_value}' not found",
+                        suggest("template_names", param_value),
+                    )
 
             elif param_name == "org":
                 if not is_valid_org_name(param_value):
-                    return False, f"Organization '{param_value}' not found"
+                    return (
+                        False,
+                        f"Organization '{param_value}' not found",
+                        suggest("org_names", param_value),
+                    )
 
-        return True, None
+        return True, None, []
 
-    def _load_mock(self, endpoint: str) -> tuple[Dict[str, Any], int]:
+    def _apply_params(
+        self, pattern: str, entry: CorpusEntry, params: Optional[Dict[str, str]]
+    ) -> Optional[Any]:
+        """
+        Apply query params to mock data the way the Director would.
+        Returns None when the params leave the document unchanged.
+        """
+        if pattern in QUERY_HANDLERS and params:
+            handled_params, handler = QUERY_HANDLERS[pattern]
+            if handled_params.intersection(k for k, v in params.items() if v):
+                result = handler(entry.data, params)
+                return None if result is entry.data else result
+        return paginate_entry(entry, params)
+
+    def _load_mock(
+        self, endpoint: str, params: Optional[Dict[str, str]] = None
+    ) -> tuple[Dict[str, Any], int, Optional[bytes]]:
         """
         Load mock data from JSON file for the given endpoint.
-        Returns (data, status_code).
+        Returns (data, status_code, raw_body); raw_body is None unless the
+        data is served unchanged from the corpus.
         """
-        # Normalize the endpoint to match a pattern
-        pattern = normalize_endpoint(endpoint, "")
-        mock_file = ENDPOINT_TO_MOCK.get(pattern)
-
-        if not mock_file:
-            return {
+        # Resolve the endpoint to a pattern and its path params in one lookup
+        route = match_endpoint(endpoint)
+        if route is None or route.pattern not in ENDPOINT_TO_MOCK:
+            error = {
                 "error": "No mock mapping for endpoint",
                 "endpoint": endpoint,
                 "available_patterns": list(ENDPOINT_TO_MOCK.keys())[:5],
-            }, 500
+            }
+            return error, 500, None
 
-        # Extract and validate path parameters
-        path_params = self._extract_path_params(endpoint, pattern)
+        # Validate path parameters
+        pattern, path_params = route
+        mock_file = ENDPOINT_TO_MOCK[pattern]
         if path_params:
-            is_valid, error_message = self._validate_path_params(pattern, path_params)
+            is_valid, error_message, suggestions = self._validate_path_params(
+                pattern, path_params
+            )
             if not is_valid:
-                return {
+                error = {
                     "error": error_message,
                     "endpoint": endpoint,
                     "status": "NOT_FOUND",
-                }, 404
-
-        # Load mock data file
-        mock_path = MOCK_DIR / mock_file
-        if mock_path.exists():
-            with open(mock_path, "r") as f:
-                return json.load(f), 200
-        else:
-            return {
+                    "suggestions": suggestions,
+                }
+                return error, 404, None
+
+        # Serve mock data from the in-memory corpus
+        entry = self.corpus.entry(mock_file)
+        if entry is None:
+            error = {
                 "error": f"Mock file not found: {mock_file}",
                 "endpoint": endpoint,
-            }, 500
+            }
+            return error, 500, None
+
+        # Apply filters, sorting and pagination
+        try:
+            data = self._apply_params(pattern, entry, params)
+        except (PaginationError, AlarmQueryError) as e:
+            error = {"error": str(e), "endpoint": endpoint, "status": "BAD_REQUEST"}
+            return error, 400, None
+        if data is None:
+            return entry.data, 200, entry.raw
+        return data, 200, None
 
     async def get(
         self,
@@ -161,10 +280,15 @@ class MockAsyncClient:
         # Extract endpoint path from URL (strips scheme and host)
         endpoint = self._extract_endpoint(url)
 
-        # Load mock data (with validation)
-        data, status_code = self._load_mock(endpoint)
+        # Simulate backend latency and faults
+        fault = await self._inject(endpoint)
+        if fault is not None:
+            return fault
+
+        # Load mock data (with validation and query params applied)
+        data, status_code, raw = self._load_mock(endpoint, params)
 
-        return MockResponse(data, status_code=status_code)
+        return MockResponse(data, status_code=status_code, raw=raw)
 
     async def post(
         self,
@@ -176,6 +300,9 @@ class MockAsyncClient:
     ) -> MockResponse:
         """Mock POST request - returns success response."""
         endpoint = self._extract_endpoint(url)
+        fault = await self._inject(endpoint)
+        if fault is not None:
+            return fault
 
         # For POST requests, return a generic success
         return MockResponse(
@@ -195,6 +322,9 @@ class MockAsyncClient:
     ) -> MockResponse:
         """Mock PUT request - returns success response."""
         endpoint = self._extract_endpoint(url)
+        fault = await self._inject(endpoint)
+        if fault is not None:
+            return fault
 
         return MockResponse(
             {
@@ -212,6 +342,9 @@ class MockAsyncClient:
     ) -> MockResponse:
         """Mock DELETE request - returns success response."""
         endpoint = self._extract_endpoint(url)
+        fault = await self._inject(endpoint)
+        if fault is not None:
+            return fault
 
         return MockResponse(
             {"status": "success", "message": f"Mock DELETE to {endpoint}"}
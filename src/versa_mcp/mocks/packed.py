@@ -0,0 +1,296 @@
+"""
+Packed Mock Corpus
+
+Packs a mocks/ tree into a single binary file and serves it through a
+read-only memory map, so a large (e.g. 100k-appliance) corpus neither pays
+a JSON parse per file at startup nor a private copy per worker: every
+server process mapping the same file shares its pages through the OS page
+cache, and only the documents or records a request touches are decoded.
+
+File layout:
+    header   b"VMCPACK1", u64 index offset, u64 index length (little-endian)
+    data     each document as compact JSON; list payloads are written as
+             envelope + records so each record is a contiguous byte range
+    tables   per list payload, n pairs of u64 (start, end) record offsets
+             relative to the document
+    index    JSON object: {relative_path: {offset, length, list_key,
+             count, table, envelope}}
+
+Usage:
+    python -m versa_mcp.mocks.packed /path/to/mocks corpus.pack
+    MOCK_CORPUS_PACK=corpus.pack uv run versa-mcp
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, BinaryIO, Mapping, Optional, Union
+
+from .corpus import MOCKS_DIR, CorpusEntry, MockCorpus, find_list_key
+
+MAGIC = b"VMCPACK1"
+HEADER = struct.Struct("<8sQQ")
+_SEPARATORS = (",", ":")
+_PLACEHOLDER = "\x00records\x00"
+
+
+class PackedCorpusError(ValueError):
+    """Raised when a pack file is missing, truncated or of another format."""
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=_SEPARATORS).encode("utf-8")
+
+
+def _encode(data: Any) -> tuple[bytes, Optional[str], list[tuple[int, int]]]:
+    """
+    Encode a document, recording each list record's byte range.
+    Returns (document_bytes, list_key, record_ranges).
+    """
+    list_key = find_list_key(data)
+    if list_key is None:
+        return _dumps(data), None, []
+
+    shell = dict(data)
+    shell[list_key] = _PLACEHOLDER
+    prefix, suffix = _dumps(shell).split(_dumps(_PLACEHOLDER))
+    parts = [prefix, b"["]
+    position = len(prefix) + 1
+    ranges = []
+    for i, record in enumerate(data[list_key]):
+        if i:
+            parts.append(b",")
+            position += 1
+        encoded = _dumps(record)
+        parts.append(encoded)
+        ranges.append((position, position + len(encoded)))
+        position += len(encoded)
+    parts.extend([b"]", suffix])
+    return b"".join(parts), list_key, ranges
+
+
+def pack_corpus(source: Path, output: Path) -> dict[str, int]:
+    """Pack every JSON file under source into output. Returns pack stats."""
+    source, output = Path(source), Path(output)
+    index: dict[str, Any] = {}
+    records = 0
+    with open(output, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0, 0))
+        tables: list[tuple[str, array]] = []
+        for path in sorted(source.rglob("*.json")):
+            relative_path = path.relative_to(source).as_posix()
+            with open(path, encoding="utf-8") as src:
+                data = json.load(src)
+            document, list_key, ranges = _encode(data)
+            meta: dict[str, Any] = {"offset": f.tell(), "length": len(document)}
+            f.write(document)
+            if list_key is not None:
+                envelope = dict(data)
+                envelope[list_key] = None
+                meta.update(list_key=list_key, count=len(ranges), envelope=envelope)
+                table = array("Q", (bound for pair in ranges for bound in pair))
+                tables.append((relative_path, table))
+                records += len(ranges)
+            index[relative_path] = meta
+
+        for relative_path, table in tables:
+            _align(f, table.itemsize)
+            index[relative_path]["table"] = f.tell()
+            _write_little_endian(f, table)
+
+        index_bytes = _dumps({"byteorder": "little", "files": index})
+        index_offset = f.tell()
+        f.write(index_bytes)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, index_offset, len(index_bytes)))
+        size = index_offset + len(index_bytes)
+    return {"files": len(index), "records": records, "bytes": size}
+
+
+def _align(f: BinaryIO, size: int) -> None:
+    padding = -f.tell() % size
+    if padding:
+        f.write(b"\x00" * padding)
+
+
+def _write_little_endian(f: BinaryIO, table: array) -> None:
+    if sys.byteorder != "little":
+        table = array(table.typecode, table)
+        table.byteswap()
+    table.tofile(f)
+
+
+class PackedEntry(CorpusEntry):
+    """
+    A document inside a pack file.
+
+    raw and data are materialized on first access; envelope() and records()
+    read only the index and the requested record ranges.
+    """
+
+    def __init__(self, corpus: "PackedCorpus", path: str, meta: Mapping[str, Any]):
+        self._corpus = corpus
+        self.path = path
+        self._offset = meta["offset"]
+        self._length = meta["length"]
+        self._meta = meta
+
+    @cached_property
+    def raw(self) -> bytes:  # type: ignore[override]
+        return self._corpus._buffer[self._offset : self._offset + self._length]
+
+    @cached_property
+    def data(self) -> Any:  # type: ignore[override]
+        self._corpus._count_decode(self._length)
+        return json.loads(self.raw)
+
+    @cached_property
+    def list_key(self) -> Optional[str]:
+        return self._meta.get("list_key")
+
+    @property
+    def count(self) -> int:
+        return self._meta.get("count", 0)
+
+    def envelope(self) -> dict[str, Any]:
+        return dict(self._meta["envelope"])
+
+    def records(self, start: int, stop: int) -> list[Any]:
+        if "data" in self.__dict__:
+            return super().records(start, stop)
+        stop = min(stop, self.count)
+        if start >= stop:
+            return []
+        table = self._corpus._table(self._meta["table"], self.count)
+        buffer = self._corpus._buffer
+        base = self._offset
+        decoded = []
+        for i in range(start, stop):
+            begin, end = table[2 * i], table[2 * i + 1]
+            decoded.append(json.loads(buffer[base + begin : base + end]))
+            self._corpus._count_decode(end - begin, records=1)
+        return decoded
+
+
+class PackedCorpus(MockCorpus):
+    """
+    Read-only corpus served from a memory-mapped pack file.
+
+    Usage:
+        corpus = PackedCorpus("corpus.pack")
+        data = corpus.get("alarm/get_alarm_types.json")
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.root = self.path
+        self.lazy = True
+        try:
+            with open(self.path, "rb") as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise PackedCorpusError(f"Cannot map pack file {self.path}: {e}") from e
+        if len(self._buffer) < HEADER.size:
+            raise PackedCorpusError(f"{self.path} is too small to be a pack file")
+        magic, index_offset, index_length = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise PackedCorpusError(f"{self.path} is not a corpus pack file")
+        index = json.loads(self._buffer[index_offset : index_offset + index_length])
+        self._index: dict[str, Any] = index["files"]
+        self._entries: dict[str, CorpusEntry] = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._documents_decoded = 0
+        self._records_decoded = 0
+        self._bytes_decoded = 0
+
+    def _table(self, offset: int, count: int) -> Any:
+        view = memoryview(self._buffer)[offset : offset + 16 * count]
+        if sys.byteorder == "little":
+            return view.cast("Q")
+        return struct.unpack(f"<{2 * count}Q", view)
+
+    def _count_decode(self, size: int, records: int = 0) -> None:
+        self._bytes_decoded += size
+        if records:
+            self._records_decoded += records
+        else:
+            self._documents_decoded += 1
+
+    def preload(self) -> None:
+        """Create entries for every document; nothing is decoded."""
+        for relative_path in self._index:
+            self.entry(relative_path)
+
+    def entry(self, relative_path: str) -> Optional[CorpusEntry]:
+        """Get the entry for a packed document, or None if it does not exist."""
+        entry = self._entries.get(relative_path)
+        if entry is not None:
+            self._hits += 1
+            return entry
+        meta = self._index.get(relative_path)
+        self._misses += 1
+        if meta is None:
+            return None
+        with self._lock:
+            entry = self._entries.setdefault(
+                relative_path, PackedEntry(self, relative_path, meta)
+            )
+        return entry
+
+    def get(self, relative_path: str) -> Any:
+        """Get decoded data for a packed document, or None if it does not exist."""
+        entry = self.entry(relative_path)
+        return entry.data if entry is not None else None
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self._index
+
+    def source_path(self, relative_path: str) -> Path:
+        """Every packed document is read from the pack file itself."""
+        return self.path
+
+    def refresh(self) -> frozenset[str]:
+        """Pack files are immutable; repack and restart to change them."""
+        return frozenset()
+
+    @property
+    def entries(self) -> Mapping[str, CorpusEntry]:
+        """Read-only mapping of the documents accessed so far."""
+        return MappingProxyType(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Get corpus counters for debugging and load tests."""
+        return {
+            "lazy": True,
+            "packed": str(self.path),
+            "files_known": len(self._index),
+            "files_loaded": len(self._entries),
+            "bytes_mapped": len(self._buffer),
+            "bytes_decoded": self._bytes_decoded,
+            "documents_decoded": self._documents_decoded,
+            "records_decoded": self._records_decoded,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Pack a mock corpus into one file.")
+    parser.add_argument("source", type=Path, nargs="?", default=MOCKS_DIR)
+    parser.add_argument("output", type=Path)
+    args = parser.parse_args(argv)
+    print(json.dumps(pack_corpus(args.source, args.output)))
+
+
+if __name__ == "__main__":
+    main()
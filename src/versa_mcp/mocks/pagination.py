@@ -0,0 +1,75 @@
+"""
+Mock Pagination
+
+Applies limit/offset query params to list payloads the way the Director
+does. A payload is pageable when it is an object carrying totalCount and
+exactly one list field; that list is sliced and totalCount, offset, limit
+and hasMore are set on a shallow copy of the envelope. Only the requested
+page is copied, never the full list.
+"""
+
+from typing import Any, Mapping, Optional
+
+from .corpus import CorpusEntry, find_list_key
+
+
+class PaginationError(ValueError):
+    """Raised when limit/offset params are not valid integers."""
+
+
+def _parse_int(params: Mapping[str, Any], name: str) -> Optional[int]:
+    value = params.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError(f"Invalid {name} '{value}': must be an integer")
+    if number < 0:
+        raise PaginationError(f"Invalid {name} '{value}': must not be negative")
+    return number
+
+
+def paginate(data: Any, params: Optional[Mapping[str, Any]]) -> Any:
+    """
+    Return the page of data selected by params.
+
+    Returns data itself when no limit/offset is given or the payload is not
+    pageable, so unpaged requests keep sharing the corpus object.
+    """
+    page = paginate_entry(CorpusEntry("", b"", data), params)
+    return data if page is None else page
+
+
+def paginate_entry(
+    entry: CorpusEntry, params: Optional[Mapping[str, Any]]
+) -> Optional[dict[str, Any]]:
+    """
+    Return the page of a corpus entry selected by params.
+
+    Only the records on the page are read from the entry, so packed corpora
+    decode just those. Returns None when the params select the whole
+    document, leaving the caller to serve entry.data unchanged.
+    """
+    if not params:
+        return None
+    limit = _parse_int(params, "limit")
+    offset = _parse_int(params, "offset")
+    if limit is None and offset is None:
+        return None
+
+    list_key = entry.list_key
+    if list_key is None:
+        return None
+
+    total = entry.count
+    start = min(offset or 0, total)
+    end = total if limit is None else min(start + limit, total)
+
+    page = entry.envelope()
+    page[list_key] = entry.records(start, end)
+    page["totalCount"] = total
+    page["offset"] = start
+    page["limit"] = limit if limit is not None else end - start
+    page["hasMore"] = end < total
+    return page
@@ -0,0 +1,298 @@
+"""
+Appliance Search Index
+
+Prefix, substring and typo-tolerant lookups over appliance names, orgs and
+tags, for the appliance search endpoint, the filterString/org/tags/type
+params of the appliance list endpoints, and the suggestions in 404 bodies.
+
+Terms are matched case-insensitively. Prefix lookups bisect a sorted term
+list; substring lookups intersect trigram posting lists and verify only the
+surviving candidates; suggestions rank trigram-sharing terms by similarity.
+Queries shorter than a trigram fall back to scanning the distinct terms.
+"""
+
+import difflib
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from .pagination import paginate
+
+# Characters after which a term starts a new word, e.g. NYC-|Branch-|001
+WORD_SEPARATORS = "-_ ./"
+
+# Rank of a term match, best first; org and tag matches rank after names
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING = range(4)
+_FIELD_RANK_OFFSET = {"name": 0, "org": 4, "tags": 8}
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _padded_trigrams(key: str) -> set[str]:
+    # Padding gives short terms and term boundaries their own trigrams
+    return _trigrams(f"  {key} ")
+
+
+def match_rank(key: str, query: str) -> Optional[int]:
+    """Rank how a lowercase term matches a lowercase query, or None."""
+    if key == query:
+        return EXACT
+    if key.startswith(query):
+        return PREFIX
+    position = key.find(query)
+    if position < 0:
+        return None
+    while position >= 0:
+        if key[position - 1] in WORD_SEPARATORS:
+            return WORD_PREFIX
+        position = key.find(query, position + 1)
+    return SUBSTRING
+
+
+class TrigramIndex:
+    """
+    Case-insensitive term index mapping each term to the ids it came from.
+
+    Usage:
+        index = TrigramIndex([("NYC-Branch-001", 0), ("NYC-Branch-002", 1)])
+        index.contains("branch-00")  # ["nyc-branch-001", "nyc-branch-002"]
+        index.similar("NYC-Brnch-001")  # ["NYC-Branch-001"]
+    """
+
+    def __init__(self, terms: Iterable[tuple[str, int]]):
+        self._ids: dict[str, list[int]] = {}
+        self._display: dict[str, str] = {}
+        for term, doc_id in terms:
+            key = term.casefold()
+            self._ids.setdefault(key, []).append(doc_id)
+            self._display.setdefault(key, term)
+        self.keys = sorted(self._ids)
+
+        grams: dict[str, list[int]] = {}
+        for position, key in enumerate(self.keys):
+            for gram in _padded_trigrams(key):
+                grams.setdefault(gram, []).append(position)
+        self._grams = grams
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def ids(self, key: str) -> list[int]:
+        """Ids of a lowercase term, in insertion order."""
+        return self._ids.get(key, [])
+
+    def display(self, key: str) -> str:
+        """Original spelling of a lowercase term."""
+        return self._display[key]
+
+    def exact(self, query: str) -> list[str]:
+        """The term equal to query, ignoring case."""
+        key = query.casefold()
+        return [key] if key in self._ids else []
+
+    def prefix(self, query: str) -> list[str]:
+        """Terms starting with query, in sorted order."""
+        query = query.casefold()
+        matches = []
+        for key in self.keys[bisect_left(self.keys, query) :]:
+            if not key.startswith(query):
+                break
+            matches.append(key)
+        return matches
+
+    def contains(self, query: str) -> list[str]:
+        """Terms containing query, in sorted order."""
+        query = query.casefold()
+        if len(query) < 3:
+            return [key for key in self.keys if query in key]
+        postings = sorted(
+            (self._grams.get(gram, ()) for gram in _trigrams(query)), key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            # Once the candidates are far fewer than a posting list, checking
+            # them directly is cheaper than intersecting
+            if not candidates or len(posting) > 8 * len(candidates):
+                break
+            candidates.intersection_update(posting)
+        return [self.keys[p] for p in sorted(candidates) if query in self.keys[p]]
+
+    def similar(self, query: str, n: int = 3, cutoff: float = 0.6) -> list[str]:
+        """Original spellings of up to n terms closest to query."""
+        key = query.casefold()
+        postings = [self._grams.get(gram, ()) for gram in _padded_trigrams(key)]
+        # Trigrams shared by most terms (e.g. "bra" in a fleet of Branch-NNN)
+        # cost the most to count and discriminate the least; skip them when
+        # rarer ones exist
+        common = max(len(self.keys) // 10, 64)
+        rare = [posting for posting in postings if len(posting) <= common]
+        shared: Counter[int] = Counter()
+        for posting in rare or postings:
+            shared.update(posting)
+        if not shared:
+            return []
+        # Rerank only the terms sharing the most trigrams with the query
+        candidates = [self.keys[p] for p, _ in shared.most_common(max(4 * n, 20))]
+        matches = difflib.get_close_matches(key, candidates, n=n, cutoff=cutoff)
+        return [self._display[match] for match in matches]
+
+
+class ApplianceIndex:
+    """
+    Search and filter index over a list of appliance records.
+
+    Positions returned by search() and filter() index into the records the
+    index was built from.
+    """
+
+    def __init__(self, records: Sequence[Mapping[str, Any]]):
+        self.source = records
+        self.names = TrigramIndex(
+            (r["name"], i) for i, r in enumerate(records) if r.get("name")
+        )
+        self.orgs = TrigramIndex(
+            (r["org"], i) for i, r in enumerate(records) if r.get("org")
+        )
+        self.tags = TrigramIndex(
+            (tag, i)
+            for i, r in enumerate(records)
+            for tag in r.get("tags") or ()
+            if isinstance(tag, str)
+        )
+        self._types: dict[str, list[int]] = {}
+        for i, r in enumerate(records):
+            if r.get("type"):
+                self._types.setdefault(r["type"].casefold(), []).append(i)
+
+    def _fields(self) -> list[tuple[str, TrigramIndex]]:
+        return [("name", self.names), ("org", self.orgs), ("tags", self.tags)]
+
+    def search(self, query: str) -> list[int]:
+        """Positions matching query, best match first."""
+        query = query.casefold()
+        # Ranks are few, so bucket by rank and only sort within a bucket
+        buckets: list[list[tuple[str, TrigramIndex]]] = [[] for _ in range(12)]
+        for field, index in self._fields():
+            offset = _FIELD_RANK_OFFSET[field]
+            # Exact and prefix matches come from the sorted term list; only
+            # the other substring matches need ranking
+            prefixed = index.prefix(query)
+            for key in prefixed:
+                rank = EXACT if key == query else PREFIX
+                buckets[offset + rank].append((key, index))
+            prefixed_keys = set(prefixed)
+            for key in index.contains(query):
+                if key in prefixed_keys:
+                    continue
+                rank = match_rank(key, query)
+                if rank is not None:
+                    buckets[offset + rank].append((key, index))
+
+        ranked: list[int] = []
+        seen: set[int] = set()
+        for bucket in buckets:
+            bucket.sort(key=lambda match: (len(match[0]), match[0]))
+            for key, index in bucket:
+                for position in index.ids(key):
+                    if position not in seen:
+                        seen.add(position)
+                        ranked.append(position)
+        return ranked
+
+    def filter(
+        self,
+        filter_string: Optional[str] = None,
+        org: Optional[str] = None,
+        tags: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> list[int]:
+        """Positions matching every given filter, in record order."""
+        selected: list[set[int]] = []
+        if filter_string:
+            matched: set[int] = set()
+            for _, index in self._fields():
+                for key in index.contains(filter_string):
+                    matched.update(index.ids(key))
+            selected.append(matched)
+        if org:
+            selected.append(
+                {p for key in self.orgs.exact(org) for p in self.orgs.ids(key)}
+            )
+        if tags:
+            for tag in (t.strip() for t in tags.split(",")):
+                if tag:
+                    selected.append(
+                        {p for key in self.tags.exact(tag) for p in self.tags.ids(key)}
+                    )
+        if type:
+            selected.append(set(self._types.get(type.casefold(), ())))
+        if not selected:
+            return list(range(len(self.source)))
+        selected.sort(key=len)
+        return sorted(set.intersection(*selected))
+
+    def suggest(self, name: str, n: int = 3) -> list[str]:
+        """Appliance names closest to a possibly misspelled name."""
+        return self.names.similar(name, n)
+
+
+# Indexes by id() of the indexed list; bounded so replaced corpora are released
+_indexes: dict[int, Any] = {}
+_MAX_INDEXES = 16
+
+
+def _cached(source: Any, build: Any) -> Any:
+    index = _indexes.get(id(source))
+    if index is None or index.source is not source:
+        index = build(source)
+        index.source = source
+        if len(_indexes) >= _MAX_INDEXES:
+            _indexes.pop(next(iter(_indexes)))
+        _indexes[id(source)] = index
+    return index
+
+
+def get_index(records: Sequence[Mapping[str, Any]]) -> ApplianceIndex:
+    """Get the index of an appliance list, building it on first use."""
+    return _cached(records, ApplianceIndex)
+
+
+def get_term_index(terms: Any) -> TrigramIndex:
+    """Get the index of a set of terms (e.g. registry names), built on first use."""
+    return _cached(terms, lambda source: TrigramIndex((t, 0) for t in source))
+
+
+SEARCH_PARAMS = frozenset(["name"])
+FILTER_PARAMS = frozenset(["filterString", "org", "tags", "type"])
+
+
+def _select(data: Any, positions: list[int], params: Mapping[str, Any]) -> Any:
+    """Build the envelope for the selected records, then page it."""
+    selected = dict(data)
+    records = data["appliances"]
+    selected["appliances"] = [records[p] for p in positions]
+    selected["totalCount"] = len(positions)
+    return paginate(selected, params)
+
+
+def search_appliances(data: Any, params: Mapping[str, Any]) -> Any:
+    """Handler for /vnms/appliance/applianceByName: ranked name search."""
+    name = params.get("name")
+    if not name:
+        return data
+    return _select(data, get_index(data["appliances"]).search(name), params)
+
+
+def filter_appliances(data: Any, params: Mapping[str, Any]) -> Any:
+    """Handler for appliance lists: filterString, org, tags and type."""
+    if not FILTER_PARAMS.intersection(k for k, v in params.items() if v):
+        return data
+    positions = get_index(data["appliances"]).filter(
+        filter_string=params.get("filterString"),
+        org=params.get("org"),
+        tags=params.get("tags"),
+        type=params.get("type"),
+    )
+    return _select(data, positions, params)
@@ -0,0 +1,72 @@
+"""
+Mock Corpus Watcher
+
+Polls a corpus directory in a background thread and refreshes the corpus
+when JSON files are added, removed or edited, so scenarios can be changed
+live during long soak tests. Polling only stats files, so it needs no
+platform file-notification support; a poll of a few hundred files takes
+well under a millisecond of the interval.
+
+Enable for the server's corpus with MOCK_CORPUS_WATCH=true environment
+variable; MOCK_CORPUS_WATCH_INTERVAL sets the poll interval in seconds
+(default 1.0).
+
+Usage:
+    watcher = CorpusWatcher(corpus, interval=0.5)
+    watcher.start()
+    ...
+    watcher.stop()
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from .corpus import MockCorpus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 1.0
+
+
+class CorpusWatcher:
+    """Background thread that calls corpus.refresh() every interval seconds."""
+
+    def __init__(self, corpus: MockCorpus, interval: Optional[float] = None):
+        if interval is None:
+            interval = float(
+                os.environ.get("MOCK_CORPUS_WATCH_INTERVAL", DEFAULT_INTERVAL)
+            )
+        self.corpus = corpus
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self) -> frozenset[str]:
+        """Refresh the corpus once. Returns the changed paths."""
+        return self.corpus.refresh()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                # A bad poll must not kill the watcher for the rest of the run
+                logger.exception("Mock corpus refresh failed")
+
+    def start(self) -> "CorpusWatcher":
+        """Start polling in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="mock-corpus-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,281 @@
+"""
+Auto-Pagination
+
+Walks every page of a paged Director endpoint server-side, so an agent asks
+for "all alarms" once instead of looping page by page through MCP.
+
+iter_pages is an async generator over the pages of one endpoint, requested
+by offset and limit. prefetching drives it in a background task one page
+ahead of the consumer, so the next page is already on its way while the
+current one is processed. fetch_all collects records across pages until
+the endpoint is exhausted or a record or byte cap is reached, reporting
+progress after each page.
+
+Sources (the paged tool each one replaces):
+    alarms            filter_paginate_alarm
+    audit_logs        get_audit_logs
+    appliances_lite   get_all_appliances_lite
+    appliance_status  get_all_appliance_status
+    next_page_data    get_next_page_data (params must include queryId)
+"""
+
+import json
+from contextlib import aclosing, asynccontextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import anyio
+from anyio.abc import ObjectReceiveStream
+from pydantic import BaseModel
+
+from .projection import check_fields, project_records
+from .schemas import (
+    AlarmPageItem,
+    ApplianceLiteItem,
+    ApplianceStatusItem,
+    AuditLogEntry,
+    PagedDataItem,
+)
+
+
+class PagedSource(NamedTuple):
+    path: str
+    list_key: str
+    model: type[BaseModel]
+    required: tuple[str, ...] = ()
+
+
+PAGED_SOURCES: dict[str, PagedSource] = {
+    "alarms": PagedSource("/vnms/fault/alarms/page", "alarms", AlarmPageItem),
+    "audit_logs": PagedSource("/vnms/audit/logs", "logs", AuditLogEntry),
+    "appliances_lite": PagedSource(
+        "/vnms/appliance/appliance/lite", "appliances", ApplianceLiteItem
+    ),
+    "appliance_status": PagedSource(
+        "/nextgen/appliance/status", "appliances", ApplianceStatusItem
+    ),
+    "next_page_data": PagedSource(
+        "/vnms/dashboard/appliance/next_page_data",
+        "data",
+        PagedDataItem,
+        ("queryId",),
+    ),
+}
+PAGE_PARAMS = ("limit", "offset")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_MAX_RECORDS = 10000
+MAX_RECORDS = 100000
+DEFAULT_MAX_BYTES = 1024 * 1024
+MAX_BYTES = 16 * 1024 * 1024
+
+# Called as progress(records fetched, totalCount or None, message)
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+
+class PagerError(ValueError):
+    """Raised when a paged request is invalid or one of its pages fails."""
+
+
+class Page(NamedTuple):
+    records: list[Any]
+    total: Optional[int]
+    offset: int
+
+
+def _has_more(body: dict[str, Any], offset: int, size: int, page_size: int) -> bool:
+    if "hasMore" in body:
+        return bool(body["hasMore"])
+    total = body.get("totalCount")
+    if isinstance(total, int):
+        return offset < total
+    return size == page_size
+
+
+async def iter_pages(
+    backend: Any,
+    url: str,
+    list_key: str,
+    params: Optional[Dict[str, str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    headers: Optional[Dict[str, str]] = None,
+) -> AsyncGenerator[Page, None]:
+    """
+    Yield each page of a paged endpoint in order, one request at a time.
+    A queryId returned with a page is sent with the next request.
+    """
+    params = dict(params or {})
+    offset = 0
+    while True:
+        page_params = {**params, "offset": str(offset), "limit": str(page_size)}
+        response = await backend.get(url, headers=headers, params=page_params)
+        if not 200 <= response.status_code < 300:
+            raise PagerError(
+                f"{url} returned {response.status_code} at offset {offset}"
+            )
+        body = response.json()
+        records = body.get(list_key) or []
+        total = body.get("totalCount")
+        yield Page(records, total if isinstance(total, int) else None, offset)
+
+        offset += len(records)
+        if body.get("queryId"):
+            params["queryId"] = body["queryId"]
+        # An empty page ends the walk even if the endpoint claims more
+        if not records or not _has_more(body, offset, len(records), page_size):
+            return
+
+
+async def _receive(
+    receive: ObjectReceiveStream,
+) -> AsyncIterator[Page]:
+    async for item in receive:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+@asynccontextmanager
+async def prefetching(
+    pages: AsyncGenerator[Page, None],
+) -> AsyncIterator[AsyncIterator[Page]]:
+    """
+    Iterate pages from a background task that fetches the next page while
+    the consumer handles the current one. Leaving the block early cancels
+    the outstanding fetch; a failed fetch is raised to the consumer.
+    """
+    # With no buffer the producer hands over a page, then fetches one ahead
+    send, receive = anyio.create_memory_object_stream(0)
+    done = anyio.Event()
+
+    async def produce() -> None:
+        async with send, aclosing(pages):
+            error: Optional[Exception] = None
+            try:
+                async for page in pages:
+                    await send.send(page)
+            except Exception as e:
+                error = e
+            # Nothing is left to cancel once the pages are exhausted or failed
+            done.set()
+            if error is not None:
+                await send.send(error)
+
+    # Errors in the block are raised outside the task group, so the caller
+    # sees them as raised rather than wrapped in an ExceptionGroup
+    failure: Optional[Exception] = None
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(produce)
+        async with receive:
+            try:
+                yield _receive(receive)
+            except Exception as e:
+                failure = e
+            finally:
+                if not done.is_set():
+                    tg.cancel_scope.cancel()
+    if failure is not None:
+        raise failure
+
+
+def _check_limit(name: str, value: int, maximum: int) -> int:
+    if not 1 <= value <= maximum:
+        raise PagerError(f"{name} must be between 1 and {maximum}: {value}")
+    return value
+
+
+async def fetch_all(
+    backend: Any,
+    base_url: str,
+    source: str,
+    params: Optional[Dict[str, str]] = None,
+    page_size: Optional[int] = None,
+    max_records: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> dict[str, Any]:
+    """
+    Collect the records of every page of source, stopping early once
+    max_records records or max_bytes of encoded JSON records are collected.
+    params are the source tool's filters; the pager sets limit and offset.
+    Records are projected to fields, if given, before they are counted.
+    """
+    if source not in PAGED_SOURCES:
+        raise PagerError(
+            f"Unknown source '{source}': use one of {', '.join(PAGED_SOURCES)}"
+        )
+    spec = PAGED_SOURCES[source]
+    params = dict(params or {})
+    reserved = [name for name in PAGE_PARAMS if name in params]
+    if reserved:
+        raise PagerError(f"{', '.join(reserved)} is set by the pager: remove it")
+    missing = [name for name in spec.required if not params.get(name)]
+    if missing:
+        raise PagerError(f"Source '{source}' requires {', '.join(missing)}")
+    fields = check_fields(fields, spec.model)
+    page_size = _check_limit(
+        "page_size",
+        DEFAULT_PAGE_SIZE if page_size is None else page_size,
+        MAX_PAGE_SIZE,
+    )
+    max_records = _check_limit(
+        "max_records",
+        DEFAULT_MAX_RECORDS if max_records is None else max_records,
+        MAX_RECORDS,
+    )
+    max_bytes = _check_limit(
+        "max_bytes", DEFAULT_MAX_BYTES if max_bytes is None else max_bytes, MAX_BYTES
+    )
+
+    records: list[Any] = []
+    size = 0
+    pages = 0
+    total: Optional[int] = None
+    stop_reason = "complete"
+    url = f"{base_url}{spec.path}"
+    pager = iter_pages(backend, url, spec.list_key, params, page_size, headers)
+    async with prefetching(pager) as stream:
+        async for page in stream:
+            pages += 1
+            total = page.total
+            page_records = page.records
+            if fields is not None:
+                page_records = project_records(page_records, fields)
+            for record in page_records:
+                if len(records) >= max_records:
+                    stop_reason = "max_records"
+                    break
+                record_size = len(json.dumps(record, separators=(",", ":")))
+                if size + record_size > max_bytes:
+                    stop_reason = "max_bytes"
+                    break
+                records.append(record)
+                size += record_size
+            if progress is not None:
+                of = f" of {total}" if total is not None else ""
+                await progress(len(records), total, f"{len(records)}{of} {source}")
+            if stop_reason != "complete":
+                break
+
+    return {
+        "source": source,
+        "totalCount": total,
+        "fetched": len(records),
+        "pages": pages,
+        "bytes": size,
+        "truncated": stop_reason != "complete",
+        "stopReason": stop_reason,
+        "records": records,
+    }
@@ -0,0 +1,85 @@
+"""
+Field Projection
+
+List tools take fields, the record keys the agent needs (for example
+["name", "pingStatus"]). Every record is cut down to those keys before the
+response is serialized, so unrequested fields cost neither bytes on the
+wire nor tokens in the LLM context. Names are the Director's field names
+and are checked against the record model, so a typo is rejected instead
+of returning empty rows.
+
+MCP fixes a tool's output schema when tools are listed, so the schema
+cannot follow each call's fields; the record models of projectable lists
+instead leave every field optional (see _projectable in schemas.py).
+"""
+
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel
+
+
+class ProjectionError(ValueError):
+    """Raised when fields is empty or names a field the records lack."""
+
+
+@lru_cache(maxsize=None)
+def field_names(model: type[BaseModel]) -> tuple[str, ...]:
+    """The Director's names (schema aliases) for the fields of model."""
+    return tuple(field.alias or name for name, field in model.model_fields.items())
+
+
+def check_fields(
+    fields: Optional[Sequence[str]], model: Optional[type[BaseModel]] = None
+) -> Optional[tuple[str, ...]]:
+    """
+    Deduplicate fields and check them against model's field names; None
+    (no projection) is passed through.
+    """
+    if fields is None:
+        return None
+    fields = tuple(dict.fromkeys(fields))
+    if not fields:
+        raise ProjectionError("fields must name at least one field")
+    if model is not None:
+        known = field_names(model)
+        unknown = [name for name in fields if name not in known]
+        if unknown:
+            raise ProjectionError(
+                f"Unknown field(s) {', '.join(unknown)}: use {', '.join(known)}"
+            )
+    return fields
+
+
+def project_records(records: list[Any], fields: Sequence[str]) -> list[Any]:
+    """New records holding only fields; the originals are left untouched."""
+    return [
+        (
+            {name: record[name] for name in fields if name in record}
+            if isinstance(record, dict)
+            else record
+        )
+        for record in records
+    ]
+
+
+def project(
+    body: Any,
+    list_key: str,
+    fields: Optional[Sequence[str]],
+    model: Optional[type[BaseModel]] = None,
+) -> Any:
+    """
+    Return body with each record of its list_key list projected to fields.
+    Bodies without that list, such as error bodies, are returned unchanged.
+    """
+    fields = check_fields(fields, model)
+    if fields is None or not isinstance(body, dict):
+        return body
+    records = body.get(list_key)
+    if not isinstance(records, list):
+        return body
+    # Copy the envelope: mock and cached bodies are shared between calls
+    projected = dict(body)
+    projected[list_key] = project_records(records, fields)
+    return projected
@@ -0,0 +1,367 @@
+"""
+Response Cache
+
+ResponseCache wraps a backend and answers repeated GETs from memory, so
+repeated agent questions stop hitting the Director. Each endpoint pattern
+has its own TTL (CACHE_TTLS, else DEFAULT_TTL): near-static data such as
+model numbers and alarm types is kept for an hour, volatile data such as
+live appliance status is never cached. Entries are keyed on the normalized
+request (path and sorted non-empty params, see cassette.request_key),
+bounded in number and evicted least recently used first. Only 2xx responses
+are cached; any non-GET request clears the cache.
+
+Constantly polled dashboard endpoints (MAX_STALE) are served
+stale-while-revalidate: once an entry expires it is still served
+immediately, for up to its max staleness, while one background refresh
+replaces it, so tool latency stays flat when the Director is slow. Their
+dict responses carry a "cacheInfo" marker with the data's age in seconds
+and whether it is stale. Background refreshes need the cache to be opened
+(async with) on asyncio, as the server lifespan does; otherwise expired
+entries are fetched in the foreground. Each refresh runs in a task of its
+own rather than in a task group held open across the lifespan, and closing
+the cache (aclose) cancels and waits for those still running. A response
+fetched before the cache was cleared is not stored after it.
+
+Configure it with environment variables:
+    RESPONSE_CACHE         true or false (default true with MOCK_MODE=false,
+                           false for the mock and replay backends)
+    RESPONSE_CACHE_SIZE    maximum cached responses (default 1024)
+    RESPONSE_CACHE_TTLS    JSON object of endpoint pattern -> seconds,
+                           merged over CACHE_TTLS (0 disables caching)
+    RESPONSE_CACHE_MAX_STALE
+                           JSON object of endpoint pattern -> seconds,
+                           merged over MAX_STALE (0 disables revalidation)
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlparse
+
+import anyio
+
+from .backend import BackendConfigError
+from .mocks.cassette import request_key
+from .mocks.endpoint_map import match_endpoint
+
+DEFAULT_TTL = 30.0
+NEAR_STATIC_TTL = 3600.0
+
+CACHE_TTLS: dict[str, float] = {
+    # Near-static: changes on software upgrades or provisioning only
+    "/nextgen/deviceGroup/modelNumbers": NEAR_STATIC_TTL,
+    "/vnms/fault/types": NEAR_STATIC_TTL,
+    "/vnms/fault/appliance/types": NEAR_STATIC_TTL,
+    "/vnms/fault/appliance/alarm_model": NEAR_STATIC_TTL,
+    "/vnms/dashboard/vdStatus/packageInfo": NEAR_STATIC_TTL,
+    "/vnms/dashboard/appliance/{applianceName}/capabilities": NEAR_STATIC_TTL,
+    # Volatile: always fetched
+    "/vnms/dashboard/appliance/{applianceName}/live": 0,
+    # Polled constantly and revalidated in the background (see MAX_STALE)
+    "/vnms/dashboard/vdStatus/sysUptime": 5.0,
+}
+
+DASHBOARD_MAX_STALE = 300.0
+
+MAX_STALE: dict[str, float] = {
+    "/vnms/dashboard/vdStatus": DASHBOARD_MAX_STALE,
+    "/vnms/dashboard/vdStatus/haDetails": DASHBOARD_MAX_STALE,
+    "/vnms/dashboard/vdStatus/packageInfo": DASHBOARD_MAX_STALE,
+    "/vnms/dashboard/vdStatus/sysDetails": DASHBOARD_MAX_STALE,
+    "/vnms/dashboard/vdStatus/sysUptime": DASHBOARD_MAX_STALE,
+    "/vnms/dashboard/status/headEnds": DASHBOARD_MAX_STALE,
+    "/vnms/fault/alarms/summary": DASHBOARD_MAX_STALE,
+    "/vnms/fault/alarms/summary/{org}": DASHBOARD_MAX_STALE,
+    "/vnms/fault/alarms/summary/device/{deviceName}": DASHBOARD_MAX_STALE,
+    "/vnms/fault/analytics/alarms/summary": DASHBOARD_MAX_STALE,
+    "/vnms/fault/director/alarms/summary": DASHBOARD_MAX_STALE,
+    "/vnms/fault/director/pop-up-summary": DASHBOARD_MAX_STALE,
+}
+
+
+class CacheEntry(NamedTuple):
+    """A cached response and when it was stored and expires."""
+
+    response: Any
+    stored_at: float
+    expires_at: float
+
+
+class CachedResponse:
+    """
+    A cached response served with a cacheInfo marker added to its JSON body.
+    The cached body itself is not modified.
+    """
+
+    def __init__(self, response: Any, age_s: float, stale: bool):
+        self.response = response
+        self.status_code = response.status_code
+        self.age_s = age_s
+        self.stale = stale
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    def json(self) -> Any:
+        data = self.response.json()
+        if not isinstance(data, dict):
+            return data
+        marker = {"ageSeconds": round(self.age_s, 1), "stale": self.stale}
+        return {**data, "cacheInfo": marker}
+
+
+def _env_seconds(name: str) -> Optional[dict[str, float]]:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return {str(k): float(v) for k, v in json.loads(value).items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        raise BackendConfigError(
+            f"{name} must be a JSON object of pattern -> seconds: {e}"
+        ) from e
+
+
+class ResponseCache:
+    """
+    Backend wrapper caching GET responses per endpoint TTL with an LRU bound.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_stale: Optional[Mapping[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.max_stale = {**MAX_STALE, **(max_stale or {})}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._open = False
+        # Cancel scope of each key's refresh in flight, and the tasks
+        # running them (the event loop only holds tasks weakly)
+        self._revalidating: dict[str, anyio.CancelScope] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._drained: Optional[anyio.Event] = None
+        # Bumped by clear(), so fetches begun before it are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.stale_hits = 0
+        self.revalidations = 0
+        self.revalidation_errors = 0
+
+    @classmethod
+    def from_env(cls, backend: Any, **kwargs: Any) -> "ResponseCache":
+        """Wrap backend in a cache configured by RESPONSE_CACHE_* variables."""
+        settings: dict[str, Any] = {}
+        size = os.environ.get("RESPONSE_CACHE_SIZE")
+        if size:
+            try:
+                settings["max_entries"] = int(size)
+            except ValueError:
+                settings["max_entries"] = 0
+            if settings["max_entries"] <= 0:
+                raise BackendConfigError(
+                    f"RESPONSE_CACHE_SIZE must be a positive integer: {size!r}"
+                )
+        settings["ttls"] = _env_seconds("RESPONSE_CACHE_TTLS")
+        settings["max_stale"] = _env_seconds("RESPONSE_CACHE_MAX_STALE")
+        settings.update(kwargs)
+        return cls(backend, **settings)
+
+    async def __aenter__(self):
+        if hasattr(self.backend, "__aenter__"):
+            await self.backend.__aenter__()
+        # Refreshes are spawned as asyncio tasks
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._open = False
+        else:
+            self._open = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.aclose()
+        finally:
+            if hasattr(self.backend, "__aexit__"):
+                await self.backend.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def aclose(self) -> None:
+        """Stop background refreshes, cancelling and awaiting those running."""
+        self._open = False
+        for scope in self._revalidating.values():
+            scope.cancel()
+        if self._revalidating:
+            self._drained = anyio.Event()
+            await self._drained.wait()
+
+    def policy_for(self, path: str) -> tuple[float, float]:
+        """(ttl, max_stale) seconds for path; a ttl of 0 means never cached."""
+        route = match_endpoint(path)
+        if route is None:
+            return self.default_ttl, 0.0
+        return (
+            self.ttls.get(route.pattern, self.default_ttl),
+            self.max_stale.get(route.pattern, 0.0),
+        )
+
+    def ttl_for(self, path: str) -> float:
+        """Seconds responses for path are cached (0 for never)."""
+        return self.policy_for(path)[0]
+
+    def _store(self, key: str, response: Any, ttl: float) -> CacheEntry:
+        now = self.clock()
+        entry = self._entries[key] = CacheEntry(response, now, now + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Serve a GET from the cache, or fetch and cache it."""
+        ttl, max_stale = self.policy_for(urlparse(url).path)
+        if ttl <= 0:
+            self.bypassed += 1
+            return await self.backend.get(url, headers=headers, params=params, **kwargs)
+
+        key = request_key("GET", url, params)
+        entry = self._entries.get(key)
+        now = self.clock()
+        if entry is not None and now < entry.expires_at:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._serve(entry, now, max_stale, stale=False)
+
+        if entry is not None and now < entry.expires_at + max_stale and self._open:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            if key not in self._revalidating:
+                self._revalidating[key] = anyio.CancelScope()
+                self._spawn(
+                    self._revalidate,
+                    key,
+                    ttl,
+                    self._generation,
+                    url,
+                    headers,
+                    params,
+                    kwargs,
+                )
+            return self._serve(entry, now, max_stale, stale=True)
+
+        self.misses += 1
+        generation = self._generation
+        response = await self.backend.get(url, headers=headers, params=params, **kwargs)
+        if not 200 <= response.status_code < 300:
+            return response
+        if generation != self._generation:
+            return response
+        entry = self._store(key, response, ttl)
+        return self._serve(entry, entry.stored_at, max_stale, stale=False)
+
+    def _serve(
+        self, entry: CacheEntry, now: float, max_stale: float, stale: bool
+    ) -> Any:
+        if max_stale <= 0:
+            return entry.response
+        return CachedResponse(entry.response, now - entry.stored_at, stale)
+
+    def _spawn(self, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Run func(*args) in a task of its own, outside the caller's cancel
+        scopes, so no task group has to stay open across the server lifespan.
+        """
+        task = asyncio.get_running_loop().create_task(func(*args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _revalidate(
+        self,
+        key: str,
+        ttl: float,
+        generation: int,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Refresh a stale entry; on failure the stale entry is kept. A refresh
+        begun before the cache was cleared is dropped.
+        """
+        try:
+            with self._revalidating[key]:
+                response = await self.backend.get(
+                    url, headers=headers, params=params, **kwargs
+                )
+                if generation != self._generation:
+                    return
+                if 200 <= response.status_code < 300:
+                    self._store(key, response, ttl)
+                    self.revalidations += 1
+                else:
+                    self.revalidation_errors += 1
+        except Exception:
+            self.revalidation_errors += 1
+        finally:
+            del self._revalidating[key]
+            if not self._revalidating and self._drained is not None:
+                self._drained.set()
+
+    def clear(self) -> None:
+        """Drop every cached response, and any fetch still in flight."""
+        self._entries.clear()
+        self._generation += 1
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Forward a POST; the change may affect any cached response."""
+        self.clear()
+        return await self.backend.post(url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Any:
+        """Forward a PUT; the change may affect any cached response."""
+        self.clear()
+        return await self.backend.put(url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """Forward a DELETE; the change may affect any cached response."""
+        self.clear()
+        return await self.backend.delete(url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit, miss, bypass, revalidation and eviction counts, and the size."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "revalidations": self.revalidations,
+            "revalidation_errors": self.revalidation_errors,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "hit_rate": (
+                round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0
+            ),
+        }
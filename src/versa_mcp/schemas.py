@@ -8,6 +8,14 @@ from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
 
+def _projectable(schema: Dict[str, Any]) -> None:
+    """
+    Drop required from the JSON schema of a list row that tools can project
+    to the requested fields (see projection.py).
+    """
+    schema.pop("required", None)
+
+
 # =============================================================================
 # Common/Shared Models
 # =============================================================================
@@ -20,6 +28,10 @@ class Location(BaseModel):
     longitude: float
 
 
+# Alarm severities, most severe first
+SEVERITIES = ("CRITICAL", "MAJOR", "MINOR", "WARNING")
+
+
 class SeverityCounts(BaseModel):
     """Alarm counts by severity level."""
     CRITICAL: int = 0
@@ -46,7 +58,7 @@ class ApplianceStatusItem(BaseModel):
     software_version: str = Field(alias="softwareVersion")
     last_updated: str = Field(alias="lastUpdated")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "json_schema_extra": _projectable}
 
 
 class AllApplianceStatusResponse(BaseModel):
@@ -121,6 +133,8 @@ class ApplianceLocationItem(BaseModel):
     address: str
     status: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class ApplianceLocationsResponse(BaseModel):
     """Response for get_appliance_locations."""
@@ -159,6 +173,8 @@ class ApplianceByTypeItem(BaseModel):
     tags: List[str]
     status: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class AppliancesByTypeResponse(BaseModel):
     """Response for get_all_appliances_by_type_and_tags."""
@@ -175,6 +191,8 @@ class ApplianceLiteItem(BaseModel):
     org: str
     status: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class AppliancesLiteResponse(BaseModel):
     """Response for get_all_appliances_lite."""
@@ -193,6 +211,8 @@ class ApplianceLiteViewItem(BaseModel):
     status: str
     ip: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class AppliancesLiteViewResponse(BaseModel):
     """Response for get_all_appliances_liteview."""
@@ -575,6 +595,8 @@ class BasicApplianceItem(BaseModel):
     status: str
     ip: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class AppliancesBasicResponse(BaseModel):
     """Response for get_all_appliances_basic_details."""
@@ -628,7 +650,7 @@ class AuditLogEntry(BaseModel):
     source_ip: str = Field(alias="sourceIp")
     result: str
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "json_schema_extra": _projectable}
 
 
 class AuditLogsResponse(BaseModel):
@@ -928,6 +950,8 @@ class PagedDataItem(BaseModel):
     name: str
     status: str
 
+    model_config = {"json_schema_extra": _projectable}
+
 
 class PagedDataResponse(BaseModel):
     """Response for get_next_page_data."""
@@ -1318,7 +1342,7 @@ class AlarmPageItem(BaseModel):
     is_cleared: bool = Field(alias="isCleared")
     ack_state: str = Field(alias="ackState")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "json_schema_extra": _projectable}
 
 
 class AlarmsPageResponse(BaseModel):
@@ -1622,6 +1646,82 @@ class StatusChangeResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+# =============================================================================
+# Bulk Models
+# =============================================================================
+
+
+class BulkApplianceStatusResponse(BaseModel):
+    """Response for get_bulk_appliance_status."""
+    view: str
+    requested: int
+    succeeded: int
+    failed: int
+    results: Dict[str, Dict[str, Any]]
+    errors: Dict[str, str]
+
+
+class FleetDeviceRow(BaseModel):
+    """One appliance in a fleet snapshot."""
+    uuid: str
+    name: str
+    org: str
+    site: Optional[str] = None
+    ping: Optional[str] = None
+    sync: Optional[str] = None
+    services: Optional[str] = None
+    alarms: Dict[str, int]
+    highest_severity: Optional[str] = Field(default=None, alias="highestSeverity")
+    pending_changes: Optional[int] = Field(default=None, alias="pendingChanges")
+    last_sync: Optional[str] = Field(default=None, alias="lastSync")
+
+    model_config = {"populate_by_name": True}
+
+
+class FleetSnapshotResponse(BaseModel):
+    """Response for get_fleet_snapshot."""
+    total_count: int = Field(alias="totalCount")
+    fleet_size: int = Field(alias="fleetSize")
+    alarms_truncated: bool = Field(alias="alarmsTruncated")
+    status_truncated: bool = Field(default=False, alias="statusTruncated")
+    devices: List[FleetDeviceRow]
+    errors: Dict[str, str]
+
+    model_config = {"populate_by_name": True}
+
+
+class FetchAllResponse(BaseModel):
+    """Response for fetch_all_pages."""
+    source: str
+    total_count: Optional[int] = Field(default=None, alias="totalCount")
+    fetched: int
+    pages: int
+    bytes: int
+    truncated: bool
+    stop_reason: str = Field(alias="stopReason")
+    records: List[Dict[str, Any]]
+
+    model_config = {"populate_by_name": True}
+
+
+# =============================================================================
+# Response Budget
+# =============================================================================
+
+
+class BudgetInfo(BaseModel):
+    """How a response was cut to fit its response budget."""
+    list_key: Optional[str] = Field(default=None, alias="listKey")
+    returned: int
+    omitted: int
+    bytes: int
+    over_budget: bool = Field(alias="overBudget")
+    omitted_counts: Dict[str, Dict[str, int]] = Field(alias="omittedCounts")
+    cursor: Optional[str] = None
+
+    model_config = {"populate_by_name": True}
+
+
 # =============================================================================
 # Error Response
 # =============================================================================
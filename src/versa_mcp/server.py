@@ -1,15 +1,26 @@
 """
 Versa Networks MCP Server - Standalone
 
-A standalone FastMCP server exposing all 67 Versa Director API tools directly.
-Each tool is exposed via @mcp.tool() decorator.
+A standalone FastMCP server exposing all 67 Versa Director API tools directly,
+plus bulk tools that combine many Director calls into one tool call and a
+pager tool that walks every page of a paged endpoint.
+Each tool is exposed via @mcp.tool() decorator; @budgeted lets every tool
+fit its response into a byte or token budget (see budget.py).
+All tools share one Director backend, opened for the server's lifetime and
+selected with MOCK_MODE (see backend.py).
 """
 
+from contextlib import asynccontextmanager
 from typing import Any, Optional
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
-from .mocks.mock_client import MockAsyncClient
+from .backend import get_backend, open_backend
+from .budget import budgeted
+from .bulk import fetch_appliance_statuses
+from .fleet import fleet_snapshot
+from .pager import fetch_all
+from .projection import project
 from .schemas import (
     AllApplianceStatusResponse,
     SingleApplianceStatusResponse,
@@ -78,16 +89,37 @@ from .schemas import (
     ImpAlarmSummaryResponse,
     ImpAlarmsResponse,
     StatusChangeResponse,
+    BulkApplianceStatusResponse,
+    FleetSnapshotResponse,
+    FetchAllResponse,
+    AlarmPageItem,
+    ApplianceByTypeItem,
+    ApplianceLiteItem,
+    ApplianceLiteViewItem,
+    ApplianceLocationItem,
+    ApplianceStatusItem,
+    AuditLogEntry,
+    BasicApplianceItem,
+    PagedDataItem,
 )
 
 MOCK_DIRECTOR_URL = "https://mock-director.local"
+# The mock accepts any token; DirectorClient swaps in an OAuth token (auth.py)
 MOCK_HEADERS = {
     "Authorization": "Bearer mock-token",
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
-mcp = FastMCP("versa-mcp")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Open the shared Director backend for the lifetime of the server."""
+    async with open_backend() as backend:
+        yield {"backend": backend}
+
+
+mcp = FastMCP("versa-mcp", lifespan=lifespan)
 
 
 # =============================================================================
@@ -96,10 +128,13 @@ mcp = FastMCP("versa-mcp")
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliance_status(
-    limit: Optional[str] = None, offset: Optional[str] = None
+    limit: Optional[str] = None,
+    offset: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AllApplianceStatusResponse:
-    """Get All Appliance Status - returns status for all appliances with pagination."""
+    """Get All Appliance Status - returns status for all appliances with pagination; fields returns only those keys of each appliance."""
     url = f"{MOCK_DIRECTOR_URL}/nextgen/appliance/status"
     query_params = {}
     if limit:
@@ -107,12 +142,12 @@ async def get_all_appliance_status(
     if offset:
         query_params["offset"] = offset
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "appliances", fields, ApplianceStatusItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_single_appliance_status(
     id: str, byName: Optional[str] = None
 ) -> SingleApplianceStatusResponse:
@@ -122,12 +157,12 @@ async def get_single_appliance_status(
     if byName:
         query_params["byName"] = byName
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_device_template_listing(
     deviceName: str, tenant: Optional[str] = None
 ) -> DeviceTemplateListingResponse:
@@ -137,39 +172,42 @@ async def get_device_template_listing(
     if tenant:
         query_params["tenant"] = tenant
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
-async def get_appliance_locations() -> ApplianceLocationsResponse:
-    """Get Appliance Locations - returns all appliance locations with coordinates."""
+@budgeted
+async def get_appliance_locations(
+    fields: Optional[list[str]] = None,
+) -> ApplianceLocationsResponse:
+    """Get Appliance Locations - returns all appliance locations with coordinates; fields returns only those keys of each location."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/location"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
+    return project(response.json(), "locations", fields, ApplianceLocationItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_routing_instance_information(
     applianceName: str,
 ) -> RoutingInstancesResponse:
     """Get Routing Instance Information - returns routing instances for an appliance."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/appliance/{applianceName}/routing-instances"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliances_by_type_and_tags(
     offset: Optional[str] = None,
     limit: Optional[str] = None,
     type: Optional[str] = None,
     tags: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AppliancesByTypeResponse:
-    """Get All Appliances By Type and Tags - returns appliances filtered by type and tags."""
+    """Get All Appliances By Type and Tags - returns appliances filtered by type and tags; fields returns only those keys of each appliance."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/appliance/appliance"
     query_params = {}
     if offset:
@@ -181,20 +219,21 @@ async def get_all_appliances_by_type_and_tags(
     if tags:
         query_params["tags"] = tags
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "appliances", fields, ApplianceByTypeItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliances_lite(
     filterString: Optional[str] = None,
     limit: Optional[str] = None,
     offset: Optional[str] = None,
     org: Optional[str] = None,
     tags: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AppliancesLiteResponse:
-    """Get All Appliances Lite - returns lightweight appliance list."""
+    """Get All Appliances Lite - returns lightweight appliance list; fields returns only those keys of each appliance."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/appliance/appliance/lite"
     query_params = {}
     if filterString:
@@ -208,12 +247,12 @@ async def get_all_appliances_lite(
     if tags:
         query_params["tags"] = tags
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "appliances", fields, ApplianceLiteItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliances_liteview(
     exportToCSV: Optional[str] = None,
     filterString: Optional[str] = None,
@@ -221,8 +260,9 @@ async def get_all_appliances_liteview(
     offset: Optional[str] = None,
     org: Optional[str] = None,
     tags: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AppliancesLiteViewResponse:
-    """Get All Appliances LiteView - returns lightweight appliance view with IPs."""
+    """Get All Appliances LiteView - returns lightweight appliance view with IPs; fields returns only those keys of each appliance."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/appliance/appliance/liteView"
     query_params = {}
     if exportToCSV:
@@ -238,12 +278,12 @@ async def get_all_appliances_liteview(
     if tags:
         query_params["tags"] = tags
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "appliances", fields, ApplianceLiteViewItem)
 
 
 @mcp.tool()
+@budgeted
 async def search_appliance_by_name(
     name: str,
     limit: Optional[str] = None,
@@ -257,12 +297,12 @@ async def search_appliance_by_name(
     if offset:
         query_params["offset"] = offset
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def export_appliance_configuration(
     applianceName: str, export_as_plain_text: Optional[str] = None
 ) -> ConfigurationExportResponse:
@@ -272,12 +312,12 @@ async def export_appliance_configuration(
     if export_as_plain_text:
         query_params["export-as-plain-text"] = export_as_plain_text
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliances_summary(
     filterByName: Optional[str] = None,
 ) -> AppliancesSummaryResponse:
@@ -287,30 +327,30 @@ async def get_appliances_summary(
     if filterByName:
         query_params["filterByName"] = filterByName
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_details_by_uuid(Uuid: str) -> ApplianceDetailsResponse:
     """Get Appliance Details by UUID - returns detailed appliance information."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/{Uuid}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_hardware(Uuid: str) -> ApplianceHardwareResponse:
     """Get Appliance Hardware - returns appliance hardware details."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/{Uuid}/hardware"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_bw_measurement(
     applianceName: str,
     command: Optional[str] = None,
@@ -324,71 +364,72 @@ async def get_bw_measurement(
     if uuid:
         query_params["uuid"] = uuid
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_capabilities(applianceName: str) -> CapabilitiesResponse:
     """Get Appliance Capabilities - returns appliance capabilities."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/{applianceName}/capabilities"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_sync_status(applianceUUID: str) -> SyncStatusResponse:
     """Get Appliance Sync Status - returns appliance sync status."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/{applianceUUID}/syncStatus"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_services(applianceName: str) -> ApplianceServicesResponse:
     """Get Appliance Services - returns appliance services."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/applianceServices/{applianceName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_status(applianceUUID: str) -> ApplianceStatusResponse:
     """Get Appliance Status - returns appliance status."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/applianceStatus/{applianceUUID}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_status_brief(applianceUUID: str) -> StatusBriefResponse:
     """Get Appliance Status Brief - returns brief appliance status."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/applianceStatus/{applianceUUID}/brief"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliance_names() -> ApplianceNamesResponse:
     """Get All Appliance Names - returns all appliance names."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/cloud/systems/getAllApplianceNames"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_all_appliances_basic_details(
     limit: Optional[str] = None,
     offset: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AppliancesBasicResponse:
-    """Get All Appliances Basic Details - returns basic appliance details."""
+    """Get All Appliances Basic Details - returns basic appliance details; fields returns only those keys of each appliance."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/cloud/systems/getAllAppliancesBasicDetails"
     query_params = {}
     if limit:
@@ -396,17 +437,16 @@ async def get_all_appliances_basic_details(
     if offset:
         query_params["offset"] = offset
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "appliances", fields, BasicApplianceItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_violations(applianceName: str) -> ViolationsResponse:
     """Get Appliance Violations - returns appliance violations."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/applianceviolations/{applianceName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
@@ -416,6 +456,7 @@ async def get_appliance_violations(applianceName: str) -> ViolationsResponse:
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_live_status(
     applianceName: str,
     command: Optional[str] = None,
@@ -438,18 +479,19 @@ async def get_appliance_live_status(
     if uuid:
         query_params["uuid"] = uuid
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_next_page_data(
     queryId: str,
     filters: Optional[str] = None,
     offset: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> PagedDataResponse:
-    """Get Next Page Data - returns next page of data."""
+    """Get Next Page Data - returns next page of data; fields returns only those keys of each row."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/appliance/next_page_data"
     query_params: dict[str, Any] = {"queryId": queryId}
     if filters:
@@ -457,32 +499,32 @@ async def get_next_page_data(
     if offset:
         query_params["offset"] = offset
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "data", fields, PagedDataItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_enable_monitoring() -> MonitoringConfigResponse:
     """Get Enable Monitoring - returns monitoring configuration."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/enableMonitoring"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_device_status_pulling_enabled(
     deviceName: str,
 ) -> MonitorPullEnabledResponse:
     """Get Device Status Pulling Enabled - returns device status pulling info."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/getMonitorPullEnabled/{deviceName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_health_ike(deviceName: Optional[str] = None) -> IkeHealthResponse:
     """Get Health IKE - returns IKE health data."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/health/ike"
@@ -490,12 +532,12 @@ async def get_health_ike(deviceName: Optional[str] = None) -> IkeHealthResponse:
     if deviceName:
         query_params["deviceName"] = deviceName
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_health_interface(
     deviceName: Optional[str] = None,
 ) -> InterfaceHealthResponse:
@@ -505,12 +547,12 @@ async def get_health_interface(
     if deviceName:
         query_params["deviceName"] = deviceName
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_health_path(deviceName: Optional[str] = None) -> PathHealthResponse:
     """Get Health Path - returns path health data."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/health/path"
@@ -518,21 +560,21 @@ async def get_health_path(deviceName: Optional[str] = None) -> PathHealthRespons
     if deviceName:
         query_params["deviceName"] = deviceName
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_devices_in_lte() -> LteDevicesResponse:
     """Get Devices in LTE - returns LTE devices."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/lte/list"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_nav_tree_node(
     appUUID: Optional[str] = None,
     forceRefresh: Optional[str] = None,
@@ -548,62 +590,61 @@ async def get_nav_tree_node(
     if skipCpeNodes:
         query_params["skipCpeNodes"] = skipCpeNodes
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_head_end_status() -> HeadEndStatusResponse:
     """Get Head-End Status - returns head-end status."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/status/headEnds"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_vd_status() -> VdStatusResponse:
     """Get VD Status - returns VD status."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/vdStatus"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_vd_ha_details() -> VdHaDetailsResponse:
     """Get VD HA Details - returns VD HA details."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/vdStatus/haDetails"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_vd_package_info() -> VdPackageInfoResponse:
     """Get VD Package Info - returns VD package info."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/vdStatus/packageInfo"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_sys_details() -> SysDetailsResponse:
     """Get Sys Details - returns system details."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/vdStatus/sysDetails"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_sys_uptime() -> SysUptimeResponse:
     """Get Sys Uptime - returns system uptime."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/dashboard/vdStatus/sysUptime"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
@@ -613,12 +654,14 @@ async def get_sys_uptime() -> SysUptimeResponse:
 
 
 @mcp.tool()
+@budgeted
 async def get_audit_logs(
     limit: Optional[str] = None,
     offset: Optional[str] = None,
     searchKey: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AuditLogsResponse:
-    """Get Audit Logs - returns audit log entries."""
+    """Get Audit Logs - returns audit log entries; fields returns only those keys of each log entry."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/audit/logs"
     query_params = {}
     if limit:
@@ -628,9 +671,8 @@ async def get_audit_logs(
     if searchKey:
         query_params["searchKey"] = searchKey
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "logs", fields, AuditLogEntry)
 
 
 # =============================================================================
@@ -639,17 +681,18 @@ async def get_audit_logs(
 
 
 @mcp.tool()
+@budgeted
 async def get_template_workflow(
     templateworkflowName: str,
 ) -> TemplateWorkflowResponse:
     """Get Template Workflow - returns template workflow details."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/alltypes/workflow/templates/template/{templateworkflowName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def device_workflow_fetch_all(
     filters: Optional[str] = None,
     limit: Optional[str] = None,
@@ -668,23 +711,23 @@ async def device_workflow_fetch_all(
     if orgname:
         query_params["orgname"] = orgname
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_specific_device_workflow(
     deviceName: str,
 ) -> SpecificDeviceWorkflowResponse:
     """Get Specific Device WorkFlow - returns device workflow details."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/sdwan/workflow/devices/device/{deviceName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_template_bind_data_header_and_count(
     templateName: str, organization: Optional[str] = None
 ) -> BindDataHeaderResponse:
@@ -694,12 +737,12 @@ async def get_template_bind_data_header_and_count(
     if organization:
         query_params["organization"] = organization
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def template_fetch_all(
     limit: Optional[str] = None,
     offset: Optional[str] = None,
@@ -718,30 +761,29 @@ async def template_fetch_all(
     if searchKeyword:
         query_params["searchKeyword"] = searchKeyword
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_specific_template_workflow(
     templateworkflowName: str,
 ) -> SpecificTemplateWorkflowResponse:
     """Get Specific Template WorkFlow - returns specific template workflow."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/sdwan/workflow/templates/template/{templateworkflowName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def show_templates_associated_to_device(
     deviceName: str,
 ) -> DeviceTemplatesResponse:
     """Show Templates Associated to Device - returns templates for a device."""
     url = f"{MOCK_DIRECTOR_URL}/nextgen/device/{deviceName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
@@ -751,6 +793,7 @@ async def show_templates_associated_to_device(
 
 
 @mcp.tool()
+@budgeted
 async def device_group_fetch_all(
     filters: Optional[str] = None,
     limit: Optional[str] = None,
@@ -769,28 +812,27 @@ async def device_group_fetch_all(
     if organization:
         query_params["organization"] = organization
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_specific_device_group(
     deviceGroupName: str,
 ) -> SpecificDeviceGroupResponse:
     """Get Specific Device Group - returns specific device group details."""
     url = f"{MOCK_DIRECTOR_URL}/nextgen/deviceGroup/{deviceGroupName}"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_all_model_numbers() -> ModelNumbersResponse:
     """Get All Model Numbers - returns all model numbers."""
     url = f"{MOCK_DIRECTOR_URL}/nextgen/deviceGroup/modelNumbers"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
@@ -800,6 +842,7 @@ async def get_all_model_numbers() -> ModelNumbersResponse:
 
 
 @mcp.tool()
+@budgeted
 async def get_all_assets(
     filters: Optional[str] = None,
     limit: Optional[str] = None,
@@ -818,8 +861,7 @@ async def get_all_assets(
     if organization:
         query_params["organization"] = organization
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
@@ -829,6 +871,7 @@ async def get_all_assets(
 
 
 @mcp.tool()
+@budgeted
 async def filter_paginate_alarm(
     device_name: Optional[str] = None,
     filtertype: Optional[str] = None,
@@ -848,8 +891,9 @@ async def filter_paginate_alarm(
     sort_column: Optional[str] = None,
     sort_order: Optional[str] = None,
     type: Optional[str] = None,
+    fields: Optional[list[str]] = None,
 ) -> AlarmsPageResponse:
-    """Filter Paginate Alarm - returns paginated alarm data."""
+    """Filter Paginate Alarm - returns paginated alarm data; fields returns only those keys of each alarm."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/alarms/page"
     query_params: dict[str, Any] = {}
     if device_name:
@@ -889,12 +933,12 @@ async def filter_paginate_alarm(
     if type:
         query_params["type"] = type
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
-    return response.json()
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
+    return project(response.json(), "alarms", fields, AlarmPageItem)
 
 
 @mcp.tool()
+@budgeted
 async def get_alarm_handling(
     device_name: Optional[str] = None,
     managed_object: Optional[str] = None,
@@ -916,12 +960,12 @@ async def get_alarm_handling(
     if specific_problem:
         query_params["specific_problem"] = specific_problem
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_alarm_summary_per_org(
     org: str,
     include_children: Optional[str] = None,
@@ -935,30 +979,30 @@ async def get_alarm_summary_per_org(
     if include_system:
         query_params["include_system"] = include_system
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_alarm_summary() -> AlarmSummaryResponse:
     """Get Alarm Summary - returns alarm summary."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/alarms/summary"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_alarm_types() -> AlarmTypesResponse:
     """Get Alarm Types - returns alarm types."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/types"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_all_filtered_alarms(
     device_name: Optional[str] = None,
     filtertype: Optional[str] = None,
@@ -998,21 +1042,21 @@ async def get_all_filtered_alarms(
     if type:
         query_params["type"] = type
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_analytics_alarm_summary() -> AnalyticsAlarmSummaryResponse:
     """Get Analytics Alarm Summary - returns analytics alarm summary."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/analytics/alarms/summary"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_analytics_alarms(
     search_string: Optional[str] = None,
     severity: Optional[str] = None,
@@ -1025,30 +1069,30 @@ async def get_analytics_alarms(
     if severity:
         query_params["severity"] = severity
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_alarm_model() -> ApplianceAlarmModelResponse:
     """Get Appliance Alarm Model - returns appliance alarm model."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/appliance/alarm_model"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_appliance_alarm_types() -> ApplianceAlarmTypesResponse:
     """Get Appliance Alarm Types - returns appliance alarm types."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/appliance/types"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_device_alarm_summary(
     deviceName: str,
     org: Optional[str] = None,
@@ -1059,21 +1103,21 @@ async def get_device_alarm_summary(
     if org:
         query_params["org"] = org
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_director_alarm_summary() -> DirectorAlarmSummaryResponse:
     """Get Director Alarm Summary - returns director alarm summary."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/director/alarms/summary"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_director_alarms(
     search_string: Optional[str] = None,
     severity: Optional[str] = None,
@@ -1086,48 +1130,48 @@ async def get_director_alarms(
     if severity:
         query_params["severity"] = severity
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_director_fail_over_alarms() -> FailOverAlarmsResponse:
     """Get Director Fail Over Alarms - returns director fail-over alarms."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/director/fail-over-alarms"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_director_ha_alarms() -> HaAlarmsResponse:
     """Get Director HA Alarms - returns director HA alarms."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/director/ha-alarms"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_imp_alarm_summary() -> ImpAlarmSummaryResponse:
     """Get IMP Alarm Summary - returns IMP alarm summary."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/director/pop-up-summary"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_imp_alarms() -> ImpAlarmsResponse:
     """Get IMP Alarms - returns IMP alarms."""
     url = f"{MOCK_DIRECTOR_URL}/vnms/fault/director/pop-up"
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS)
+    response = await get_backend().get(url, headers=MOCK_HEADERS)
     return response.json()
 
 
 @mcp.tool()
+@budgeted
 async def get_status_change(
     device_name: Optional[str] = None,
     managed_object: Optional[str] = None,
@@ -1149,6 +1193,72 @@ async def get_status_change(
     if specific_problem:
         query_params["specific_problem"] = specific_problem
 
-    async with MockAsyncClient(verify=False) as client:
-        response = await client.get(url, headers=MOCK_HEADERS, params=query_params)
+    response = await get_backend().get(url, headers=MOCK_HEADERS, params=query_params)
     return response.json()
+
+
+# =============================================================================
+# Bulk Tools
+# =============================================================================
+
+
+@mcp.tool()
+@budgeted
+async def get_bulk_appliance_status(
+    appliances: list[str], view: str = "brief", concurrency: Optional[int] = None
+) -> BulkApplianceStatusResponse:
+    """Get Bulk Appliance Status - returns status for many appliances (UUIDs or names) in one call: view is status, brief or single; failed devices are listed in errors."""
+    return await fetch_appliance_statuses(
+        get_backend(),
+        MOCK_DIRECTOR_URL,
+        appliances,
+        view=view,
+        concurrency=concurrency,
+        headers=MOCK_HEADERS,
+    )
+
+
+@mcp.tool()
+@budgeted
+async def get_fleet_snapshot(
+    org: Optional[str] = None,
+    down_only: bool = False,
+    min_severity: Optional[str] = None,
+    include_sync: bool = True,
+) -> FleetSnapshotResponse:
+    """Get Fleet Snapshot - returns one row per appliance joining status, site, active alarm counts and sync state, filtered by org, unreachable devices (down_only) and alarm severity (min_severity)."""
+    return await fleet_snapshot(
+        get_backend(),
+        MOCK_DIRECTOR_URL,
+        org=org,
+        down_only=down_only,
+        min_severity=min_severity,
+        include_sync=include_sync,
+        headers=MOCK_HEADERS,
+    )
+
+
+@mcp.tool()
+@budgeted
+async def fetch_all_pages(
+    source: str,
+    params: Optional[dict[str, str]] = None,
+    page_size: Optional[int] = None,
+    max_records: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    fields: Optional[list[str]] = None,
+    ctx: Optional[Context] = None,
+) -> FetchAllResponse:
+    """Fetch All Pages - returns every record of a paged endpoint in one call: source is alarms, audit_logs, appliances_lite, appliance_status or next_page_data (params must include queryId); params are that tool's filters; fields returns only those keys of each record; stops early at max_records or max_bytes and reports progress per page."""
+    return await fetch_all(
+        get_backend(),
+        MOCK_DIRECTOR_URL,
+        source,
+        params=params,
+        page_size=page_size,
+        max_records=max_records,
+        max_bytes=max_bytes,
+        fields=fields,
+        headers=MOCK_HEADERS,
+        progress=ctx.report_progress if ctx is not None else None,
+    )
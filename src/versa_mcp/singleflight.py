@@ -0,0 +1,113 @@
+"""
+Single-Flight Request Coalescing
+
+CoalescingBackend wraps a backend so identical GETs in flight at the same
+time share one backend call: the first caller for a key (the normalized
+request, see cassette.request_key) makes the call and every caller that
+arrives before it finishes waits for and receives the same response. This
+caps Director load when several sessions poll the same dashboard tools at
+once.
+
+Errors raised by the shared call are raised in every waiter; the next call
+for the key starts afresh. If the caller making the call is cancelled, its
+waiters are not: one of them makes the call again for the rest.
+
+Set COALESCE_REQUESTS=true or false (default true with MOCK_MODE=false,
+false for the mock and replay backends).
+"""
+
+from typing import Any, Dict, Optional
+
+import anyio
+
+from .mocks.cassette import request_key
+
+
+class _Flight:
+    """One backend call in progress and its outcome."""
+
+    def __init__(self):
+        self.done = anyio.Event()
+        self.response: Any = None
+        self.error: Optional[Exception] = None
+        self.abandoned = False
+
+
+class CoalescingBackend:
+    """Backend wrapper sharing one call between identical concurrent GETs."""
+
+    def __init__(self, backend: Any):
+        self.backend = backend
+        self._flights: dict[str, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def __aenter__(self):
+        if hasattr(self.backend, "__aenter__"):
+            await self.backend.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if hasattr(self.backend, "__aexit__"):
+            await self.backend.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a GET, or wait for the identical one already in flight."""
+        key = request_key("GET", url, params)
+        joined = False
+        while key in self._flights:
+            flight = self._flights[key]
+            if not joined:
+                self.coalesced += 1
+                joined = True
+            await flight.done.wait()
+            if flight.abandoned:
+                # The caller was cancelled; retry, possibly making the call
+                continue
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        flight = self._flights[key] = _Flight()
+        self.calls += 1
+        try:
+            flight.response = await self.backend.get(
+                url, headers=headers, params=params, **kwargs
+            )
+        except Exception as e:
+            flight.error = e
+            raise
+        except BaseException:
+            # Cancellation belongs to this caller only, not its waiters
+            flight.abandoned = True
+            raise
+        finally:
+            del self._flights[key]
+            flight.done.set()
+        return flight.response
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Forward a POST."""
+        return await self.backend.post(url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Any:
+        """Forward a PUT."""
+        return await self.backend.put(url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """Forward a DELETE."""
+        return await self.backend.delete(url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """Backend calls made, calls that joined one in flight, and in flight."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
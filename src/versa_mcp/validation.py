@@ -0,0 +1,244 @@
+"""
+Response Validation
+
+Tools return the Director's JSON as dicts, and FastMCP only serializes them
+against the tool's response model; it does not validate them. A Director
+release that changes a response underneath its model in schemas.py would
+reach the agent unnoticed. ValidatingBackend checks each 2xx JSON response
+against the response model of its endpoint (ENDPOINT_MODELS) and raises
+ResponseValidationError on a mismatch.
+
+Validators are built once per model (response_adapter) and reused for
+every call. Each response is parsed once: the validated body is handed on
+with the response, so tools do not parse it again.
+
+Select the mode with the RESPONSE_VALIDATION environment variable:
+    RESPONSE_VALIDATION=off      (default) no validation
+    RESPONSE_VALIDATION=full     validate every response, cache hits included
+    RESPONSE_VALIDATION=trusted  validate responses as they arrive from the
+                                 backend; bodies served again by the cache or
+                                 shared by coalescing were validated when
+                                 they arrived and are trusted
+
+RESPONSE_CODEC=msgspec validates with the fast codec's structs in place of
+the pydantic models: the response bytes are parsed once, by msgspec, and
+the parsed body is both checked and handed on (see codec.parse; needs the
+fast extra). Responses that already hold their parsed body (mock, cached
+and validated responses, see PARSED_RESPONSES) are checked as json()
+returns it, so markers such as the cache's cacheInfo are kept.
+
+See benchmarks/bench_validation.py for what validation costs per call.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from . import codec, schemas
+from .backend import BackendConfigError
+from .mocks.endpoint_map import match_endpoint
+from .mocks.mock_client import MockResponse
+from .response_cache import CachedResponse
+
+# Response model of each endpoint pattern in ENDPOINT_TO_MOCK: the return
+# model of the tool calling it
+ENDPOINT_MODELS: dict[str, type[BaseModel]] = {
+    "/nextgen/appliance/status": schemas.AllApplianceStatusResponse,
+    "/nextgen/appliance/status/{id}": schemas.SingleApplianceStatusResponse,
+    "/nextgen/appliance/template_listing/{deviceName}": schemas.DeviceTemplateListingResponse,
+    "/vnms/dashboard/appliance/location": schemas.ApplianceLocationsResponse,
+    "/vnms/appliance/{applianceName}/routing-instances": schemas.RoutingInstancesResponse,
+    "/vnms/appliance/appliance": schemas.AppliancesByTypeResponse,
+    "/vnms/appliance/appliance/lite": schemas.AppliancesLiteResponse,
+    "/vnms/appliance/appliance/liteView": schemas.AppliancesLiteViewResponse,
+    "/vnms/appliance/applianceByName": schemas.SearchApplianceResponse,
+    "/vnms/appliance/export": schemas.ConfigurationExportResponse,
+    "/vnms/appliance/summary": schemas.AppliancesSummaryResponse,
+    "/vnms/dashboard/appliance/{Uuid}": schemas.ApplianceDetailsResponse,
+    "/vnms/dashboard/appliance/{Uuid}/hardware": schemas.ApplianceHardwareResponse,
+    "/vnms/dashboard/appliance/{applianceName}/bandwidthservers": schemas.BandwidthMeasurementResponse,
+    "/vnms/dashboard/appliance/{applianceName}/capabilities": schemas.CapabilitiesResponse,
+    "/vnms/dashboard/appliance/{applianceUUID}/syncStatus": schemas.SyncStatusResponse,
+    "/vnms/dashboard/applianceServices/{applianceName}": schemas.ApplianceServicesResponse,
+    "/vnms/dashboard/applianceStatus/{applianceUUID}": schemas.ApplianceStatusResponse,
+    "/vnms/dashboard/applianceStatus/{applianceUUID}/brief": schemas.StatusBriefResponse,
+    "/vnms/cloud/systems/getAllApplianceNames": schemas.ApplianceNamesResponse,
+    "/vnms/cloud/systems/getAllAppliancesBasicDetails": schemas.AppliancesBasicResponse,
+    "/vnms/dashboard/applianceviolations/{applianceName}": schemas.ViolationsResponse,
+    "/vnms/dashboard/appliance/{applianceName}/live": schemas.LiveStatusResponse,
+    "/vnms/dashboard/appliance/next_page_data": schemas.PagedDataResponse,
+    "/vnms/dashboard/enableMonitoring": schemas.MonitoringConfigResponse,
+    "/vnms/dashboard/getMonitorPullEnabled/{deviceName}": schemas.MonitorPullEnabledResponse,
+    "/vnms/dashboard/health/ike": schemas.IkeHealthResponse,
+    "/vnms/dashboard/health/interface": schemas.InterfaceHealthResponse,
+    "/vnms/dashboard/health/path": schemas.PathHealthResponse,
+    "/vnms/dashboard/lte/list": schemas.LteDevicesResponse,
+    "/vnms/dashboard/navTree": schemas.NavTreeResponse,
+    "/vnms/dashboard/status/headEnds": schemas.HeadEndStatusResponse,
+    "/vnms/dashboard/vdStatus": schemas.VdStatusResponse,
+    "/vnms/dashboard/vdStatus/haDetails": schemas.VdHaDetailsResponse,
+    "/vnms/dashboard/vdStatus/packageInfo": schemas.VdPackageInfoResponse,
+    "/vnms/dashboard/vdStatus/sysDetails": schemas.SysDetailsResponse,
+    "/vnms/dashboard/vdStatus/sysUptime": schemas.SysUptimeResponse,
+    "/vnms/alltypes/workflow/templates/template/{templateworkflowName}": schemas.TemplateWorkflowResponse,
+    "/vnms/sdwan/workflow/devices": schemas.DeviceWorkflowsResponse,
+    "/vnms/sdwan/workflow/devices/device/{deviceName}": schemas.SpecificDeviceWorkflowResponse,
+    "/vnms/sdwan/workflow/binddata/devices/header/template/{templateName}": schemas.BindDataHeaderResponse,
+    "/vnms/sdwan/workflow/templates": schemas.TemplatesResponse,
+    "/vnms/sdwan/workflow/templates/template/{templateworkflowName}": schemas.SpecificTemplateWorkflowResponse,
+    "/nextgen/device/{deviceName}": schemas.DeviceTemplatesResponse,
+    "/nextgen/deviceGroup": schemas.DeviceGroupsResponse,
+    "/nextgen/deviceGroup/{deviceGroupName}": schemas.SpecificDeviceGroupResponse,
+    "/nextgen/deviceGroup/modelNumbers": schemas.ModelNumbersResponse,
+    "/vnms/fault/alarms/page": schemas.AlarmsPageResponse,
+    "/vnms/fault/alarm/handling": schemas.AlarmHandlingResponse,
+    "/vnms/fault/alarms/summary/{org}": schemas.AlarmSummaryByOrgResponse,
+    "/vnms/fault/alarms/summary": schemas.AlarmSummaryResponse,
+    "/vnms/fault/types": schemas.AlarmTypesResponse,
+    "/vnms/fault/alarms": schemas.FilteredAlarmsResponse,
+    "/vnms/fault/analytics/alarms/summary": schemas.AnalyticsAlarmSummaryResponse,
+    "/vnms/fault/analytics/alarms": schemas.AnalyticsAlarmsResponse,
+    "/vnms/fault/appliance/alarm_model": schemas.ApplianceAlarmModelResponse,
+    "/vnms/fault/appliance/types": schemas.ApplianceAlarmTypesResponse,
+    "/vnms/fault/alarms/summary/device/{deviceName}": schemas.DeviceAlarmSummaryResponse,
+    "/vnms/fault/director/alarms/summary": schemas.DirectorAlarmSummaryResponse,
+    "/vnms/fault/director/alarms": schemas.DirectorAlarmsResponse,
+    "/vnms/fault/director/fail-over-alarms": schemas.FailOverAlarmsResponse,
+    "/vnms/fault/director/ha-alarms": schemas.HaAlarmsResponse,
+    "/vnms/fault/director/pop-up-summary": schemas.ImpAlarmSummaryResponse,
+    "/vnms/fault/director/pop-up": schemas.ImpAlarmsResponse,
+    "/vnms/fault/alarm/status": schemas.StatusChangeResponse,
+    "/vnms/audit/logs": schemas.AuditLogsResponse,
+    "/vnms/assets/asset": schemas.AssetsResponse,
+}
+
+
+class ResponseValidationError(ValueError):
+    """Raised when a response does not match its endpoint's model."""
+
+
+@lru_cache(maxsize=None)
+def response_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """The validator for model, built on first use and then reused."""
+    return TypeAdapter(model)
+
+
+def validate_response(pattern: str, body: Any, model: type[BaseModel]) -> None:
+    """Check body against model, raising ResponseValidationError if it fails."""
+    try:
+        response_adapter(model).validate_python(body)
+    except ValidationError as e:
+        first = e.errors()[0]
+        location = ".".join(str(part) for part in first["loc"]) or "body"
+        raise ResponseValidationError(
+            f"{pattern} response does not match {model.__name__}: "
+            f"{e.error_count()} error(s), first at {location}: {first['msg']}"
+        ) from None
+
+
+def validate_bytes(pattern: str, raw: bytes, model: type[BaseModel]) -> Any:
+    """
+    Parse JSON bytes and check them against model's struct, as
+    validate_response does; returns the parsed body.
+    """
+    try:
+        return codec.parse(raw, model)
+    except codec.CodecError as e:
+        raise ResponseValidationError(
+            f"{pattern} response does not match {model.__name__}: {e}"
+        ) from None
+
+
+def validate_struct(pattern: str, body: Any, model: type[BaseModel]) -> None:
+    """Check a parsed body against model's struct, as validate_bytes does."""
+    try:
+        codec.check(body, model)
+    except codec.CodecError as e:
+        raise ResponseValidationError(
+            f"{pattern} response does not match {model.__name__}: {e}"
+        ) from None
+
+
+class ValidatedResponse:
+    """A response whose JSON body has been parsed and validated."""
+
+    def __init__(self, response: Any, body: Any):
+        self.response = response
+        self.status_code = response.status_code
+        self.body = body
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    def json(self) -> Any:
+        return self.body
+
+
+# Responses whose json() returns a body they hold, which need not match
+# their content: it is checked as is instead of parsed again from the bytes
+PARSED_RESPONSES = (MockResponse, CachedResponse, ValidatedResponse)
+
+
+class ValidatingBackend:
+    """Backend wrapper validating responses against ENDPOINT_MODELS."""
+
+    def __init__(
+        self,
+        backend: Any,
+        models: Optional[Mapping[str, type[BaseModel]]] = None,
+        fast: bool = False,
+    ):
+        if fast and not codec.available():
+            raise BackendConfigError("RESPONSE_CODEC=msgspec needs msgspec installed")
+        self.backend = backend
+        self.models = ENDPOINT_MODELS if models is None else models
+        self.fast = fast
+        self.validated = 0
+        self.failed = 0
+
+    async def __aenter__(self):
+        if hasattr(self.backend, "__aenter__"):
+            await self.backend.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if hasattr(self.backend, "__aexit__"):
+            await self.backend.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a GET and validate a successful response's body."""
+        response = await self.backend.get(url, headers=headers, params=params, **kwargs)
+        if not 200 <= response.status_code < 300:
+            return response
+        route = match_endpoint(urlparse(url).path)
+        if route is None:
+            return response
+        model = self.models.get(route.pattern)
+        if model is None:
+            return response
+        try:
+            if self.fast and isinstance(response, PARSED_RESPONSES):
+                body = response.json()
+                validate_struct(route.pattern, body, model)
+            elif self.fast:
+                body = validate_bytes(route.pattern, response.content, model)
+            else:
+                body = response.json()
+                validate_response(route.pattern, body, model)
+        except ResponseValidationError:
+            self.failed += 1
+            raise
+        self.validated += 1
+        return ValidatedResponse(response, body)
+
+    def stats(self) -> dict[str, Any]:
+        """Responses validated and responses rejected."""
+        return {"validated": self.validated, "failed": self.failed}
@@ -0,0 +1,148 @@
+"""
+Tests for the Alarm Query Engine
+
+Verifies that filter_paginate_alarm and get_all_filtered_alarms params are
+evaluated by the indexed AlarmStore: filters, time window, sorting, paging.
+"""
+
+import pytest
+from versa_mcp.mocks.alarm_store import AlarmQueryError, AlarmStore, change_time
+from versa_mcp.mocks.corpus import get_corpus
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+PAGE_URL = "https://mock-director.local/vnms/fault/alarms/page"
+FILTERED_URL = "https://mock-director.local/vnms/fault/alarms"
+
+
+def _alarm(i, org="A", device="d1", severity="MAJOR", cleared=False):
+    return {
+        "alarmId": f"alm-{i}",
+        "org": org,
+        "deviceName": device,
+        "severity": severity,
+        "type": "LINK_DOWN",
+        "isCleared": cleared,
+        "raisedTime": f"2026-01-01T00:{i:02d}:00Z",
+    }
+
+
+@pytest.fixture
+def store():
+    alarms = [
+        _alarm(0, org="A", severity="CRITICAL"),
+        _alarm(1, org="B", device="d2"),
+        _alarm(2, org="A", device="d2", severity="MINOR", cleared=True),
+        _alarm(3, org="A", severity="CRITICAL"),
+        _alarm(4, org="B", severity="WARNING"),
+    ]
+    return AlarmStore(list(reversed(alarms)))
+
+
+def _ids(page):
+    return [alarm["alarmId"] for alarm in page]
+
+
+def test_default_order_is_newest_first(store):
+    total, page = store.query({})
+    assert total == 5
+    assert _ids(page) == ["alm-4", "alm-3", "alm-2", "alm-1", "alm-0"]
+
+
+def test_equality_filters_intersect(store):
+    total, page = store.query({"org": "A", "last_perceived_severity": "critical"})
+    assert total == 2
+    assert _ids(page) == ["alm-3", "alm-0"]
+
+    total, page = store.query({"org": "A", "is_cleared": "true"})
+    assert _ids(page) == ["alm-2"]
+
+
+def test_comma_separated_values_union(store):
+    total, page = store.query({"last_perceived_severity": "MINOR,WARNING"})
+    assert total == 2
+    assert _ids(page) == ["alm-4", "alm-2"]
+
+
+def test_time_window_is_exclusive(store):
+    total, page = store.query(
+        {
+            "last_change_after": "2026-01-01T00:01:00Z",
+            "last_change_before": "2026-01-01T00:04:00Z",
+            "sort_order": "asc",
+        }
+    )
+    assert total == 2
+    assert _ids(page) == ["alm-2", "alm-3"]
+
+
+def test_paging_reports_full_total(store):
+    total, page = store.query({"limit": "2", "offset": "1"})
+    assert total == 5
+    assert _ids(page) == ["alm-3", "alm-2"]
+
+
+def test_sort_by_severity_ranks_critical_first(store):
+    total, page = store.query({"sort_column": "severity"})
+    assert [alarm["severity"] for alarm in page] == [
+        "CRITICAL",
+        "CRITICAL",
+        "MAJOR",
+        "MINOR",
+        "WARNING",
+    ]
+    assert _ids(page)[:2] == ["alm-3", "alm-0"]
+
+    total, page = store.query({"sort_column": "severity", "sort_order": "asc"})
+    assert [alarm["severity"] for alarm in page][0] == "WARNING"
+    assert [alarm["severity"] for alarm in page][-2:] == ["CRITICAL", "CRITICAL"]
+
+
+def test_unknown_values_and_bad_params(store):
+    assert store.query({"org": "Nope"}) == (0, [])
+    with pytest.raises(AlarmQueryError):
+        store.query({"sort_column": "bogus"})
+    with pytest.raises(AlarmQueryError):
+        store.query({"is_cleared": "maybe"})
+    with pytest.raises(AlarmQueryError):
+        store.query({"last_change_after": "yesterday"})
+
+
+@pytest.mark.anyio
+async def test_filter_paginate_alarm_endpoint():
+    """The page endpoint should filter the mock alarms and set paging fields."""
+    alarms = get_corpus().get("alarm/filter_paginate_alarm.json")["alarms"]
+    critical = [a for a in alarms if a["severity"] == "CRITICAL"]
+
+    async with MockAsyncClient() as client:
+        response = await client.get(
+            PAGE_URL, params={"last_perceived_severity": "CRITICAL", "limit": "1"}
+        )
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["totalCount"] == len(critical)
+    assert data["limit"] == 1
+    assert data["hasMore"] is (len(critical) > 1)
+    assert data["alarms"] == [max(critical, key=change_time)]
+
+
+@pytest.mark.anyio
+async def test_get_all_filtered_alarms_endpoint():
+    """The filtered endpoint should return every match without paging fields."""
+    async with MockAsyncClient() as client:
+        response = await client.get(FILTERED_URL, params={"org": "GlobalRetail"})
+
+    data = response.json()
+    assert response.status_code == 200
+    assert all(alarm["org"] == "GlobalRetail" for alarm in data["alarms"])
+    assert data["totalCount"] == len(data["alarms"])
+    assert "hasMore" not in data
+
+
+@pytest.mark.anyio
+async def test_invalid_sort_returns_400():
+    async with MockAsyncClient() as client:
+        response = await client.get(PAGE_URL, params={"sort_order": "sideways"})
+
+    assert response.status_code == 400
+    assert "sort_order" in response.json()["error"]
@@ -0,0 +1,128 @@
+"""
+Tests for the Appliance Search Index
+
+Verifies ranked name search, filterString/org/tags/type filtering on the
+appliance list endpoints, and typo suggestions in 404 bodies.
+"""
+
+import pytest
+from versa_mcp.mocks.mock_client import MockAsyncClient
+from versa_mcp.mocks.search_index import (
+    _FIELD_RANK_OFFSET,
+    ApplianceIndex,
+    TrigramIndex,
+    match_rank,
+)
+
+BASE_URL = "https://mock-director.local"
+
+RECORDS = [
+    {"name": "NYC-Branch-001", "org": "GlobalRetail", "tags": ["EAST"]},
+    {"name": "NYC-Branch-002", "org": "AcmeBank", "tags": ["EAST"]},
+    {"name": "Hub-Northeast", "org": "GlobalRetail", "tags": ["HUB"]},
+    {"name": "Branch", "org": "AcmeBank", "tags": ["WEST"], "type": "BRANCH"},
+    {"name": "SFO-Branch-001", "org": "AcmeBank", "tags": ["WEST", "Branch"]},
+]
+
+
+def test_trigram_index_matches_like_a_scan():
+    """Prefix and substring lookups should equal a brute-force scan."""
+    names = [r["name"] for r in RECORDS]
+    index = TrigramIndex((name, i) for i, name in enumerate(names))
+
+    for query in ["b", "br", "bra", "branch-00", "NYC", "east", "zzz", "-0"]:
+        q = query.lower()
+        expected = sorted({n.lower() for n in names if q in n.lower()})
+        assert index.contains(query) == expected
+        assert index.prefix(query) == [k for k in expected if k.startswith(q)]
+
+
+def test_search_ranks_exact_then_prefix_then_word_then_substring():
+    """Name matches rank by match quality ahead of org and tag matches."""
+    index = ApplianceIndex(RECORDS)
+    ranked = [RECORDS[p]["name"] for p in index.search("branch")]
+    assert ranked == [
+        "Branch",
+        "NYC-Branch-001",
+        "NYC-Branch-002",
+        "SFO-Branch-001",
+    ]
+
+    # Org and tag matches come after every name match
+    ranked = [RECORDS[p]["name"] for p in index.search("west")]
+    assert ranked == ["Branch", "SFO-Branch-001"]
+    ranked = [RECORDS[p]["name"] for p in index.search("nort")]
+    assert ranked == ["Hub-Northeast"]
+
+
+def test_search_matches_ranking_a_scan():
+    """Prefix-bisected and trigram matches should rank as match_rank does."""
+    index = ApplianceIndex(RECORDS)
+    for query in ["b", "br", "branch", "nyc-branch-001", "hub", "-0", "east", "zzz"]:
+        q = query.lower()
+        ranked = sorted(
+            (offset + rank, len(term), term.lower(), i)
+            for i, r in enumerate(RECORDS)
+            for field, offset in _FIELD_RANK_OFFSET.items()
+            for term in ([r[field]] if field != "tags" else r["tags"])
+            if (rank := match_rank(term.lower(), q)) is not None
+        )
+        expected = list(dict.fromkeys(i for *_, i in ranked))
+        assert index.search(query) == expected
+
+
+def test_filter_intersects_every_given_filter():
+    """filterString, org, tags and type should all have to match."""
+    index = ApplianceIndex(RECORDS)
+    assert index.filter(filter_string="branch", org="acmebank") == [1, 3, 4]
+    assert index.filter(tags="WEST,branch") == [4]
+    assert index.filter(type="branch") == [3]
+    assert index.filter() == list(range(len(RECORDS)))
+
+
+def test_suggest_tolerates_typos():
+    """A misspelled name should suggest the intended one first."""
+    index = ApplianceIndex(RECORDS)
+    assert index.suggest("NYC-Brnch-001")[0] == "NYC-Branch-001"
+    assert index.suggest("completely-different") == []
+
+
+@pytest.mark.anyio
+async def test_search_endpoint_returns_ranked_page():
+    """search_appliance_by_name should search instead of returning a fixed list."""
+    async with MockAsyncClient() as client:
+        response = await client.get(
+            f"{BASE_URL}/vnms/appliance/applianceByName",
+            params={"name": "dc-", "limit": "1"},
+        )
+    data = response.json()
+    assert response.status_code == 200
+    assert data["totalCount"] == 2
+    assert [a["name"] for a in data["appliances"]] == ["DC-East-Primary"]
+    assert data["hasMore"] is True
+
+
+@pytest.mark.anyio
+async def test_lite_filter_string_filters_and_pages():
+    """filterString and org should filter before limit/offset are applied."""
+    async with MockAsyncClient() as client:
+        response = await client.get(
+            f"{BASE_URL}/vnms/appliance/appliance/lite",
+            params={"filterString": "branch-00", "org": "GlobalRetail"},
+        )
+    data = response.json()
+    assert data["totalCount"] == len(data["appliances"]) > 0
+    for appliance in data["appliances"]:
+        assert "branch-00" in appliance["name"].lower()
+        assert appliance["org"] == "GlobalRetail"
+
+
+@pytest.mark.anyio
+async def test_unknown_name_404_includes_suggestions():
+    """A 404 for a misspelled appliance name should suggest close names."""
+    async with MockAsyncClient() as client:
+        response = await client.get(
+            f"{BASE_URL}/vnms/appliance/NYC-Brnch-001/routing-instances"
+        )
+    assert response.status_code == 404
+    assert response.json()["suggestions"][0] == "NYC-Branch-001"
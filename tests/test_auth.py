@@ -0,0 +1,141 @@
+"""
+Tests for the Director OAuth Token Cache
+
+Runs TokenManager against a stand-in token endpoint and verifies caching,
+refresh ahead of expiry, and that concurrent refreshes (including after a
+burst of 401s) are coalesced into one token request.
+"""
+
+import anyio
+import pytest
+from versa_mcp.auth import DirectorAuthError, TokenManager
+from versa_mcp.mocks.mock_client import MockResponse
+
+
+class TokenEndpoint:
+    """Stand-in for POST /auth/token issuing numbered tokens."""
+
+    def __init__(self, expires_in=3600, status=200, delay=0.05):
+        self.expires_in = expires_in
+        self.status = status
+        self.delay = delay
+        self.requests = []
+
+    async def post(self, url, json=None):
+        self.requests.append(json)
+        await anyio.sleep(self.delay)
+        if self.status != 200:
+            return MockResponse({"error": "invalid_grant"}, status_code=self.status)
+        body = {
+            "access_token": f"token-{len(self.requests)}",
+            "refresh_token": f"refresh-{len(self.requests)}",
+            "expires_in": self.expires_in,
+        }
+        return MockResponse(body)
+
+
+def _manager(endpoint, clock=None):
+    kwargs = {"clock": clock} if clock else {}
+    return TokenManager(endpoint, username="admin", password="secret", **kwargs)
+
+
+async def _concurrently(count, call):
+    results = []
+
+    async def run():
+        results.append(await call())
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(run)
+    return results
+
+
+@pytest.mark.anyio
+async def test_concurrent_callers_share_one_token_request():
+    """200 callers with no token yet should trigger one token request."""
+    endpoint = TokenEndpoint()
+    manager = _manager(endpoint)
+
+    tokens = await _concurrently(200, manager.token)
+
+    assert tokens == ["token-1"] * 200
+    assert len(endpoint.requests) == 1
+    assert endpoint.requests[0]["grant_type"] == "password"
+    assert await manager.token() == "token-1"
+
+
+@pytest.mark.anyio
+async def test_token_refreshes_ahead_of_expiry():
+    """The token should be replaced refresh_margin seconds before it expires."""
+    now = [0.0]
+    endpoint = TokenEndpoint(expires_in=600, delay=0)
+    manager = _manager(endpoint, clock=lambda: now[0])
+
+    assert await manager.token() == "token-1"
+    now[0] = 539
+    assert await manager.token() == "token-1"
+    now[0] = 541
+    assert await manager.token() == "token-2"
+    assert endpoint.requests[1] == {
+        "grant_type": "refresh_token",
+        "refresh_token": "refresh-1",
+        "client_id": "",
+        "client_secret": "",
+    }
+
+
+@pytest.mark.anyio
+async def test_burst_of_401s_refreshes_once():
+    """Every caller dropping the same rejected token should refresh it once."""
+    endpoint = TokenEndpoint()
+    manager = _manager(endpoint)
+    rejected = await manager.token()
+
+    async def retry():
+        manager.invalidate(rejected)
+        return await manager.token()
+
+    tokens = await _concurrently(200, retry)
+
+    assert tokens == ["token-2"] * 200
+    assert len(endpoint.requests) == 2
+    # A late 401 for the replaced token should not refresh again
+    manager.invalidate(rejected)
+    assert await manager.token() == "token-2"
+    assert len(endpoint.requests) == 2
+
+
+@pytest.mark.anyio
+async def test_rejected_credentials_fail_all_waiters_once():
+    """Waiters on a failed refresh should share its error, not retry it."""
+    endpoint = TokenEndpoint(status=401)
+    manager = _manager(endpoint)
+    failures = []
+
+    async def call():
+        try:
+            await manager.token()
+        except DirectorAuthError as e:
+            failures.append(e)
+
+    await _concurrently(50, call)
+
+    assert len(failures) == 50
+    assert len(endpoint.requests) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("body", [None, {"access_token": None}, {"expires_in": 60}])
+async def test_malformed_token_responses_are_refused(body):
+    """A token response without an access token should not be cached."""
+
+    class Endpoint(TokenEndpoint):
+        async def post(self, url, json=None):
+            self.requests.append(json)
+            return MockResponse(body)
+
+    manager = _manager(Endpoint())
+    with pytest.raises(DirectorAuthError, match="Malformed token response"):
+        await manager.token()
+    assert manager.stats()["refreshes"] == 0
@@ -0,0 +1,105 @@
+"""
+Tests for Director Backend Selection
+
+Verifies MOCK_MODE selects the backend, that every tool shares the backend
+opened by the server lifespan, and that it is closed on shutdown.
+"""
+
+import pytest
+from versa_mcp import backend as backend_module
+from versa_mcp import server
+from versa_mcp.backend import (
+    BackendConfigError,
+    create_backend,
+    get_backend,
+    open_backend,
+)
+from versa_mcp.mocks.cassette import CassetteClient, CassetteRecorder
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+
+class RecordingBackend(MockAsyncClient):
+    """Mock backend that remembers its calls and whether it was closed."""
+
+    def __init__(self):
+        super().__init__(verify=False)
+        self.urls = []
+        self.closed = False
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+    async def get(self, url, headers=None, params=None):
+        self.urls.append(url)
+        return await super().get(url, headers=headers, params=params)
+
+
+def test_mock_mode_selects_backend(monkeypatch, tmp_path):
+    """MOCK_MODE should choose mock, replay or HTTP, and reject others."""
+    monkeypatch.delenv("MOCK_MODE", raising=False)
+    assert isinstance(create_backend(), MockAsyncClient)
+
+    (tmp_path / "cassette.jsonl").write_text("")
+    monkeypatch.setenv("MOCK_CASSETTE", str(tmp_path))
+    assert isinstance(create_backend("replay"), CassetteClient)
+
+    monkeypatch.delenv("DIRECTOR_URL", raising=False)
+    with pytest.raises(BackendConfigError):
+        create_backend("false")
+    with pytest.raises(BackendConfigError):
+        create_backend("sometimes")
+
+
+@pytest.mark.anyio
+async def test_tools_share_one_backend():
+    """Tools should send every request through the open backend."""
+    recording = RecordingBackend()
+    async with open_backend(recording):
+        assert get_backend() is recording
+        await server.get_all_appliance_status(limit="1")
+        await server.get_alarm_types()
+
+    assert len(recording.urls) == 2
+    assert recording.closed
+
+
+@pytest.mark.anyio
+async def test_lifespan_opens_and_closes_backend(monkeypatch):
+    """The FastMCP lifespan should open one backend for all tool calls."""
+    recording = RecordingBackend()
+    monkeypatch.setattr(backend_module, "create_backend", lambda: recording)
+    monkeypatch.setattr(backend_module, "_backend", None)
+
+    async with server.lifespan(server.mcp) as context:
+        assert context["backend"] is recording
+        await server.get_alarm_types()
+        await server.get_all_appliance_status(limit="1")
+        assert get_backend() is recording
+
+    assert len(recording.urls) == 2
+    assert recording.closed
+    assert backend_module._backend is None
+
+
+@pytest.mark.anyio
+async def test_record_then_replay(monkeypatch, tmp_path):
+    """MOCK_RECORD should capture the backend's traffic for MOCK_MODE=replay."""
+    cassette = tmp_path / "cassette"
+    monkeypatch.setenv("MOCK_RECORD", str(cassette))
+    recorder = create_backend("true")
+    assert isinstance(recorder, CassetteRecorder)
+    assert isinstance(recorder.client, MockAsyncClient)
+
+    async with open_backend(recorder):
+        status = await server.get_all_appliance_status(limit="2")
+        types = await server.get_alarm_types()
+    assert recorder.recorded == 2
+
+    with pytest.raises(BackendConfigError):
+        create_backend("replay")
+    monkeypatch.delenv("MOCK_RECORD")
+    monkeypatch.setenv("MOCK_CASSETTE", str(cassette))
+    async with open_backend(create_backend("replay")) as replay:
+        assert isinstance(replay, CassetteClient)
+        assert await server.get_all_appliance_status(limit="2") == status
+        assert await server.get_alarm_types() == types
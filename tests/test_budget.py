@@ -0,0 +1,160 @@
+"""
+Tests for Response Budgets
+
+Calls tools with byte and token budgets and verifies the rows kept, the
+summary of the rest, cursor continuation and the tools' schemas.
+"""
+
+import json
+
+import pytest
+from versa_mcp import server
+from versa_mcp.budget import TOKEN_BYTES, BudgetError, encode_cursor
+
+
+def _size(value):
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def _unhealthy(appliance):
+    return appliance["pingStatus"] != "REACHABLE" or (
+        appliance["syncStatus"] != "IN_SYNC"
+        or appliance["servicesStatus"] != "GOOD"
+        or appliance["pathStatus"] != "GOOD"
+    )
+
+
+@pytest.mark.anyio
+async def test_budget_keeps_the_most_relevant_rows():
+    """Unhealthy appliances should come first; the rest are summarized."""
+    full = await server.get_all_appliance_status()
+    result = await server.get_all_appliance_status(budget_bytes=4000)
+
+    budget = result["budget"]
+    assert _size(result) == budget["bytes"] <= 4000
+    assert not budget["overBudget"]
+    assert budget["returned"] + budget["omitted"] == len(full["appliances"])
+    assert result["totalCount"] == full["totalCount"]
+
+    unhealthy = [a for a in full["appliances"] if _unhealthy(a)]
+    assert 0 < len(unhealthy) < budget["returned"]
+    first = result["appliances"][: len(unhealthy)]
+    assert sorted(a["uuid"] for a in first) == sorted(a["uuid"] for a in unhealthy)
+    assert budget["omittedCounts"]["pingStatus"] == {"REACHABLE": budget["omitted"]}
+    assert "uuid" not in budget["omittedCounts"]
+
+    # Tokens are estimated from bytes
+    by_tokens = await server.get_all_appliance_status(budget_tokens=1000)
+    assert (
+        by_tokens["budget"]["returned"]
+        == (await server.get_all_appliance_status(budget_bytes=1000 * TOKEN_BYTES))[
+            "budget"
+        ]["returned"]
+    )
+
+
+@pytest.mark.anyio
+async def test_cursor_continues_where_the_budget_stopped():
+    """Following cursors should return every alarm once, most severe first."""
+    full = await server.filter_paginate_alarm()
+    seen = []
+    cursor = None
+    while True:
+        page = await server.filter_paginate_alarm(budget_bytes=2500, cursor=cursor)
+        seen += page["alarms"]
+        cursor = page["budget"]["cursor"]
+        assert page["budget"]["omitted"] == len(full["alarms"]) - len(seen)
+        if cursor is None:
+            break
+
+    assert sorted(a["alarmId"] for a in seen) == sorted(
+        a["alarmId"] for a in full["alarms"]
+    )
+    ranks = ["CRITICAL", "MAJOR", "MINOR", "WARNING"]
+    assert [a["severity"] for a in seen] == sorted(
+        (a["severity"] for a in seen), key=ranks.index
+    )
+
+
+@pytest.mark.anyio
+async def test_keyed_results_are_cut_by_key():
+    """Bulk results, a map keyed by device, should be cut and continued too."""
+    names = [
+        a["name"] for a in (await server.get_all_appliance_status())["appliances"]
+    ][:20]
+    full = await server.get_bulk_appliance_status(appliances=names, view="status")
+    result = await server.get_bulk_appliance_status(
+        appliances=names, view="status", budget_bytes=3000
+    )
+
+    budget = result["budget"]
+    assert budget["listKey"] == "results"
+    assert _size(result) == budget["bytes"] <= 3000
+    assert 0 < budget["returned"] == len(result["results"]) < len(names)
+    assert budget["returned"] + budget["omitted"] == len(full["results"])
+    for name, row in result["results"].items():
+        assert row == full["results"][name]
+
+    rest = await server.get_bulk_appliance_status(
+        appliances=names, view="status", budget_bytes=100000, cursor=budget["cursor"]
+    )
+    assert result["results"].keys() | rest["results"].keys() == full["results"].keys()
+
+
+@pytest.mark.anyio
+async def test_budgets_compose_with_projection_and_default_to_off():
+    """Without a budget responses are untouched; fields leave room for rows."""
+    plain = await server.get_all_appliances_lite()
+    assert "budget" not in plain
+
+    projected = await server.get_all_appliance_status(
+        fields=["name", "pingStatus"], budget_bytes=1000
+    )
+    full = await server.get_all_appliance_status(budget_bytes=1000)
+    assert projected["budget"]["returned"] > 3 * full["budget"]["returned"]
+
+    # A response without a record list is returned whole
+    status = await server.get_vd_status(budget_bytes=100)
+    assert status["budget"]["overBudget"] and status["budget"]["listKey"] is None
+    assert {k: v for k, v in status.items() if k != "budget"} == (
+        await server.get_vd_status()
+    )
+
+
+@pytest.mark.anyio
+async def test_invalid_budgets_and_cursors_are_rejected():
+    """Budgets must be positive; cursors only work for the tool issuing them."""
+    for kwargs in [
+        {"budget_bytes": 0},
+        {"budget_tokens": -5},
+        {"cursor": "not-a-cursor"},
+        {"cursor": encode_cursor("filter_paginate_alarm", "0" * 16, 3)},
+    ]:
+        with pytest.raises(BudgetError):
+            await server.get_all_appliance_status(**kwargs)
+
+
+@pytest.mark.anyio
+async def test_cursors_only_continue_the_same_call():
+    """A cursor should be rejected when the call's arguments change."""
+    page = await server.get_all_appliance_status(fields=["name"], budget_bytes=500)
+    cursor = page["budget"]["cursor"]
+    assert await server.get_all_appliance_status(
+        fields=["name"], budget_bytes=500, cursor=cursor
+    )
+    for kwargs in [{"fields": ["name", "pingStatus"]}, {"limit": "10"}]:
+        with pytest.raises(BudgetError, match="other arguments"):
+            await server.get_all_appliance_status(
+                **{"fields": ["name"], **kwargs}, cursor=cursor
+            )
+
+
+@pytest.mark.anyio
+async def test_every_tool_takes_a_budget():
+    """Each tool's schema should carry the budget params and budget object."""
+    for tool in await server.mcp.list_tools():
+        params = tool.parameters["properties"]
+        assert {"budget_bytes", "budget_tokens", "cursor"} <= set(params), tool.name
+        assert tool.output_schema is not None, tool.name
+        assert "budget" in tool.output_schema["properties"], tool.name
+        assert "ctx" not in params
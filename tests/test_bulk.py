@@ -0,0 +1,96 @@
+"""
+Tests for Bulk Appliance Status
+
+Runs the bulk tool over the mock backend and verifies name resolution,
+the per-device error map and the concurrency limit.
+"""
+
+import json
+
+import anyio
+import pytest
+from versa_mcp import server
+from versa_mcp.backend import open_backend
+from versa_mcp.bulk import MAX_APPLIANCES, BulkRequestError
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+
+def _lite_appliances():
+    with open(MOCKS_DIR / "appliance/get_all_appliances_lite.json") as f:
+        return json.load(f)["appliances"]
+
+
+class ConcurrencyBackend(MockAsyncClient):
+    """Mock backend tracking how many GETs are in flight at once."""
+
+    def __init__(self, delay=0.02, fail=()):
+        super().__init__(verify=False)
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, headers=None, params=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await anyio.sleep(self.delay)
+            if any(url.endswith(f"/{uuid}/brief") for uuid in self.fail):
+                raise ConnectionError("connection reset")
+            return await super().get(url, headers=headers, params=params)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.anyio
+async def test_bulk_status_by_uuid_and_name():
+    """UUIDs and names should both resolve; unknown devices go to errors."""
+    appliances = _lite_appliances()
+    requested = [a["uuid"] for a in appliances[:3]] + [appliances[3]["name"]]
+    requested += ["not-an-appliance", requested[0]]
+
+    result = await server.get_bulk_appliance_status(appliances=requested)
+
+    assert result["requested"] == 5
+    assert list(result["results"]) == requested[:4]
+    assert result["results"][appliances[3]["name"]]["status"]
+    assert result["failed"] == 1
+    assert result["errors"]["not-an-appliance"].startswith("404:")
+
+
+@pytest.mark.anyio
+async def test_bulk_status_respects_concurrency():
+    """At most concurrency device requests should be in flight at once."""
+    uuids = [a["uuid"] for a in _lite_appliances()]
+    backend = ConcurrencyBackend(fail=uuids[:2])
+    async with open_backend(backend):
+        result = await server.get_bulk_appliance_status(
+            appliances=uuids, view="brief", concurrency=5
+        )
+
+    assert backend.max_in_flight == 5
+    assert result["succeeded"] == len(uuids) - 2
+    assert result["errors"] == {
+        uuid: "ConnectionError: connection reset" for uuid in uuids[:2]
+    }
+
+
+@pytest.mark.anyio
+async def test_bulk_views_and_limits():
+    """Each view should call its endpoint; bad requests should be rejected."""
+    uuid = _lite_appliances()[0]["uuid"]
+    for view in ("status", "brief", "single"):
+        result = await server.get_bulk_appliance_status(appliances=[uuid], view=view)
+        assert result["results"][uuid]["uuid"] == uuid
+
+    for kwargs in [
+        {"view": "full"},
+        {"concurrency": 0},
+        {"concurrency": 1000},
+    ]:
+        with pytest.raises(BulkRequestError):
+            await server.get_bulk_appliance_status(appliances=[uuid], **kwargs)
+    too_many = [f"appliance-{i}" for i in range(MAX_APPLIANCES + 1)]
+    with pytest.raises(BulkRequestError):
+        await server.get_bulk_appliance_status(appliances=too_many)
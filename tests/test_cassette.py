@@ -0,0 +1,133 @@
+"""
+Tests for Record and Replay Cassettes
+
+Records traffic through the mock client (and, when httpx is installed, a
+stand-in HTTP server), then verifies replay by normalized request key,
+original timing, and that a cassette directory also works as a corpus.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from versa_mcp.mocks.cassette import (
+    CASSETTE_FILE,
+    Cassette,
+    CassetteClient,
+    CassetteRecorder,
+    request_key,
+)
+from versa_mcp.mocks.corpus import MockCorpus
+from versa_mcp.mocks.fault_profile import FaultProfile
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+BASE_URL = "https://mock-director.local"
+LITE = "/vnms/appliance/appliance/lite"
+
+
+def test_request_key_normalizes_params():
+    """Param order, empty params, host and trailing slash should not matter."""
+    a = request_key("get", f"{BASE_URL}{LITE}/", {"offset": "0", "limit": 5})
+    b = request_key("GET", f"http://other{LITE}?limit=5", {"offset": 0, "org": ""})
+    assert a == b == f"GET {LITE}?limit=5&offset=0"
+
+
+async def _record(path, profile=None):
+    async with CassetteRecorder(MockAsyncClient(profile=profile), path) as client:
+        await client.get(f"{BASE_URL}{LITE}", params={"limit": "2"})
+        await client.get(f"{BASE_URL}{LITE}", params={"limit": "2", "offset": "2"})
+        await client.get(f"{BASE_URL}{LITE}")
+        await client.get(f"{BASE_URL}/vnms/appliance/not-a-name/routing-instances")
+
+
+@pytest.mark.anyio
+async def test_replay_serves_param_specific_variants(tmp_path):
+    """Each recorded page should replay for its own params only."""
+    await _record(tmp_path)
+    assert len(Cassette(tmp_path)) == 4
+
+    async with CassetteClient(tmp_path, speed=0) as client:
+        first = await client.get(f"{BASE_URL}{LITE}", params={"limit": "2"})
+        second = await client.get(
+            f"{BASE_URL}{LITE}", params={"offset": "2", "limit": "2"}
+        )
+        missing = await client.get(f"{BASE_URL}{LITE}", params={"limit": "3"})
+        not_found = await client.get(
+            f"{BASE_URL}/vnms/appliance/not-a-name/routing-instances"
+        )
+
+    assert [a["name"] for a in first.json()["appliances"]] != [
+        a["name"] for a in second.json()["appliances"]
+    ]
+    assert second.json()["offset"] == 2
+    assert missing.status_code == 500
+    assert missing.json()["status"] == "NOT_RECORDED"
+    assert not_found.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_replay_keeps_recorded_latency(tmp_path):
+    """Replays should take as long as the recorded calls, scaled by speed."""
+    profile = FaultProfile(
+        {"default": {"latency": {"distribution": "fixed", "ms": 50}}}
+    )
+    await _record(tmp_path, profile)
+    for line in (tmp_path / CASSETTE_FILE).read_text().splitlines():
+        assert json.loads(line)["latency_ms"] >= 50
+
+    async with CassetteClient(tmp_path) as client:
+        start = time.perf_counter()
+        await client.get(f"{BASE_URL}{LITE}")
+        assert time.perf_counter() - start >= 0.05
+
+
+@pytest.mark.anyio
+async def test_cassette_directory_works_as_corpus(tmp_path):
+    """The unparameterized recording should become the endpoint's mock file."""
+    await _record(tmp_path)
+    assert (tmp_path / "appliance/get_all_appliances_lite.json").exists()
+    corpus = MockCorpus(tmp_path)
+
+    async with MockAsyncClient(corpus=corpus) as client:
+        response = await client.get(f"{BASE_URL}{LITE}")
+    assert response.status_code == 200
+    assert response.json()["totalCount"] == len(response.json()["appliances"])
+    assert len(response.json()["appliances"]) > 2
+
+
+@pytest.fixture
+def director_stub():
+    """Stand-in HTTP server answering every GET with its path and query."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"path": self.path, "totalCount": 0}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.anyio
+async def test_records_real_http_traffic(tmp_path, director_stub):
+    """Recording through httpx against an HTTP server should replay the same body."""
+    httpx = pytest.importorskip("httpx")
+    async with CassetteRecorder(httpx.AsyncClient(), tmp_path) as client:
+        live = await client.get(f"{director_stub}{LITE}", params={"limit": "1"})
+
+    async with CassetteClient(tmp_path, speed=0) as client:
+        replayed = await client.get(f"{BASE_URL}{LITE}", params={"limit": "1"})
+    assert replayed.status_code == live.status_code
+    assert replayed.json() == live.json()
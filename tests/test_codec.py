@@ -0,0 +1,247 @@
+"""
+Tests for the Fast Response Codec
+
+Checks the msgspec structs against the pydantic path over the mock corpus
+and drifted copies of it, field for field, and verifies the validation
+backend's use of the codec and the fallback without msgspec.
+"""
+
+import json
+
+import pytest
+from versa_mcp import codec, server
+from versa_mcp.backend import BackendConfigError, create_backend, open_backend
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+from versa_mcp.response_cache import ResponseCache
+from versa_mcp.schemas import AllApplianceStatusResponse, ApplianceStatusItem
+from versa_mcp.validation import (
+    ENDPOINT_MODELS,
+    ResponseValidationError,
+    ValidatingBackend,
+)
+
+DELETE = object()
+# Replacement values for a leaf: wrong types, null, missing, and the
+# leaf's JSON text as a string
+MUTATIONS = ([], {}, None, DELETE, json.dumps)
+LEAVES_PER_BODY = 25
+
+
+def _mock_bytes(pattern):
+    return (MOCKS_DIR / ENDPOINT_TO_MOCK[pattern]).read_bytes()
+
+
+def _pydantic_path(raw, model):
+    """The reference: parse, validate and dump with the pydantic model."""
+    try:
+        dumped = model.model_validate_json(raw).model_dump_json(
+            by_alias=True, exclude_unset=True
+        )
+    except ValueError:
+        return "rejected"
+    return json.loads(dumped)
+
+
+def _codec_path(raw, model):
+    try:
+        return json.loads(codec.encode(codec.decode(raw, model)))
+    except codec.CodecError:
+        return "rejected"
+
+
+def _leaves(value, path=()):
+    """Paths to the scalar leaves of a JSON value."""
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        yield path
+        return
+    for key, item in items:
+        yield from _leaves(item, (*path, key))
+
+
+def _mutated(body, path, mutation):
+    body = json.loads(json.dumps(body))
+    parent = body
+    for key in path[:-1]:
+        parent = parent[key]
+    if mutation is DELETE:
+        del parent[path[-1]]
+    elif callable(mutation):
+        parent[path[-1]] = mutation(parent[path[-1]])
+    else:
+        parent[path[-1]] = mutation
+    return body
+
+
+def test_corpus_decodes_field_for_field():
+    """Every mock body should encode back to the pydantic path's JSON."""
+    pytest.importorskip("msgspec")
+    for pattern, model in ENDPOINT_MODELS.items():
+        raw = _mock_bytes(pattern)
+        assert _codec_path(raw, model) == _pydantic_path(raw, model), pattern
+
+
+def test_drifted_bodies_are_handled_alike():
+    """Both paths should accept, coerce or reject the same drifted bodies."""
+    pytest.importorskip("msgspec")
+    checked = 0
+    for pattern, model in ENDPOINT_MODELS.items():
+        body = json.loads(_mock_bytes(pattern))
+        for path in list(_leaves(body))[:LEAVES_PER_BODY]:
+            if not path:
+                continue
+            for mutation in MUTATIONS:
+                raw = json.dumps(_mutated(body, path, mutation)).encode()
+                expected = _pydantic_path(raw, model)
+                assert _codec_path(raw, model) == expected, (pattern, path, mutation)
+                checked += expected == "rejected"
+    assert checked > 1000
+
+
+def test_parse_checks_like_decode_and_keeps_the_body():
+    """parse should return json.loads's body, rejecting what decode rejects."""
+    pytest.importorskip("msgspec")
+    for pattern, model in ENDPOINT_MODELS.items():
+        raw = _mock_bytes(pattern)
+        assert codec.parse(raw, model) == json.loads(raw), pattern
+        body = json.loads(raw)
+        for path in list(_leaves(body))[:LEAVES_PER_BODY]:
+            if not path:
+                continue
+            for mutation in MUTATIONS:
+                raw = json.dumps(_mutated(body, path, mutation)).encode()
+                rejected = _codec_path(raw, model) == "rejected"
+                try:
+                    codec.parse(raw, model)
+                except codec.CodecError:
+                    assert rejected, (pattern, path, mutation)
+                else:
+                    assert not rejected, (pattern, path, mutation)
+
+
+def test_structs_mirror_the_models():
+    """Structs should take the models' field names and aliases."""
+    msgspec = pytest.importorskip("msgspec")
+    struct = codec.struct_type(ApplianceStatusItem)
+    assert struct is codec.struct_type(ApplianceStatusItem)
+    assert struct.__struct_fields__ == tuple(ApplianceStatusItem.model_fields)
+    assert struct.__struct_encode_fields__[3] == "pingStatus"
+
+    raw = _mock_bytes("/nextgen/appliance/status")
+    status = codec.decode(raw, AllApplianceStatusResponse)
+    model = AllApplianceStatusResponse.model_validate_json(raw)
+    assert status.appliances[0].ping_status == model.appliances[0].ping_status
+    assert status.total_count == model.total_count
+
+    # The nav tree nests its own node type; leaves have no children set
+    tree = codec.decode(
+        _mock_bytes("/vnms/dashboard/navTree"),
+        ENDPOINT_MODELS["/vnms/dashboard/navTree"],
+    )
+    leaf = tree.root.children[0]
+    assert type(leaf) is type(tree.root) is codec.structs.NavTreeNode
+    assert leaf.children is msgspec.UNSET and leaf.uuid == "dc-east-001"
+
+
+def test_codec_is_stricter_at_the_edges():
+    """Booleans as numbers and "yes" as a boolean are pydantic-only."""
+    pytest.importorskip("msgspec")
+    pattern = "/vnms/dashboard/enableMonitoring"
+    body = json.loads(_mock_bytes(pattern))
+    model = ENDPOINT_MODELS[pattern]
+    for drift in [{"pollIntervalSeconds": True}, {"enabled": "yes"}]:
+        raw = json.dumps({**body, **drift}).encode()
+        assert _pydantic_path(raw, model) != "rejected"
+        assert _codec_path(raw, model) == "rejected"
+
+
+@pytest.mark.anyio
+async def test_backend_validates_with_the_codec(monkeypatch):
+    """RESPONSE_CODEC=msgspec should validate from bytes, and catch drift."""
+    pytest.importorskip("msgspec")
+    monkeypatch.setenv("RESPONSE_VALIDATION", "full")
+    monkeypatch.setenv("RESPONSE_CODEC", "msgspec")
+    backend = create_backend("true")
+    assert isinstance(backend, ValidatingBackend) and backend.fast
+
+    async with open_backend(backend):
+        status = await server.get_all_appliance_status()
+        assert await server.get_alarm_types()
+    assert "softwareVersion" in status["appliances"][0]
+    assert backend.stats() == {"validated": 2, "failed": 0}
+
+    class DriftedBackend(MockAsyncClient):
+        async def get(self, url, headers=None, params=None):
+            return MockResponse({"appliances": [{"name": 1}], "totalCount": 1})
+
+    class BytesResponse:
+        """A client response holding only bytes, as httpx's does."""
+
+        status_code = 200
+
+        def __init__(self, content):
+            self.content = content
+
+        def json(self):
+            raise AssertionError("the body should come from one parse of the bytes")
+
+    class BytesOnlyBackend(MockAsyncClient):
+        async def get(self, url, headers=None, params=None):
+            response = await super().get(url, headers=headers, params=params)
+            return BytesResponse(response.content)
+
+    parsed_once = ValidatingBackend(BytesOnlyBackend(verify=False), fast=True)
+    async with open_backend(parsed_once):
+        assert await server.get_all_appliance_status() == status
+
+    drifted = ValidatingBackend(DriftedBackend(verify=False), fast=True)
+    async with open_backend(drifted):
+        with pytest.raises(ResponseValidationError, match=r"\$.appliances\[0\]"):
+            await server.get_all_appliance_status()
+
+    monkeypatch.setenv("RESPONSE_CODEC", "orjson")
+    with pytest.raises(BackendConfigError):
+        create_backend("true")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_codec_keeps_the_cache_marker():
+    """Over the cache, both codecs should return the same stale hit."""
+    pytest.importorskip("msgspec")
+    hits = []
+    for fast in (False, True):
+        now = [0.0]
+        cache = ResponseCache(MockAsyncClient(verify=False), clock=lambda: now[0])
+        async with open_backend(ValidatingBackend(cache, fast=fast)):
+            await server.get_vd_status()
+            now[0] = 100.0
+            hits.append(await server.get_vd_status())
+    assert hits[0]["cacheInfo"] == {"ageSeconds": 100.0, "stale": True}
+    assert hits[1] == hits[0]
+
+
+def test_falls_back_to_pydantic_without_msgspec(monkeypatch):
+    """Without msgspec the codec should use the models, and say so."""
+    monkeypatch.setattr(codec, "msgspec", None)
+    assert not codec.available()
+
+    raw = _mock_bytes("/nextgen/appliance/status")
+    status = codec.decode(raw, AllApplianceStatusResponse)
+    assert isinstance(status, AllApplianceStatusResponse)
+    assert json.loads(codec.encode(status)) == _pydantic_path(
+        raw, AllApplianceStatusResponse
+    )
+    assert codec.parse(raw, AllApplianceStatusResponse) == json.loads(raw)
+    for bad in [b'{"appliances": 3}', b"{"]:
+        with pytest.raises(codec.CodecError):
+            codec.decode(bad, AllApplianceStatusResponse)
+        with pytest.raises(codec.CodecError):
+            codec.parse(bad, AllApplianceStatusResponse)
+    with pytest.raises(BackendConfigError):
+        ValidatingBackend(MockAsyncClient(verify=False), fast=True)
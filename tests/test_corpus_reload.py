@@ -0,0 +1,171 @@
+"""
+Tests for Mock Corpus hot reload
+
+Verifies that refresh() re-reads only changed files, swaps entries without
+mutating ones already handed out, keeps the old entry for a half-written
+file, and that registry sets are rebuilt only for changed sources.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+
+import pytest
+from versa_mcp.mocks.corpus import MOCKS_DIR, MockCorpus
+from versa_mcp.mocks.id_registry import (
+    REGISTRY_SOURCES,
+    _build_registry,
+    update_registry,
+)
+from versa_mcp.mocks.watcher import CorpusWatcher
+
+TYPES_FILE = "alarm/get_alarm_types.json"
+TEMPLATES_FILE = "workflow/template_fetch_all.json"
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    """Copy of the registry sources plus one unrelated file."""
+    root = tmp_path / "mocks"
+    for relative_path in (*REGISTRY_SOURCES, TYPES_FILE):
+        (root / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(MOCKS_DIR / relative_path, root / relative_path)
+    return root
+
+
+def _rewrite(path, data):
+    """Write new content and move the mtime forward so the change is seen."""
+    stat = path.stat()
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _add_template(root, name):
+    path = root / TEMPLATES_FILE
+    data = json.loads(path.read_text())
+    data["templates"].append({"templateName": name})
+    _rewrite(path, data)
+
+
+def test_refresh_without_changes_reads_nothing(corpus_dir):
+    """An unchanged tree should not be re-read."""
+    corpus = MockCorpus(corpus_dir)
+    assert corpus.refresh() == frozenset()
+    assert corpus.stats()["reloads"] == 0
+
+
+def test_refresh_swaps_only_changed_files(corpus_dir):
+    """Edited files get new entries; old entries stay untouched."""
+    corpus = MockCorpus(corpus_dir)
+    old_templates = corpus.entry(TEMPLATES_FILE)
+    old_types = corpus.entry(TYPES_FILE)
+
+    _add_template(corpus_dir, "Live-Template")
+    assert corpus.refresh() == {TEMPLATES_FILE}
+
+    new_templates = corpus.entry(TEMPLATES_FILE)
+    assert new_templates is not None and old_templates is not None
+    assert new_templates is not old_templates
+    assert corpus.entry(TYPES_FILE) is old_types
+    assert new_templates.data["templates"][-1]["templateName"] == "Live-Template"
+    # A request still holding the old entry sees the old document
+    assert all(
+        t["templateName"] != "Live-Template" for t in old_templates.data["templates"]
+    )
+    assert corpus.stats()["reloads"] == 1
+
+
+def test_refresh_keeps_old_entry_for_half_written_file(corpus_dir):
+    """A file that does not parse keeps serving its last good version."""
+    corpus = MockCorpus(corpus_dir)
+    old_types = corpus.entry(TYPES_FILE)
+
+    path = corpus_dir / TYPES_FILE
+    stat = path.stat()
+    path.write_text('{"types": [')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert corpus.refresh() == frozenset()
+    assert corpus.entry(TYPES_FILE) is old_types
+
+    _rewrite(path, {"types": []})
+    assert corpus.refresh() == {TYPES_FILE}
+    assert corpus.get(TYPES_FILE) == {"types": []}
+
+
+def test_refresh_tracks_added_and_removed_files(corpus_dir):
+    """New files become servable and deleted files disappear."""
+    corpus = MockCorpus(corpus_dir)
+    (corpus_dir / "alarm/new_file.json").write_text('{"ok": true}')
+    (corpus_dir / TYPES_FILE).unlink()
+
+    assert corpus.refresh() == {"alarm/new_file.json", TYPES_FILE}
+    assert corpus.get("alarm/new_file.json") == {"ok": True}
+    assert TYPES_FILE not in corpus
+    assert corpus.get(TYPES_FILE) is None
+
+
+def test_lazy_refresh_reports_but_does_not_read_unloaded_files(corpus_dir):
+    """In lazy mode, changed files that were never loaded stay unloaded."""
+    corpus = MockCorpus(corpus_dir, lazy=True)
+    _add_template(corpus_dir, "Live-Template")
+
+    assert corpus.refresh() == {TEMPLATES_FILE}
+    assert corpus.stats()["files_loaded"] == 0
+
+
+def test_update_registry_rebuilds_only_affected_sets(corpus_dir):
+    """Only the sets built from a changed source should be replaced."""
+    corpus = MockCorpus(corpus_dir)
+    registry = _build_registry(corpus)
+
+    _add_template(corpus_dir, "Live-Template")
+    changed = corpus.refresh()
+    updated = update_registry(registry, changed, corpus)
+
+    assert "Live-Template" in updated["template_names"]
+    assert "Live-Template" not in registry["template_names"]
+    assert updated["appliance_names"] is registry["appliance_names"]
+    assert updated["device_group_names"] is registry["device_group_names"]
+
+
+def test_watcher_picks_up_edits(corpus_dir):
+    """A running watcher should refresh the corpus on its own."""
+    corpus = MockCorpus(corpus_dir)
+    changes = []
+    corpus.subscribe(changes.append)
+    watcher = CorpusWatcher(corpus, interval=0.01).start()
+    try:
+        _add_template(corpus_dir, "Live-Template")
+        deadline = time.monotonic() + 5
+        while not changes and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert changes == [{TEMPLATES_FILE}]
+
+
+def test_watcher_logs_failed_polls_and_keeps_polling(corpus_dir, caplog):
+    """A failing poll should be logged, not end the watcher."""
+    corpus = MockCorpus(corpus_dir)
+    polls = []
+
+    def refresh():
+        polls.append(1)
+        raise OSError("disk gone")
+
+    corpus.refresh = refresh
+    with caplog.at_level(logging.ERROR, logger="versa_mcp.mocks.watcher"):
+        watcher = CorpusWatcher(corpus, interval=0.01).start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(polls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+    assert len(polls) >= 2
+    assert "Mock corpus refresh failed" in caplog.text
+    assert "disk gone" in caplog.text
@@ -0,0 +1,208 @@
+"""
+Tests for the Director HTTP Client
+
+Runs DirectorClient against a stand-in Director serving the mock corpus and
+verifies keep-alive reuse across tools, pool limits, per-endpoint timeouts,
+OAuth token refresh and DIRECTOR_* configuration.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import anyio
+import pytest
+from versa_mcp import server
+from versa_mcp.backend import BackendConfigError, open_backend
+from versa_mcp.director_client import ENDPOINT_TIMEOUTS, DirectorClient
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+
+ALARM_TYPES = "/vnms/fault/types"
+SLOW_PATH = "/vnms/fault/alarms/page"
+
+
+class StandInDirector(ThreadingHTTPServer):
+    """HTTP/1.1 server answering from the mock corpus and counting connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.mock = MockAsyncClient()
+        self.delays: dict[str, float] = {}
+        self.connections = 0
+        # OAuth: tokens issued and still accepted, when auth is required
+        self.require_auth = False
+        self.tokens: set[str] = set()
+        self.token_requests = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInDirector
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        time.sleep(self.server.delays.get(url.path, 0))
+        authorization = self.headers.get("Authorization", "")
+        if self.server.require_auth and (
+            authorization.removeprefix("Bearer ") not in self.server.tokens
+        ):
+            self._reply({"error": "invalid token"}, 401)
+            return
+        data, status, raw = self.server.mock._load_mock(
+            url.path, dict(parse_qsl(url.query))
+        )
+        self._reply(data, status, raw)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        grant = json.loads(self.rfile.read(length))
+        time.sleep(0.05)
+        self.server.token_requests += 1
+        token = f"token-{self.server.token_requests}"
+        self.server.tokens.add(token)
+        assert grant["username"] == "admin"
+        self._reply({"access_token": token, "expires_in": 3600})
+
+    def _reply(self, data, status=200, raw=None):
+        body = MockResponse(data, status_code=status, raw=raw).content
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def director():
+    pytest.importorskip("httpx")
+    stand_in = StandInDirector()
+    thread = threading.Thread(target=stand_in.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+
+def _url(stand_in) -> str:
+    return f"http://127.0.0.1:{stand_in.server_address[1]}"
+
+
+@pytest.mark.anyio
+async def test_tools_reuse_one_connection(director):
+    """Sequential tool calls should share one kept-alive connection."""
+    client = DirectorClient(_url(director))
+    async with open_backend(client):
+        status = await server.get_all_appliance_status(limit="2")
+        await server.get_alarm_types()
+        await server.get_vd_status()
+        await server.get_sys_uptime()
+        await server.get_director_alarm_summary()
+
+    assert len(status["appliances"]) == 2
+    assert client.stats()["requests"] == 5
+    assert client.stats()["connections"] == 1
+    assert director.connections == 1
+
+
+@pytest.mark.anyio
+async def test_pool_limits_concurrent_connections(director):
+    """Concurrent calls should queue for the pool rather than open more."""
+    director.delays = {ALARM_TYPES: 0.05}
+    statuses = []
+    async with DirectorClient(_url(director), max_connections=2) as client:
+
+        async def call():
+            response = await client.get(f"https://mock-director.local{ALARM_TYPES}")
+            statuses.append(response.status_code)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(10):
+                tg.start_soon(call)
+
+    assert statuses == [200] * 10
+    assert director.connections == 2
+
+
+@pytest.mark.anyio
+async def test_endpoint_timeouts(director):
+    """A slow endpoint should time out on its own limit, not the default."""
+    httpx = pytest.importorskip("httpx")
+    director.delays = {ALARM_TYPES: 0.3, SLOW_PATH: 0.3}
+    async with DirectorClient(
+        _url(director), endpoint_timeouts={ALARM_TYPES: 0.05}
+    ) as client:
+        assert client.timeout_for(SLOW_PATH).read == ENDPOINT_TIMEOUTS[SLOW_PATH]
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get(ALARM_TYPES)
+        assert (await client.get(SLOW_PATH)).status_code == 200
+
+
+@pytest.mark.anyio
+async def test_revoked_token_is_refreshed_once(director):
+    """Concurrent calls hitting 401 together should share one token refresh."""
+    director.require_auth = True
+    credentials = {"username": "admin", "password": "secret"}
+    async with DirectorClient(_url(director), credentials=credentials) as client:
+        assert (await client.get(ALARM_TYPES)).status_code == 200
+        director.tokens.clear()
+
+        statuses = []
+
+        async def call():
+            statuses.append((await client.get(ALARM_TYPES)).status_code)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(100):
+                tg.start_soon(call)
+
+    assert statuses == [200] * 100
+    assert director.token_requests == 2
+    assert client.stats()["token_refreshes"] == 2
+
+
+@pytest.mark.anyio
+async def test_caller_extensions_are_merged(director):
+    """A caller's extensions, trace included, should be kept alongside ours."""
+    events = []
+
+    async def trace(event_name, info):
+        events.append(event_name)
+
+    async with DirectorClient(_url(director)) as client:
+        response = await client.get(ALARM_TYPES, extensions={"trace": trace})
+
+    assert response.status_code == 200
+    assert "connection.connect_tcp.complete" in events
+    assert client.stats()["connections"] == 1
+
+
+def test_invalid_settings_are_rejected(monkeypatch):
+    """Bad DIRECTOR_* values should fail before any connection is made."""
+    monkeypatch.delenv("DIRECTOR_URL", raising=False)
+    with pytest.raises(BackendConfigError):
+        DirectorClient.from_env()
+
+    monkeypatch.setenv("DIRECTOR_URL", "https://director.example.com")
+    for name, value in [
+        ("DIRECTOR_MAX_CONNECTIONS", "0"),
+        ("DIRECTOR_TIMEOUT", "soon"),
+        ("DIRECTOR_TIMEOUTS", "[1, 2]"),
+        ("DIRECTOR_VERIFY_TLS", "/does/not/exist.pem"),
+        ("DIRECTOR_USERNAME", "admin"),
+    ]:
+        with monkeypatch.context() as m:
+            m.setenv(name, value)
+            with pytest.raises(BackendConfigError):
+                DirectorClient.from_env()
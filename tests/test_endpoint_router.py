@@ -0,0 +1,77 @@
+"""
+Tests for the compiled endpoint Router
+
+Verifies that every mapped pattern resolves with its path params, that
+literal segments win over parameters, and that unknown paths do not match.
+"""
+
+import re
+
+import pytest
+from versa_mcp.mocks.endpoint_map import (
+    ENDPOINT_TO_MOCK,
+    Router,
+    match_endpoint,
+    normalize_endpoint,
+)
+
+
+@pytest.mark.parametrize("pattern", list(ENDPOINT_TO_MOCK))
+def test_every_pattern_resolves_to_itself(pattern):
+    """A concrete path built from each pattern should resolve back to it."""
+    names = re.findall(r"\{([^}]+)\}", pattern)
+    path = re.sub(r"\{[^}]+\}", "value-1", pattern)
+
+    route = match_endpoint(path)
+
+    assert route is not None
+    assert route.pattern == pattern
+    assert route.params == {name: "value-1" for name in names}
+
+
+def test_literal_segment_wins_over_parameter():
+    """Static routes should not be captured by a sibling {param} route."""
+    location = match_endpoint("/vnms/dashboard/appliance/location")
+    model_numbers = match_endpoint("/nextgen/deviceGroup/modelNumbers")
+
+    assert location is not None
+    assert location.pattern == "/vnms/dashboard/appliance/location"
+    assert model_numbers is not None
+    assert model_numbers.pattern == "/nextgen/deviceGroup/modelNumbers"
+
+
+def test_parameter_names_come_from_matched_pattern():
+    """Sibling patterns with differently named params should each bind their own."""
+    hardware = match_endpoint("/vnms/dashboard/appliance/dc-east-001/hardware")
+    live = match_endpoint("/vnms/dashboard/appliance/DC-East-Primary/live")
+
+    assert hardware is not None
+    assert hardware.params == {"Uuid": "dc-east-001"}
+    assert live is not None
+    assert live.params == {"applianceName": "DC-East-Primary"}
+
+
+def test_backtracks_from_literal_branch():
+    """A literal prefix that dead-ends should fall back to the param branch."""
+    router = Router(["/a/static/x", "/a/{id}/y"])
+
+    route = router.match("/a/static/y")
+
+    assert route is not None
+    assert route.pattern == "/a/{id}/y"
+    assert route.params == {"id": "static"}
+
+
+def test_unmatched_and_empty_segments():
+    """Unknown paths and empty parameter segments should not match."""
+    assert match_endpoint("/vnms/does/not/exist") is None
+    assert match_endpoint("/nextgen/appliance/status/") is None
+    assert normalize_endpoint("/vnms/does/not/exist", "") == "/vnms/does/not/exist"
+
+
+def test_normalize_endpoint_strips_base_url():
+    """normalize_endpoint should keep its original contract."""
+    base = "https://mock-director.local"
+    assert normalize_endpoint(f"{base}/nextgen/deviceGroup/DC-Controllers", base) == (
+        "/nextgen/deviceGroup/{deviceGroupName}"
+    )
@@ -0,0 +1,145 @@
+"""
+Tests for Mock Latency and Fault Profiles
+
+Verifies latency distributions, error and burst injection, client timeouts,
+and that injected latency does not block concurrent requests.
+"""
+
+import statistics
+import time
+
+import anyio
+import pytest
+from versa_mcp.mocks.fault_profile import (
+    PROFILES,
+    FaultProfile,
+    FaultProfileError,
+    MockTimeoutError,
+)
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+BASE_URL = "https://mock-director.local"
+ALARM_PAGE = "/vnms/fault/alarms/page"
+
+
+def test_lognormal_latency_matches_median_and_p99():
+    """Sampled latencies should follow the configured median and p99."""
+    profile = FaultProfile(
+        {
+            "seed": 1,
+            "default": {
+                "latency": {
+                    "distribution": "lognormal",
+                    "median_ms": 200,
+                    "p99_ms": 2000,
+                }
+            },
+        }
+    )
+    samples = sorted(profile.sample(None).latency_s for _ in range(20000))
+
+    assert statistics.median(samples) == pytest.approx(0.2, rel=0.05)
+    assert samples[int(len(samples) * 0.99)] == pytest.approx(2.0, rel=0.1)
+
+
+def test_endpoint_settings_override_default():
+    """A pattern with its own settings should not use the default."""
+    profile = FaultProfile(
+        {
+            "default": {"latency": {"distribution": "fixed", "ms": 5}},
+            "endpoints": {
+                ALARM_PAGE: {"latency": {"distribution": "fixed", "ms": 700}}
+            },
+        }
+    )
+    assert profile.sample(ALARM_PAGE).latency_s == 0.7
+    assert profile.sample("/vnms/other").latency_s == 0.005
+
+
+def test_error_and_timeout_rates():
+    """Errors and timeouts should be injected at their configured rates."""
+    profile = FaultProfile(
+        {"seed": 7, "default": {"error_rate": 0.1, "timeout_rate": 0.05}}
+    )
+    for _ in range(20000):
+        profile.sample(None)
+    stats = profile.stats()
+
+    assert stats["errors"] / stats["requests"] == pytest.approx(0.1, abs=0.01)
+    assert stats["timeouts"] / stats["requests"] == pytest.approx(0.05, abs=0.01)
+
+
+def test_bursts_follow_the_clock():
+    """Every request inside a burst window should fail with the burst status."""
+    now = [0.0]
+    profile = FaultProfile(
+        {"default": {"burst": {"every_s": 60, "duration_s": 5, "status": 502}}},
+        clock=lambda: now[0],
+    )
+    assert profile.sample(None).status == 502
+    now[0] = 30
+    assert profile.sample(None).status is None
+    now[0] = 122
+    assert profile.sample(None).status == 502
+
+
+def test_invalid_profiles_are_rejected():
+    """Malformed settings should fail at load, not mid-run."""
+    for config in [
+        {"default": {"latency": {"distribution": "gamma"}}},
+        {"default": {"error_rate": -1}},
+        {"default": {"error_rate": 0.8, "timeout_rate": 0.5}},
+        {"default": {"error_status": 200}},
+    ]:
+        with pytest.raises(FaultProfileError):
+            FaultProfile(config)
+    with pytest.raises(FaultProfileError):
+        FaultProfile.load("/does/not/exist.json")
+    assert FaultProfile.load("director").endpoints.keys() == set(
+        PROFILES["director"]["endpoints"]
+    )
+
+
+@pytest.mark.anyio
+async def test_client_serves_injected_errors():
+    """An injected error should replace the mock body with a 5xx."""
+    profile = FaultProfile({"default": {"error_rate": 1, "error_status": 503}})
+    async with MockAsyncClient(profile=profile) as client:
+        response = await client.get(f"{BASE_URL}/vnms/alarm/types")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "SERVICE_UNAVAILABLE"
+
+
+@pytest.mark.anyio
+async def test_client_times_out_slow_calls():
+    """Latency beyond the client timeout should raise MockTimeoutError."""
+    profile = FaultProfile(
+        {"default": {"latency": {"distribution": "fixed", "ms": 500}}}
+    )
+    async with MockAsyncClient(profile=profile, timeout=0.01) as client:
+        with pytest.raises(MockTimeoutError):
+            await client.get(f"{BASE_URL}{ALARM_PAGE}")
+
+
+@pytest.mark.anyio
+async def test_latency_does_not_block_concurrent_requests():
+    """Twenty 100 ms calls in parallel should take about 100 ms, not 2 s."""
+    profile = FaultProfile(
+        {"default": {"latency": {"distribution": "fixed", "ms": 100}}}
+    )
+    statuses = []
+
+    async def call(client):
+        response = await client.get(f"{BASE_URL}{ALARM_PAGE}")
+        statuses.append(response.status_code)
+
+    start = time.perf_counter()
+    async with MockAsyncClient(profile=profile) as client:
+        async with anyio.create_task_group() as tg:
+            for _ in range(20):
+                tg.start_soon(call, client)
+    elapsed = time.perf_counter() - start
+
+    assert statuses == [200] * 20
+    assert elapsed < 1.0
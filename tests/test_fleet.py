@@ -0,0 +1,147 @@
+"""
+Tests for the Fleet Snapshot
+
+Runs the snapshot tool over the mock corpus and checks the join against
+the raw mock files, the filters, and degradation when a source fails.
+"""
+
+import json
+
+import anyio
+import pytest
+from versa_mcp import pager, server
+from versa_mcp.backend import open_backend
+from versa_mcp.fleet import (
+    LOCATIONS_PATH,
+    STATUS_PATH,
+    FleetSnapshotError,
+    fleet_snapshot,
+)
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+
+
+def _mock(path):
+    with open(MOCKS_DIR / path) as f:
+        return json.load(f)
+
+
+class FailingBackend(MockAsyncClient):
+    """Mock backend failing one path and counting GETs."""
+
+    def __init__(self, failing_path):
+        super().__init__(verify=False)
+        self.failing_path = failing_path
+        self.calls = 0
+
+    async def get(self, url, headers=None, params=None):
+        self.calls += 1
+        await anyio.sleep(0)
+        if url.endswith(self.failing_path):
+            return MockResponse({"error": "unavailable"}, status_code=503)
+        return await super().get(url, headers=headers, params=params)
+
+
+class NoSeverityBackend(MockAsyncClient):
+    """Mock backend serving alarms with their severity removed."""
+
+    async def get(self, url, headers=None, params=None):
+        response = await super().get(url, headers=headers, params=params)
+        if url.endswith("/vnms/fault/alarms/page"):
+            body = response.json()
+            alarms = [{**a, "severity": None} for a in body["alarms"]]
+            return MockResponse({**body, "alarms": alarms})
+        return response
+
+
+@pytest.mark.anyio
+async def test_snapshot_joins_every_source():
+    """Each row should carry its status, site, alarm counts and sync state."""
+    snapshot = await server.get_fleet_snapshot()
+
+    status = _mock("appliance/get_all_appliance_status.json")["appliances"]
+    alarms = _mock("alarm/filter_paginate_alarm.json")["alarms"]
+    assert snapshot["fleetSize"] == snapshot["totalCount"] == len(status)
+    assert snapshot["errors"] == {}
+    rows = {row["uuid"]: row for row in snapshot["devices"]}
+    assert all(row["site"] and row["lastSync"] for row in rows.values())
+
+    counted = sum(sum(row["alarms"].values()) for row in rows.values())
+    assert counted == sum(1 for a in alarms if a["deviceUuid"] in rows)
+    for alarm in alarms:
+        if alarm["severity"] == "CRITICAL" and alarm["deviceUuid"] in rows:
+            assert rows[alarm["deviceUuid"]]["highestSeverity"] == "CRITICAL"
+
+
+@pytest.mark.anyio
+async def test_down_devices_with_critical_alarms():
+    """Filters should select what the agent would have joined by hand."""
+    status = _mock("appliance/get_all_appliance_status.json")["appliances"]
+    alarms = _mock("alarm/filter_paginate_alarm.json")["alarms"]
+    critical = {a["deviceUuid"] for a in alarms if a["severity"] == "CRITICAL"}
+    expected = [
+        a["uuid"]
+        for a in status
+        if a["pingStatus"] != "REACHABLE" and a["uuid"] in critical
+    ]
+
+    backend = FailingBackend("/not-failing")
+    async with open_backend(backend):
+        snapshot = await server.get_fleet_snapshot(
+            org="GlobalRetail", down_only=True, min_severity="critical"
+        )
+
+    assert [row["uuid"] for row in snapshot["devices"]] == expected
+    # Three fleet-wide calls plus one sync call per selected device
+    assert backend.calls == 3 + len(expected)
+
+
+@pytest.mark.anyio
+async def test_failed_sources_degrade_the_snapshot():
+    """A failed optional source should be reported; no status list is fatal."""
+    async with open_backend(FailingBackend(LOCATIONS_PATH)):
+        snapshot = await server.get_fleet_snapshot(include_sync=False)
+        assert snapshot["errors"]["locations"].endswith("returned 503")
+        assert all(row["site"] is None for row in snapshot["devices"])
+        assert all(row["lastSync"] is None for row in snapshot["devices"])
+
+    async with open_backend(FailingBackend(STATUS_PATH)):
+        with pytest.raises(FleetSnapshotError):
+            await server.get_fleet_snapshot()
+    with pytest.raises(FleetSnapshotError):
+        await server.get_fleet_snapshot(min_severity="SEVERE")
+
+
+@pytest.mark.anyio
+async def test_status_list_is_paged(monkeypatch):
+    """Every page of the status list should be joined, not only the first."""
+    monkeypatch.setattr(pager, "DEFAULT_PAGE_SIZE", 20)
+    status = _mock("appliance/get_all_appliance_status.json")["appliances"]
+
+    snapshot = await server.get_fleet_snapshot(include_sync=False)
+
+    assert snapshot["fleetSize"] == len(status) > 20
+    assert [row["uuid"] for row in snapshot["devices"]] == [a["uuid"] for a in status]
+    assert snapshot["statusTruncated"] is False
+
+
+@pytest.mark.anyio
+async def test_alarms_without_severity_count_as_unknown():
+    """Alarms lacking a severity should be counted, under UNKNOWN."""
+    async with open_backend(NoSeverityBackend(verify=False)):
+        snapshot = await server.get_fleet_snapshot(include_sync=False)
+    counts = [row["alarms"] for row in snapshot["devices"] if row["alarms"]]
+    assert counts and all(list(c) == ["UNKNOWN"] for c in counts)
+    assert all(row["highestSeverity"] is None for row in snapshot["devices"])
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("concurrency", [0, -1, 65])
+async def test_concurrency_is_bounded(concurrency):
+    """Concurrency outside 1..64 should be rejected, as for bulk status."""
+    with pytest.raises(FleetSnapshotError):
+        await fleet_snapshot(
+            MockAsyncClient(verify=False),
+            server.MOCK_DIRECTOR_URL,
+            concurrency=concurrency,
+        )
@@ -0,0 +1,80 @@
+"""
+Tests for the Synthetic Fleet Generator
+
+Verifies that generated corpora are deterministic, referentially consistent
+with the ID registry, and validate against the tool response models.
+"""
+
+import inspect
+
+import pytest
+import versa_mcp.server as server
+from versa_mcp.mocks.corpus import MockCorpus
+from versa_mcp.mocks.generator import FleetGenerator
+from versa_mcp.mocks.id_registry import _build_registry
+
+APPLIANCES = 300
+
+
+@pytest.fixture(scope="module")
+def fleet_dir(tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp("fleet")
+    FleetGenerator(appliances=APPLIANCES, seed=3, alarms=500).write(output_dir)
+    return output_dir
+
+
+@pytest.fixture(scope="module")
+def fleet(fleet_dir):
+    return MockCorpus(fleet_dir)
+
+
+def test_same_seed_is_deterministic():
+    """Two builds with one seed should be identical; another seed differs."""
+    first = FleetGenerator(appliances=120, seed=5).build()
+    second = FleetGenerator(appliances=120, seed=5).build()
+    other = FleetGenerator(appliances=120, seed=6).build()
+
+    assert first == second
+    assert first != other
+
+
+def test_counts_match_request(fleet):
+    lite = fleet.get("appliance/get_all_appliances_lite.json")
+    alarms = fleet.get("alarm/filter_paginate_alarm.json")
+
+    assert lite["totalCount"] == len(lite["appliances"]) == APPLIANCES
+    assert alarms["totalCount"] == len(alarms["alarms"])
+    assert fleet.get("appliance/get_appliances_summary.json")["totalAppliances"] == (
+        APPLIANCES
+    )
+
+
+def test_too_small_fleet_is_rejected():
+    with pytest.raises(ValueError):
+        FleetGenerator(appliances=1)
+
+
+def test_references_resolve_in_registry(fleet):
+    """Every generated reference should be a registered ID."""
+    registry = _build_registry(fleet)
+
+    assert len(registry["appliance_uuids"]) == APPLIANCES
+    for group in fleet.get("device_group/device_group_fetch_all.json")["deviceGroups"]:
+        for device in group["devices"]:
+            assert device["uuid"] in registry["appliance_uuids"]
+    for alarm in fleet.get("alarm/filter_paginate_alarm.json")["alarms"]:
+        assert alarm["deviceName"] in registry["appliance_names"]
+        assert alarm["org"] in registry["org_names"]
+    for log in fleet.get("audit/get_audit_logs.json")["logs"]:
+        if log["targetType"] == "DEVICE":
+            assert log["targetId"] in registry["appliance_uuids"]
+    assert "Enterprise-Branch-Gold" in registry["template_names"]
+    assert "DC-Controllers" in registry["device_group_names"]
+
+
+def test_every_file_validates_against_its_model(fleet):
+    """Each mock file should validate against the return model of its tool."""
+    for relative_path in sorted(fleet.entries):
+        tool = getattr(server, relative_path.rsplit("/", 1)[-1][: -len(".json")])
+        model = inspect.signature(tool).return_annotation
+        model.model_validate(fleet.get(relative_path))
@@ -0,0 +1,162 @@
+"""
+Tests for the lazy, snapshot-cached ID Registry
+
+Verifies that importing the server does not build the registry, and that
+snapshots are reused while their source files are unchanged and rebuilt
+once they change.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from versa_mcp.mocks.corpus import MOCKS_DIR, MockCorpus
+from versa_mcp.mocks.id_registry import (
+    REGISTRY_SOURCES,
+    _build_registry,
+    default_snapshot_path,
+    load_registry,
+    load_snapshot,
+)
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    """Copy of just the registry source files."""
+    root = tmp_path / "mocks"
+    for relative_path in REGISTRY_SOURCES:
+        (root / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(MOCKS_DIR / relative_path, root / relative_path)
+    return root
+
+
+def _marker_snapshot(path):
+    """Add a marker name to a snapshot so reuse is observable."""
+    snapshot = json.loads(path.read_text())
+    snapshot["registry"]["appliance_names"].append("from-snapshot")
+    path.write_text(json.dumps(snapshot))
+
+
+def test_import_does_not_build_registry():
+    """Importing the server should leave both corpus and registry unloaded."""
+    code = (
+        "import versa_mcp.server\n"
+        "from versa_mcp.mocks import corpus, id_registry\n"
+        "print(corpus._corpus is None, id_registry._registry is None)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["True", "True"]
+
+
+def test_cold_load_writes_snapshot(corpus_dir, tmp_path):
+    """A cold load should build the registry and persist it."""
+    snapshot_path = tmp_path / "cache" / "registry.json"
+    corpus = MockCorpus(corpus_dir, lazy=True)
+
+    registry = load_registry(corpus, snapshot_path)
+
+    assert registry == _build_registry(corpus)
+    assert snapshot_path.exists()
+    assert load_snapshot(snapshot_path, corpus) == registry
+
+
+def test_warm_load_uses_snapshot_without_parsing(corpus_dir, tmp_path):
+    """A current snapshot should be used without reading any mock file."""
+    snapshot_path = tmp_path / "registry.json"
+    load_registry(MockCorpus(corpus_dir, lazy=True), snapshot_path)
+    _marker_snapshot(snapshot_path)
+
+    corpus = MockCorpus(corpus_dir, lazy=True)
+    registry = load_registry(corpus, snapshot_path)
+
+    assert "from-snapshot" in registry["appliance_names"]
+    assert corpus.stats()["files_loaded"] == 0
+
+
+def test_touched_but_unchanged_source_keeps_snapshot(corpus_dir, tmp_path):
+    """A new mtime with identical content should still match by hash."""
+    snapshot_path = tmp_path / "registry.json"
+    load_registry(MockCorpus(corpus_dir, lazy=True), snapshot_path)
+    _marker_snapshot(snapshot_path)
+
+    source = corpus_dir / REGISTRY_SOURCES[0]
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    registry = load_registry(MockCorpus(corpus_dir, lazy=True), snapshot_path)
+    assert "from-snapshot" in registry["appliance_names"]
+
+
+def test_changed_source_rebuilds_snapshot(corpus_dir, tmp_path):
+    """Editing a source file should invalidate the snapshot."""
+    snapshot_path = tmp_path / "registry.json"
+    load_registry(MockCorpus(corpus_dir, lazy=True), snapshot_path)
+    _marker_snapshot(snapshot_path)
+
+    source = corpus_dir / "workflow/template_fetch_all.json"
+    data = json.loads(source.read_text())
+    data["templates"].append({"templateName": "Added-Template"})
+    source.write_text(json.dumps(data))
+
+    corpus = MockCorpus(corpus_dir, lazy=True)
+    registry = load_registry(corpus, snapshot_path)
+    assert "from-snapshot" not in registry["appliance_names"]
+    assert "Added-Template" in registry["template_names"]
+    snapshot = load_snapshot(snapshot_path, corpus)
+    assert snapshot is not None
+    assert "Added-Template" in snapshot["template_names"]
+
+
+def test_corrupt_snapshot_is_rebuilt(corpus_dir, tmp_path):
+    """An unreadable snapshot should be ignored and overwritten."""
+    snapshot_path = tmp_path / "registry.json"
+    snapshot_path.write_text("{not json")
+    corpus = MockCorpus(corpus_dir, lazy=True)
+
+    assert load_registry(corpus, snapshot_path) == _build_registry(corpus)
+    assert load_snapshot(snapshot_path, corpus) is not None
+
+
+def test_snapshots_are_opt_in(monkeypatch, tmp_path):
+    """Without MOCK_REGISTRY_SNAPSHOT nothing should be written anywhere."""
+    monkeypatch.delenv("MOCK_REGISTRY_SNAPSHOT", raising=False)
+    assert default_snapshot_path(tmp_path) is None
+
+    monkeypatch.setenv("MOCK_REGISTRY_SNAPSHOT", "true")
+    path = default_snapshot_path(tmp_path)
+    assert path is not None
+    assert path.parent == Path(tempfile.gettempdir()) / "versa-mcp"
+
+
+def test_warm_start_does_not_create_corpus(corpus_dir, tmp_path):
+    """A warm get_registry should neither create nor preload the eager corpus."""
+    code = (
+        "from versa_mcp.mocks import corpus, id_registry\n"
+        "registry = id_registry.get_registry()\n"
+        "print(corpus._corpus is None, 'from-snapshot' in registry['appliance_names'])\n"
+    )
+    snapshot_path = tmp_path / "registry.json"
+    load_registry(MockCorpus(corpus_dir, lazy=True), snapshot_path)
+    _marker_snapshot(snapshot_path)
+    env = {
+        **os.environ,
+        "MOCK_CORPUS_DIR": str(corpus_dir),
+        "MOCK_REGISTRY_SNAPSHOT": str(snapshot_path),
+    }
+    env.pop("MOCK_CORPUS_LAZY", None)
+    env.pop("MOCK_CORPUS_PACK", None)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    assert result.stdout.split() == ["True", "True"]
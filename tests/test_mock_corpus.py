@@ -0,0 +1,61 @@
+"""
+Tests for the in-memory Mock Corpus
+
+Verifies eager and lazy loading, stats counters, and that MockAsyncClient
+serves data from the shared corpus instead of disk.
+"""
+
+import pytest
+from versa_mcp.mocks.corpus import MOCKS_DIR, MockCorpus, get_corpus
+from versa_mcp.mocks.mock_client import MockAsyncClient
+
+
+def test_eager_corpus_loads_every_file():
+    """Eager mode should hold every JSON file after construction."""
+    corpus = MockCorpus()
+    stats = corpus.stats()
+
+    assert stats["files_loaded"] == stats["files_known"]
+    assert stats["files_known"] == len(list(MOCKS_DIR.rglob("*.json")))
+    assert stats["bytes_loaded"] > 0
+
+
+def test_lazy_corpus_loads_on_first_access():
+    """Lazy mode should defer each file until it is requested."""
+    corpus = MockCorpus(lazy=True)
+    assert corpus.stats()["files_loaded"] == 0
+
+    data = corpus.get("alarm/get_alarm_types.json")
+    assert "types" in data
+    assert corpus.stats()["files_loaded"] == 1
+    assert corpus.stats()["misses"] == 1
+
+    assert corpus.get("alarm/get_alarm_types.json") is data
+    assert corpus.stats()["hits"] == 1
+
+
+def test_unknown_file_returns_none():
+    """Files outside the corpus should return None, not raise."""
+    corpus = MockCorpus(lazy=True)
+    assert corpus.get("alarm/does_not_exist.json") is None
+    assert "alarm/does_not_exist.json" not in corpus
+
+
+def test_entries_mapping_is_read_only():
+    """The exposed entries mapping should reject writes."""
+    corpus = MockCorpus()
+    with pytest.raises(TypeError):
+        corpus.entries["x.json"] = None  # type: ignore[index]
+
+
+@pytest.mark.anyio
+async def test_client_serves_shared_corpus_objects():
+    """Repeated GETs should return the same decoded object from memory."""
+    url = "https://mock-director.local/vnms/fault/types"
+
+    async with MockAsyncClient() as client:
+        first = (await client.get(url)).json()
+        second = (await client.get(url)).json()
+
+    assert first is second
+    assert first is get_corpus().get("alarm/get_alarm_types.json")
@@ -0,0 +1,99 @@
+"""
+Tests for Mock Pagination
+
+Verifies that MockAsyncClient slices list payloads by limit/offset and sets
+totalCount/offset/limit/hasMore, leaving unpaged requests untouched.
+"""
+
+import pytest
+from versa_mcp.mocks.corpus import get_corpus
+from versa_mcp.mocks.mock_client import MockAsyncClient
+from versa_mcp.mocks.pagination import find_list_key, paginate
+
+STATUS_URL = "https://mock-director.local/nextgen/appliance/status"
+
+
+@pytest.mark.anyio
+async def test_limit_and_offset_slice_the_list():
+    """A page should hold limit items starting at offset."""
+    full = get_corpus().get("appliance/get_all_appliance_status.json")
+
+    async with MockAsyncClient() as client:
+        response = await client.get(STATUS_URL, params={"limit": "10", "offset": "5"})
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["appliances"] == full["appliances"][5:15]
+    assert data["totalCount"] == len(full["appliances"])
+    assert data["offset"] == 5
+    assert data["limit"] == 10
+    assert data["hasMore"] is True
+
+
+@pytest.mark.anyio
+async def test_last_page_has_no_more():
+    """The final page should report hasMore false."""
+    total = len(
+        get_corpus().get("appliance/get_all_appliance_status.json")["appliances"]
+    )
+
+    async with MockAsyncClient() as client:
+        response = await client.get(
+            STATUS_URL, params={"limit": "50", "offset": str(total - 3)}
+        )
+
+    data = response.json()
+    assert len(data["appliances"]) == 3
+    assert data["hasMore"] is False
+
+
+@pytest.mark.anyio
+async def test_offset_past_end_returns_empty_page():
+    """Offsets beyond the list should return an empty final page."""
+    async with MockAsyncClient() as client:
+        response = await client.get(STATUS_URL, params={"offset": "10000"})
+
+    data = response.json()
+    assert data["appliances"] == []
+    assert data["hasMore"] is False
+
+
+@pytest.mark.anyio
+async def test_unpaged_request_shares_corpus_object():
+    """Without limit/offset the corpus object and bytes should be served as-is."""
+    entry = get_corpus().entry("appliance/get_all_appliance_status.json")
+
+    async with MockAsyncClient() as client:
+        response = await client.get(STATUS_URL, params={})
+
+    assert entry is not None
+    assert response.json() is entry.data
+    assert response.content is entry.raw
+
+
+@pytest.mark.anyio
+async def test_invalid_limit_returns_400():
+    """Non-integer limits should be rejected like the Director does."""
+    async with MockAsyncClient() as client:
+        response = await client.get(STATUS_URL, params={"limit": "ten"})
+
+    assert response.status_code == 400
+    assert "limit" in response.json()["error"]
+
+
+def test_paging_does_not_mutate_source():
+    """Slicing should build a new envelope and leave the source intact."""
+    source = {"totalCount": 3, "items": [1, 2, 3]}
+
+    page = paginate(source, {"limit": "1"})
+
+    assert page["items"] == [1]
+    assert source == {"totalCount": 3, "items": [1, 2, 3]}
+
+
+def test_non_list_payloads_are_not_pageable():
+    """Objects without totalCount or with several lists are left alone."""
+    assert find_list_key({"uuid": "x", "templates": []}) is None
+    assert find_list_key({"totalCount": 1, "a": [], "b": []}) is None
+    single = {"uuid": "x"}
+    assert paginate(single, {"limit": "1"}) is single
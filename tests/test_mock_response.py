@@ -0,0 +1,65 @@
+"""
+Tests for MockResponse body handling
+
+Verifies that .text/.content are computed lazily and cached, and that corpus
+responses carry the original file bytes.
+"""
+
+import json
+
+import pytest
+from versa_mcp.mocks.corpus import get_corpus
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+
+
+def test_body_not_serialized_until_read():
+    """Constructing a response should not serialize the body."""
+    response = MockResponse({"a": 1})
+
+    assert "text" not in response.__dict__
+    assert "content" not in response.__dict__
+    assert response.json() == {"a": 1}
+    assert "content" not in response.__dict__
+
+
+def test_text_and_content_are_cached():
+    """The body should be serialized once and reused."""
+    response = MockResponse({"a": [1, 2]})
+
+    assert json.loads(response.text) == {"a": [1, 2]}
+    assert response.content is response.content
+    assert response.text is response.text
+
+
+def test_raw_bytes_are_served_verbatim():
+    """A raw body should be returned as-is without re-encoding."""
+    raw = b'{"a": 1}'
+    response = MockResponse({"a": 1}, raw=raw)
+
+    assert response.content is raw
+    assert response.text == '{"a": 1}'
+
+
+@pytest.mark.anyio
+async def test_client_carries_corpus_bytes():
+    """Successful mock GETs should carry the corpus file bytes."""
+    url = "https://mock-director.local/vnms/fault/types"
+
+    async with MockAsyncClient() as client:
+        response = await client.get(url)
+
+    entry = get_corpus().entry("alarm/get_alarm_types.json")
+    assert entry is not None
+    assert response.content is entry.raw
+
+
+@pytest.mark.anyio
+async def test_error_responses_serialize_their_payload():
+    """404 bodies are built per call and serialized from the dict."""
+    url = "https://mock-director.local/nextgen/deviceGroup/UnknownGroup"
+
+    async with MockAsyncClient() as client:
+        response = await client.get(url)
+
+    assert response.status_code == 404
+    assert json.loads(response.text) == response.json()
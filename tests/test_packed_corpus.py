@@ -0,0 +1,73 @@
+"""
+Tests for the Packed Mock Corpus
+
+Verifies that a pack file round-trips every mock document, that paged reads
+decode only the requested records, and that MockAsyncClient can serve it.
+"""
+
+import pytest
+from versa_mcp.mocks.corpus import MockCorpus
+from versa_mcp.mocks.mock_client import MockAsyncClient
+from versa_mcp.mocks.packed import PackedCorpus, PackedCorpusError, pack_corpus
+
+STATUS_FILE = "appliance/get_all_appliance_status.json"
+
+
+@pytest.fixture(scope="module")
+def pack_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pack") / "corpus.pack"
+    pack_corpus(MockCorpus().root, path)
+    return path
+
+
+def test_every_document_round_trips(pack_path):
+    """Decoded packed documents should equal the JSON files."""
+    source = MockCorpus()
+    packed = PackedCorpus(pack_path)
+
+    assert packed.stats()["files_known"] == source.stats()["files_known"]
+    for relative_path in source.entries:
+        assert packed.get(relative_path) == source.get(relative_path)
+
+
+def test_paged_read_decodes_only_requested_records(pack_path):
+    """records() should decode the page without the rest of the document."""
+    packed = PackedCorpus(pack_path)
+    entry = packed.entry(STATUS_FILE)
+    expected = MockCorpus().get(STATUS_FILE)["appliances"]
+
+    assert entry is not None
+    assert entry.count == len(expected)
+    assert entry.records(10, 13) == expected[10:13]
+    assert entry.envelope()["totalCount"] == len(expected)
+
+    stats = packed.stats()
+    assert stats["records_decoded"] == 3
+    assert stats["documents_decoded"] == 0
+
+
+def test_not_a_pack_file(tmp_path):
+    bogus = tmp_path / "bogus.pack"
+    bogus.write_bytes(b"not a pack file at all, just some bytes")
+
+    with pytest.raises(PackedCorpusError):
+        PackedCorpus(bogus)
+    with pytest.raises(PackedCorpusError):
+        PackedCorpus(tmp_path / "missing.pack")
+
+
+@pytest.mark.anyio
+async def test_client_serves_pages_from_pack(pack_path):
+    """A paged GET against a packed corpus should touch only its records."""
+    packed = PackedCorpus(pack_path)
+    url = "https://mock-director.local/nextgen/appliance/status"
+
+    async with MockAsyncClient(corpus=packed) as client:
+        response = await client.get(url, params={"limit": "5", "offset": "2"})
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["appliances"] == MockCorpus().get(STATUS_FILE)["appliances"][2:7]
+    assert data["hasMore"] is True
+    assert packed.stats()["records_decoded"] == 5
+    assert packed.stats()["documents_decoded"] == 0
@@ -0,0 +1,152 @@
+"""
+Tests for Auto-Pagination
+
+Walks the paged mock endpoints with the pager and verifies prefetching,
+the record and byte caps, progress reporting and failed pages.
+"""
+
+import json
+
+import anyio
+import pytest
+from versa_mcp import server
+from versa_mcp.backend import open_backend
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+from versa_mcp.pager import PagerError, iter_pages, prefetching
+
+BASE_URL = "https://mock-director.local"
+LITE = f"{BASE_URL}/vnms/appliance/appliance/lite"
+
+
+@pytest.fixture
+def anyio_backend():
+    # Stopping at a cap cancels the prefetch, and anyio 4 needs
+    # trio >= 0.23 for that
+    return "asyncio"
+
+
+def _lite_appliances():
+    with open(MOCKS_DIR / "appliance/get_all_appliances_lite.json") as f:
+        return json.load(f)["appliances"]
+
+
+class PagedBackend(MockAsyncClient):
+    """Mock backend recording offsets, optionally slow or failing at one."""
+
+    def __init__(self, delay=0.0, fail_at=None):
+        super().__init__(verify=False)
+        self.delay = delay
+        self.fail_at = fail_at
+        self.offsets = []
+
+    async def get(self, url, headers=None, params=None):
+        offset = int((params or {}).get("offset", 0))
+        self.offsets.append(offset)
+        await anyio.sleep(self.delay)
+        if offset == self.fail_at:
+            return MockResponse({"error": "unavailable"}, status_code=503)
+        return await super().get(url, headers=headers, params=params)
+
+
+class RecordingContext:
+    """Stands in for the MCP Context, recording progress notifications."""
+
+    def __init__(self):
+        self.progress = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.progress.append((progress, total, message))
+
+
+@pytest.mark.anyio
+async def test_next_page_is_fetched_while_the_current_one_is_handled():
+    """The pager should stay exactly one page ahead of its consumer."""
+    backend = PagedBackend(delay=0.02)
+    handled = []
+    async with prefetching(iter_pages(backend, LITE, "appliances", None, 20)) as pages:
+        async for page in pages:
+            await anyio.sleep(0.05)
+            handled.append(page.offset)
+            assert len(backend.offsets) == min(len(handled) + 1, 4)
+
+    assert handled == backend.offsets == [0, 20, 40, 60]
+
+
+@pytest.mark.anyio
+async def test_fetch_all_walks_every_page_with_progress():
+    """All records should arrive in order, with progress after each page."""
+    ctx = RecordingContext()
+    result = await server.fetch_all_pages(
+        source="appliances_lite", page_size=20, ctx=ctx
+    )
+
+    appliances = _lite_appliances()
+    assert result["records"] == appliances
+    assert result["totalCount"] == result["fetched"] == len(appliances)
+    assert (result["pages"], result["truncated"]) == (4, False)
+    assert result["stopReason"] == "complete"
+    assert [p[0] for p in ctx.progress] == [20, 40, 60, len(appliances)]
+    assert (
+        ctx.progress[-1][2] == f"{len(appliances)} of {len(appliances)} appliances_lite"
+    )
+
+    alarms = await server.fetch_all_pages(
+        source="alarms", params={"org": "GlobalRetail"}, page_size=5
+    )
+    assert alarms["fetched"] == alarms["totalCount"] > 5
+    assert {a["org"] for a in alarms["records"]} == {"GlobalRetail"}
+
+    logs = await server.fetch_all_pages(source="audit_logs", page_size=2)
+    assert (logs["fetched"], logs["pages"]) == (5, 3)
+
+    data = await server.fetch_all_pages(
+        source="next_page_data", params={"queryId": "query-12345"}
+    )
+    assert (data["fetched"], data["pages"], data["truncated"]) == (0, 1, False)
+
+
+@pytest.mark.anyio
+async def test_caps_stop_the_walk_early():
+    """Reaching a cap should stop paging, without fetching further pages."""
+    backend = PagedBackend(delay=0.01)
+    async with open_backend(backend):
+        result = await server.fetch_all_pages(
+            source="appliances_lite", page_size=20, max_records=30
+        )
+    assert (result["fetched"], result["pages"]) == (30, 2)
+    assert result["stopReason"] == "max_records"
+    assert result["records"] == _lite_appliances()[:30]
+    # The page after the cap may have been prefetched, but no more
+    assert backend.offsets in ([0, 20], [0, 20, 40])
+
+    sizes = [len(json.dumps(a, separators=(",", ":"))) for a in _lite_appliances()]
+    result = await server.fetch_all_pages(
+        source="appliances_lite", page_size=20, max_bytes=sum(sizes[:25]) + 1
+    )
+    assert (result["fetched"], result["bytes"]) == (25, sum(sizes[:25]))
+    assert result["truncated"] and result["stopReason"] == "max_bytes"
+
+    # Landing on the cap with nothing left is not truncation
+    result = await server.fetch_all_pages(
+        source="appliances_lite", max_records=len(sizes)
+    )
+    assert result["fetched"] == len(sizes) and not result["truncated"]
+
+
+@pytest.mark.anyio
+async def test_invalid_requests_and_failed_pages():
+    """Bad requests should be rejected; a failed page should fail the call."""
+    for kwargs in [
+        {"source": "events"},
+        {"source": "alarms", "params": {"limit": "10"}},
+        {"source": "next_page_data"},
+        {"source": "alarms", "page_size": 0},
+        {"source": "alarms", "max_records": 10**9},
+    ]:
+        with pytest.raises(PagerError):
+            await server.fetch_all_pages(**kwargs)
+
+    async with open_backend(PagedBackend(fail_at=40)):
+        with pytest.raises(PagerError, match="returned 503 at offset 40"):
+            await server.fetch_all_pages(source="appliances_lite", page_size=20)
@@ -0,0 +1,74 @@
+"""
+Tests for Field Projection
+
+Calls the list tools with fields and verifies the projected records, the
+rejected field names and the tools' schemas.
+"""
+
+import json
+
+import pytest
+from versa_mcp import server
+from versa_mcp.projection import ProjectionError, project
+
+
+@pytest.mark.anyio
+async def test_list_tools_return_only_requested_fields():
+    """Records should keep just the requested keys; the envelope is kept."""
+    full = await server.get_all_appliance_status()
+    projected = await server.get_all_appliance_status(
+        fields=["name", "pingStatus", "name"]
+    )
+
+    assert projected["totalCount"] == full["totalCount"]
+    assert projected["appliances"] == [
+        {"name": a["name"], "pingStatus": a["pingStatus"]} for a in full["appliances"]
+    ]
+    assert len(json.dumps(projected)) < len(json.dumps(full)) / 4
+
+    # The shared mock body must not be modified by projection
+    again = await server.get_all_appliance_status()
+    assert again == full and "uuid" in again["appliances"][0]
+
+    locations = await server.get_appliance_locations(fields=["site"])
+    assert {tuple(row) for row in locations["locations"]} == {("site",)}
+    alarms = await server.filter_paginate_alarm(fields=["deviceName", "severity"])
+    assert set(alarms["alarms"][0]) == {"deviceName", "severity"}
+
+
+@pytest.mark.anyio
+async def test_unknown_or_empty_fields_are_rejected():
+    """Typos should fail loudly rather than return empty records."""
+    with pytest.raises(ProjectionError, match="pingstatus"):
+        await server.get_all_appliance_status(fields=["name", "pingstatus"])
+    with pytest.raises(ProjectionError):
+        await server.get_all_appliances_lite(fields=[])
+    # Snake-case model names are not the Director's field names
+    with pytest.raises(ProjectionError):
+        await server.get_all_appliance_status(fields=["ping_status"])
+
+    error = {"error": "not found", "status": "NOT_FOUND"}
+    assert project(error, "appliances", ["name"]) is error
+
+
+@pytest.mark.anyio
+async def test_fetch_all_pages_counts_projected_bytes():
+    """The pager's byte cap should apply to the projected records."""
+    result = await server.fetch_all_pages(
+        source="appliances_lite", page_size=20, fields=["name"]
+    )
+    names = [{"name": a["name"]} for a in result["records"]]
+    assert result["records"] == names and result["fetched"] == 69
+    assert result["bytes"] == sum(
+        len(json.dumps(n, separators=(",", ":"))) for n in names
+    )
+
+
+@pytest.mark.anyio
+async def test_schemas_allow_projected_records():
+    """fields should be an input; projected rows must not be required."""
+    tool = await server.mcp.get_tool("get_all_appliances_basic_details")
+    assert tool is not None and tool.output_schema is not None
+    assert "fields" in tool.parameters["properties"]
+    row = tool.output_schema["$defs"]["BasicApplianceItem"]
+    assert "required" not in row and "name" in row["properties"]
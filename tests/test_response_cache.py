@@ -0,0 +1,241 @@
+"""
+Tests for the Response Cache
+
+Runs ResponseCache over a counting mock backend with a fake clock and
+verifies per-endpoint TTLs, normalized keys, LRU bounds, counters and
+stale-while-revalidate for dashboard endpoints, including with the server
+lifespan.
+"""
+
+import time
+from typing import Optional
+
+import anyio
+import pytest
+from fastmcp import Client
+from versa_mcp import server
+from versa_mcp.backend import BackendConfigError, create_backend, open_backend
+from versa_mcp.mocks.mock_client import MockAsyncClient
+from versa_mcp.response_cache import (
+    DASHBOARD_MAX_STALE,
+    DEFAULT_TTL,
+    NEAR_STATIC_TTL,
+    ResponseCache,
+)
+
+BASE_URL = "https://mock-director.local"
+STATUS = f"{BASE_URL}/nextgen/appliance/status"
+
+
+@pytest.fixture
+def anyio_backend():
+    # Closing the cache cancels its revalidations, and anyio 4 needs
+    # trio >= 0.23 for that
+    return "asyncio"
+
+
+class CountingBackend(MockAsyncClient):
+    """Mock backend counting the GETs that reach it, optionally slow or failing."""
+
+    def __init__(self, delay=0.0):
+        super().__init__(verify=False)
+        self.delay = delay
+        self.error: Optional[Exception] = None
+        self.calls = 0
+
+    async def get(self, url, headers=None, params=None):
+        self.calls += 1
+        await anyio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return await super().get(url, headers=headers, params=params)
+
+
+def _cache(delay=0.0, **kwargs):
+    now = [0.0]
+    backend = CountingBackend(delay)
+    cache = ResponseCache(backend, clock=lambda: now[0], **kwargs)
+    return cache, backend, now
+
+
+@pytest.mark.anyio
+async def test_repeated_calls_are_served_from_cache():
+    """Same endpoint and params, in any order or spelling, should hit."""
+    cache, backend, _ = _cache()
+    first = await cache.get(STATUS, params={"limit": "2", "offset": "0"})
+    again = await cache.get(f"{STATUS}/", params={"offset": "0", "limit": "2"})
+    await cache.get(STATUS, params={"limit": "2", "offset": "0", "org": ""})
+    other = await cache.get(STATUS, params={"limit": "3"})
+
+    assert again.json() == first.json()
+    assert len(other.json()["appliances"]) == 3
+    assert backend.calls == 2
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.anyio
+async def test_ttls_follow_the_endpoint():
+    """Near-static data should outlive the default TTL; volatile is not cached."""
+    cache, backend, now = _cache()
+    async with open_backend(cache):
+        await server.get_alarm_types()
+        await server.get_all_appliance_status()
+        await server.get_appliance_live_status(applianceName="NYC-Branch-001")
+        await server.get_appliance_live_status(applianceName="NYC-Branch-001")
+        assert backend.calls == 4
+
+        now[0] = DEFAULT_TTL + 1
+        await server.get_alarm_types()
+        await server.get_all_appliance_status()
+        assert backend.calls == 5
+
+        now[0] = NEAR_STATIC_TTL + 1
+        await server.get_alarm_types()
+        assert backend.calls == 6
+    assert cache.stats()["bypassed"] == 2
+
+
+@pytest.mark.anyio
+async def test_lru_bound_and_errors():
+    """The least recently used entry should go first; errors are not cached."""
+    cache, backend, _ = _cache(max_entries=2)
+    for limit in ("1", "2", "1", "3"):
+        await cache.get(STATUS, params={"limit": limit})
+    assert cache.stats()["evictions"] == 1
+    await cache.get(STATUS, params={"limit": "1"})
+    assert backend.calls == 3
+
+    missing = f"{BASE_URL}/vnms/dashboard/applianceServices/not-a-name"
+    assert (await cache.get(missing)).status_code == 404
+    await cache.get(missing)
+    assert backend.calls == 5
+
+
+@pytest.mark.anyio
+async def test_dashboard_is_served_stale_while_revalidating():
+    """An expired dashboard entry should come back at once and refresh behind."""
+    cache, backend, now = _cache(delay=0.2)
+    async with open_backend(cache):
+        first = await server.get_vd_status()
+        assert first["cacheInfo"] == {"ageSeconds": 0.0, "stale": False}
+        assert "cacheInfo" not in (await server.get_all_appliance_status())
+
+        now[0] = DEFAULT_TTL + 5
+        start = time.perf_counter()
+        stale = [await server.get_vd_status() for _ in range(10)]
+        assert time.perf_counter() - start < 0.1
+        assert stale[0]["cacheInfo"] == {"ageSeconds": DEFAULT_TTL + 5, "stale": True}
+        assert stale[0]["name"] == first["name"]
+
+        await anyio.sleep(0.3)
+        fresh = await server.get_vd_status()
+        assert fresh["cacheInfo"] == {"ageSeconds": 0.0, "stale": False}
+
+    assert backend.calls == 3
+    assert cache.stats()["stale_hits"] == 10
+    assert cache.stats()["revalidations"] == 1
+
+
+@pytest.mark.anyio
+async def test_staleness_is_bounded_and_survives_errors():
+    """A failed refresh keeps the stale entry, but only up to max staleness."""
+    cache, backend, now = _cache()
+    async with open_backend(cache):
+        await server.get_head_end_status()
+        backend.error = ConnectionError("director down")
+
+        now[0] = DEFAULT_TTL + 1
+        assert (await server.get_head_end_status())["cacheInfo"]["stale"]
+        await anyio.sleep(0.01)
+        assert cache.stats()["revalidation_errors"] == 1
+        assert (await server.get_head_end_status())["cacheInfo"]["stale"]
+
+        now[0] = DEFAULT_TTL + DASHBOARD_MAX_STALE + 1
+        with pytest.raises(ConnectionError):
+            await server.get_head_end_status()
+
+
+@pytest.mark.anyio
+async def test_closing_cancels_refreshes_in_flight():
+    """Closing the cache should cancel a slow refresh and wait for it."""
+    cache, backend, now = _cache()
+    async with open_backend(cache):
+        await server.get_vd_status()
+        backend.delay = 10.0
+        now[0] = DEFAULT_TTL + 1
+        assert (await server.get_vd_status())["cacheInfo"]["stale"]
+        await anyio.sleep(0.01)
+        start = time.perf_counter()
+    assert time.perf_counter() - start < 1.0
+    assert backend.calls == 2
+    assert cache.stats()["revalidations"] == 0
+    assert cache.stats()["revalidation_errors"] == 0
+
+
+@pytest.mark.anyio
+async def test_clearing_drops_fetches_in_flight():
+    """A refresh or miss begun before a write should not be stored after it."""
+    cache, backend, now = _cache()
+    async with open_backend(cache):
+        await server.get_vd_status()
+        backend.delay = 0.1
+        now[0] = DEFAULT_TTL + 1
+        assert (await server.get_vd_status())["cacheInfo"]["stale"]
+        await anyio.sleep(0.01)
+        cache.clear()
+        await anyio.sleep(0.2)
+        assert cache.stats()["revalidations"] == 0
+        assert cache.stats()["entries"] == 0
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(cache.get, STATUS)
+            await anyio.sleep(0.01)
+            cache.clear()
+        assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["trio"])
+async def test_without_asyncio_expired_entries_are_fetched_in_foreground():
+    """Refreshes are asyncio tasks; elsewhere an expired entry is refetched."""
+    cache, backend, now = _cache()
+    async with cache:
+        await cache.get(f"{BASE_URL}/vnms/dashboard/vdStatus")
+        now[0] = DEFAULT_TTL + 1
+        response = await cache.get(f"{BASE_URL}/vnms/dashboard/vdStatus")
+    assert response.json()["cacheInfo"] == {"ageSeconds": 0.0, "stale": False}
+    assert backend.calls == 2
+    assert cache.stats()["stale_hits"] == 0
+
+
+@pytest.mark.anyio
+async def test_server_lifespan_starts_and_stops_with_the_cache(monkeypatch):
+    """The real lifespan should open the cache, refresh through it and close."""
+    monkeypatch.setenv("RESPONSE_CACHE", "true")
+    monkeypatch.setenv("RESPONSE_CACHE_TTLS", '{"/vnms/dashboard/vdStatus": 0.01}')
+    async with Client(server.mcp) as client:
+        assert await client.list_tools()
+        cache = server.get_backend()
+        assert isinstance(cache, ResponseCache)
+        await server.get_vd_status()
+        await anyio.sleep(0.05)
+        assert (await server.get_vd_status())["cacheInfo"]["stale"]
+    assert cache.stats()["stale_hits"] == 1
+    assert server.get_backend() is not cache
+
+
+def test_cache_is_configured_from_env(monkeypatch):
+    """RESPONSE_CACHE should wrap the backend; bad settings should fail."""
+    monkeypatch.setenv("RESPONSE_CACHE", "true")
+    monkeypatch.setenv("RESPONSE_CACHE_SIZE", "10")
+    monkeypatch.setenv("RESPONSE_CACHE_TTLS", '{"/vnms/fault/types": 5}')
+    cache = create_backend("true")
+    assert isinstance(cache, ResponseCache)
+    assert isinstance(cache.backend, MockAsyncClient)
+    assert cache.max_entries == 10
+    assert cache.ttl_for("/vnms/fault/types") == 5
+
+    monkeypatch.setenv("RESPONSE_CACHE_TTLS", "[5]")
+    with pytest.raises(BackendConfigError):
+        create_backend("true")
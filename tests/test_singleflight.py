@@ -0,0 +1,123 @@
+"""
+Tests for Single-Flight Request Coalescing
+
+Runs CoalescingBackend over a slow counting backend and verifies that
+identical concurrent GETs share one call, and that errors and cancellation
+reach the right callers.
+"""
+
+import anyio
+import pytest
+from versa_mcp import server
+from versa_mcp.backend import create_backend, open_backend
+from versa_mcp.mocks.mock_client import MockAsyncClient
+from versa_mcp.response_cache import ResponseCache
+from versa_mcp.singleflight import CoalescingBackend
+
+BASE_URL = "https://mock-director.local"
+SUMMARY = f"{BASE_URL}/vnms/fault/alarms/summary"
+
+
+class SlowBackend(MockAsyncClient):
+    """Mock backend taking delay seconds per GET, optionally failing."""
+
+    def __init__(self, delay=0.05, error=None):
+        super().__init__(verify=False)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def get(self, url, headers=None, params=None):
+        self.calls += 1
+        await anyio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return await super().get(url, headers=headers, params=params)
+
+
+async def _gather(count, call):
+    results = []
+
+    async def run():
+        results.append(await call())
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(run)
+    return results
+
+
+@pytest.mark.anyio
+async def test_identical_calls_share_one_backend_call():
+    """Fifty sessions asking the same question should cost one call."""
+    backend = SlowBackend()
+    coalescing = CoalescingBackend(backend)
+    async with open_backend(coalescing):
+        summaries = await _gather(50, server.get_alarm_summary)
+        pages = await _gather(
+            10, lambda: server.get_all_appliance_status(limit="5", offset="0")
+        )
+        other = await server.get_all_appliance_status(limit="6")
+
+    assert all(s == summaries[0] for s in summaries)
+    assert all(p == pages[0] for p in pages)
+    assert len(other["appliances"]) == 6
+    assert backend.calls == 3
+    assert coalescing.stats() == {"calls": 3, "coalesced": 58, "in_flight": 0}
+
+
+@pytest.mark.anyio
+async def test_errors_reach_every_waiter_and_are_not_kept():
+    """A failed call should fail all its waiters; the next call retries."""
+    backend = SlowBackend(error=ConnectionError("director down"))
+    coalescing = CoalescingBackend(backend)
+    failures = []
+
+    async def call():
+        try:
+            await coalescing.get(SUMMARY)
+        except ConnectionError as e:
+            failures.append(e)
+
+    await _gather(20, call)
+    assert len(failures) == 20
+    assert backend.calls == 1
+
+    backend.error = None
+    assert (await coalescing.get(SUMMARY)).status_code == 200
+    assert backend.calls == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_waiters():
+    """Cancelling the caller making the call should leave its waiters served."""
+    backend = SlowBackend(delay=0.1)
+    coalescing = CoalescingBackend(backend)
+    statuses = []
+
+    async def call_then_cancel():
+        with anyio.move_on_after(0.02):
+            await coalescing.get(SUMMARY)
+
+    async def wait_for_summary():
+        statuses.append((await coalescing.get(SUMMARY)).status_code)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(call_then_cancel)
+        await anyio.sleep(0.01)
+        for _ in range(5):
+            tg.start_soon(wait_for_summary)
+
+    assert statuses == [200] * 5
+    assert backend.calls == 2
+    assert coalescing.stats()["in_flight"] == 0
+
+
+def test_coalescing_sits_under_the_cache(monkeypatch):
+    """COALESCE_REQUESTS should wrap the client beneath RESPONSE_CACHE."""
+    monkeypatch.setenv("COALESCE_REQUESTS", "true")
+    monkeypatch.setenv("RESPONSE_CACHE", "true")
+    backend = create_backend("true")
+    assert isinstance(backend, ResponseCache)
+    assert isinstance(backend.backend, CoalescingBackend)
+    assert isinstance(backend.backend.backend, MockAsyncClient)
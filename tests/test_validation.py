@@ -0,0 +1,114 @@
+"""
+Tests for Response Validation
+
+Validates the mock corpus against the endpoint models and verifies drift
+detection, the full and trusted modes and their placement in the backend.
+"""
+
+import inspect
+import json
+
+import pytest
+from versa_mcp import server
+from versa_mcp.backend import BackendConfigError, create_backend, open_backend
+from versa_mcp.mocks.corpus import MOCKS_DIR
+from versa_mcp.mocks.endpoint_map import ENDPOINT_TO_MOCK
+from versa_mcp.mocks.mock_client import MockAsyncClient, MockResponse
+from versa_mcp.response_cache import ResponseCache
+from versa_mcp.validation import (
+    ENDPOINT_MODELS,
+    ResponseValidationError,
+    ValidatingBackend,
+    response_adapter,
+)
+
+BASE_URL = "https://mock-director.local"
+
+
+@pytest.fixture
+def anyio_backend():
+    # Closing the response cache cancels its refresh tasks, and anyio 4
+    # needs trio >= 0.23 for that
+    return "asyncio"
+
+
+class DriftedBackend(MockAsyncClient):
+    """Mock backend whose appliance status has drifted from its model."""
+
+    async def get(self, url, headers=None, params=None):
+        response = await super().get(url, headers=headers, params=params)
+        if url.endswith("/nextgen/appliance/status"):
+            body = dict(response.json())
+            body["appliances"] = [{**body["appliances"][0], "pingStatus": 1}]
+            return MockResponse(body)
+        return response
+
+
+def test_endpoint_models_match_the_tools():
+    """Each endpoint's model should be the return model of its tool."""
+    assert set(ENDPOINT_MODELS) == set(ENDPOINT_TO_MOCK)
+    for pattern, mock_file in ENDPOINT_TO_MOCK.items():
+        tool = getattr(server, mock_file.rsplit("/", 1)[1].removesuffix(".json"))
+        returns = inspect.signature(tool.__wrapped__).return_annotation
+        assert ENDPOINT_MODELS[pattern] is returns, pattern
+
+
+def test_mock_corpus_matches_the_models():
+    """Every mock body should validate against its endpoint's model."""
+    for pattern, model in ENDPOINT_MODELS.items():
+        with open(MOCKS_DIR / ENDPOINT_TO_MOCK[pattern]) as f:
+            response_adapter(model).validate_python(json.load(f))
+    adapter = response_adapter(ENDPOINT_MODELS["/vnms/fault/alarms/page"])
+    assert response_adapter(ENDPOINT_MODELS["/vnms/fault/alarms/page"]) is adapter
+
+
+@pytest.mark.anyio
+async def test_drifted_responses_are_rejected():
+    """A body that no longer matches its model should fail the call."""
+    backend = ValidatingBackend(DriftedBackend(verify=False))
+    async with open_backend(backend):
+        with pytest.raises(ResponseValidationError, match="appliances.0.pingStatus"):
+            await server.get_all_appliance_status()
+        # Errors and unmodelled endpoints pass through unchecked
+        assert "error" in await server.get_appliance_details_by_uuid(
+            Uuid="unknown-uuid"
+        )
+        response = await backend.get(f"{BASE_URL}/vnms/does/not/exist")
+        assert response.status_code >= 400
+        assert (await server.get_alarm_types())["types"]
+
+    assert backend.stats() == {"validated": 1, "failed": 1}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("mode, validated", [("full", 3), ("trusted", 1)])
+async def test_trusted_mode_skips_cache_hits(monkeypatch, mode, validated):
+    """Full validates every call; trusted only what reaches the client."""
+    monkeypatch.setenv("RESPONSE_VALIDATION", mode)
+    monkeypatch.setenv("RESPONSE_CACHE", "true")
+    backend = create_backend("true")
+
+    if mode == "full":
+        assert isinstance(backend, ValidatingBackend)
+        assert isinstance(backend.backend, ResponseCache)
+        cache, validator = backend.backend, backend
+    else:
+        assert isinstance(backend, ResponseCache)
+        assert isinstance(backend.backend, ValidatingBackend)
+        cache, validator = backend, backend.backend
+
+    async with open_backend(backend):
+        first = await server.get_all_appliance_status()
+        for _ in range(2):
+            assert await server.get_all_appliance_status() == first
+    assert cache.stats()["hits"] == 2
+    assert validator.stats() == {"validated": validated, "failed": 0}
+
+
+def test_validation_mode_is_checked(monkeypatch):
+    """Validation is off by default; unknown modes are rejected."""
+    monkeypatch.delenv("RESPONSE_VALIDATION", raising=False)
+    assert isinstance(create_backend("true"), MockAsyncClient)
+    monkeypatch.setenv("RESPONSE_VALIDATION", "sometimes")
+    with pytest.raises(BackendConfigError):
+        create_backend("true")